@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+app.py
+
+Application context and state stack for Jet Fighter.
+
+This module defines the :class:`AppContext` class, which brings up only the
+pygame subsystems the game uses (display, font, mixer) and the window once
+per process, logging how long each took, then preloads every asset
+behind a loading screen (see :mod:`src.preloader`). It owns everything the
+screens share: the logical canvas (scaled to the window by
+:mod:`src.viewport`), the database handle, and the stack of
+:class:`src.state.State` objects. Screens are built once and switched by
+pushing and popping them, so a switch never re-creates the window or
+reloads assets; each switch is timed and logged.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, Dict, List
+
+import pygame
+
+from src.database import Database, ScoreWriter
+from src.fonts import FontManager
+from src.preloader import Preloader
+from src.settings import Audio, Screen
+from src.state import State
+from src.viewport import Viewport
+
+logger = logging.getLogger(__name__)
+
+
+class AppContext:
+    """
+    Shared resources and the state stack of the running game.
+
+    Attributes:
+        SUBSYSTEMS (tuple): Name and init function of each pygame
+            subsystem started, in order.
+        startup (dict[str, float]): Seconds spent starting each subsystem,
+            opening the window, and preloading assets.
+        screen (pygame.Surface): The logical canvas every screen draws on,
+            scaled to the window by :class:`Viewport`.
+        db (Database): Database handle shared by all screens.
+        idle_timeout (int): Idle wait of static screens, in milliseconds.
+        stack (list[State]): Active states; the last one runs.
+        switches (int): Number of state switches performed.
+        switch_seconds (float): Total time spent switching states.
+        slowest_switch (float): Longest single switch, in seconds.
+    """
+
+    SUBSYSTEMS: tuple[tuple[str, Callable[[], None]], ...] = (
+        ("display", pygame.display.init),
+        ("font", pygame.font.init),
+        ("mixer", pygame.mixer.init),
+    )
+
+    def __init__(self) -> None:
+        """Initialize pygame, the window, and the shared resources."""
+        self.startup: Dict[str, float] = self.init_subsystems()
+
+        start = time.perf_counter()
+        Viewport.open(
+            (Screen.WIDTH, Screen.HEIGHT),
+            Screen.RENDER_SCALE,
+            Screen.SCALE_FILTER == "smooth",
+        )
+        pygame.display.set_caption("Jet Fighter")
+        self.startup["window"] = time.perf_counter() - start
+
+        # Decode images and sounds in parallel behind a loading screen
+        preloader = Preloader(self.screen)
+        preloader.run()
+        self.startup["assets"] = preloader.total
+        logger.info(
+            "startup: %s (total %.1f ms)",
+            ", ".join(f"{name} {seconds * 1000:.1f} ms"
+                      for name, seconds in self.startup.items()),
+            sum(self.startup.values()) * 1000,
+        )
+
+        self.db: Database = Database()
+        self.idle_timeout: int = Screen.IDLE_TIMEOUT
+
+        self.stack: List[State] = []
+        self.switches: int = 0
+        self.switch_seconds: float = 0.0
+        self.slowest_switch: float = 0.0
+
+    # ---------------- Startup ----------------
+    @classmethod
+    def init_subsystems(cls) -> Dict[str, float]:
+        """
+        Start only the pygame subsystems the game uses, instead of
+        ``pygame.init()``, with the mixer configured for low latency.
+
+        A subsystem that fails to start (e.g. no audio device) is logged
+        and skipped; the game runs without it.
+
+        Returns:
+            dict[str, float]: Seconds spent starting each subsystem.
+        """
+        pygame.mixer.pre_init(
+            Audio.FREQUENCY, Audio.SIZE, Audio.CHANNELS, Audio.BUFFER
+        )
+        timings: Dict[str, float] = {}
+        for name, init in cls.SUBSYSTEMS:
+            start = time.perf_counter()
+            try:
+                init()
+            except pygame.error as error:
+                logger.warning("%s init failed: %s", name, error)
+            timings[name] = time.perf_counter() - start
+        return timings
+
+    @property
+    def screen(self) -> pygame.Surface:
+        """The current canvas of :class:`Viewport`."""
+        return Viewport.canvas
+
+    # ---------------- State stack ----------------
+    @property
+    def top(self) -> State | None:
+        """The running state, or None once the stack is empty."""
+        return self.stack[-1] if self.stack else None
+
+    def push(self, state: State) -> None:
+        """Cover the running state with ``state``."""
+        self.switch(state, remove=False)
+
+    def pop(self) -> None:
+        """Remove the running state and resume the one below it."""
+        self.switch(None, remove=True)
+
+    def replace(self, state: State) -> None:
+        """Swap the running state for ``state``."""
+        self.switch(state, remove=True)
+
+    def switch(self, state: State | None, remove: bool) -> None:
+        """
+        Change the top of the stack and time the transition.
+
+        Args:
+            state (State | None): State to push, if any.
+            remove (bool): Pop the running state first.
+        """
+        start = time.perf_counter()
+        previous = self.top
+        if previous is not None:
+            previous.exit()
+            if remove:
+                self.stack.pop()
+        if state is not None:
+            self.stack.append(state)
+        current = self.top
+        if current is not None:
+            current.enter()
+
+        elapsed = time.perf_counter() - start
+        self.switches += 1
+        self.switch_seconds += elapsed
+        self.slowest_switch = max(self.slowest_switch, elapsed)
+        logger.info(
+            "%s -> %s in %.2f ms",
+            previous.NAME if previous is not None else "start",
+            current.NAME if current is not None else "exit",
+            elapsed * 1000,
+        )
+
+    # ---------------- Main loop ----------------
+    def run(self) -> None:
+        """Run the top state's frames until the stack is empty, then shut down."""
+        while self.stack:
+            state = self.stack[-1]
+            state.handle_events(Viewport.map_events(state.scheduler.next_frame()))
+
+            # Events may have switched states; the new top starts next frame
+            if self.top is not state:
+                continue
+            state.update()
+            if self.top is state and state.scheduler.should_draw():
+                state.draw()
+
+        self.close()
+
+    def close(self) -> None:
+        """Flush pending score writes and shut pygame down."""
+        logger.info(
+            "%d state switches, %.2f ms total, slowest %.2f ms",
+            self.switches, self.switch_seconds * 1000, self.slowest_switch * 1000,
+        )
+        logger.info("text cache: %s", FontManager.stats())
+        ScoreWriter.shutdown()
+        pygame.quit()
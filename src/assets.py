@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+assets.py
+
+Process-wide image cache for Jet Fighter.
+
+This module defines the :class:`Assets` registry, which decodes every image
+file once, converts it to the display pixel format, and hands out the same
+shared surface to every sprite that asks for it. It also keeps image
+dimensions, one collision mask per image, and hit/miss counters so gameplay
+can be checked for disk I/O.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import pygame
+
+
+class Assets:
+    """
+    Shared registry of decoded image surfaces keyed by file path.
+
+    Surfaces returned by :meth:`image` are shared between all callers and
+    must be treated as read-only. Callers that need to modify a surface
+    (for example to change its alpha) should ``copy()`` it first.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to decode a file.
+    """
+
+    _images: Dict[str, pygame.Surface] = {}
+    _raw: Dict[str, pygame.Surface] = {}
+    _sizes: Dict[str, Tuple[int, int]] = {}
+    _masks: Dict[str, pygame.mask.Mask] = {}
+
+    hits: int = 0
+    misses: int = 0
+
+    # ---------------- Images ----------------
+    @classmethod
+    def image(cls, path: str) -> pygame.Surface:
+        """
+        Return the shared surface for an image file, decoding it on first use.
+
+        The surface is converted with ``convert_alpha`` once a display mode
+        is set. Without a display the unconverted surface is returned and
+        conversion happens on the first lookup after the display exists.
+
+        Args:
+            path (str): Path to the image file.
+
+        Returns:
+            pygame.Surface: The cached surface.
+        """
+        surface = cls._images.get(path)
+        if surface is not None:
+            cls.hits += 1
+            return surface
+
+        raw = cls._raw.get(path)
+        if raw is None:
+            cls.misses += 1
+            raw = pygame.image.load(path)
+            cls._raw[path] = raw
+            cls._sizes[path] = raw.get_size()
+        else:
+            cls.hits += 1
+
+        if pygame.display.get_surface() is None:
+            return raw
+
+        surface = raw.convert_alpha()
+        cls._images[path] = surface
+        del cls._raw[path]
+        return surface
+
+    @classmethod
+    def add(cls, path: str, surface: pygame.Surface, converted: bool = False) -> None:
+        """
+        Provide an image decoded elsewhere (e.g. on a preloader thread).
+
+        Unless already converted, it is converted to the display format on
+        its first lookup, which must happen on the main thread.
+
+        Args:
+            path (str): Path the image was decoded from.
+            surface (pygame.Surface): The decoded surface.
+            converted (bool): The surface is already in the display format
+                (e.g. a subsurface of a converted sprite atlas).
+        """
+        if path in cls._images or path in cls._raw:
+            return
+        cls.misses += 1
+        if converted:
+            cls._images[path] = surface
+        else:
+            cls._raw[path] = surface
+        cls._sizes[path] = surface.get_size()
+
+    @classmethod
+    def preload(cls, *paths: str) -> None:
+        """
+        Decode and convert several images ahead of time.
+
+        Args:
+            *paths (str): Paths to the image files.
+        """
+        for path in paths:
+            cls.image(path)
+
+    # ---------------- Masks ----------------
+    @classmethod
+    def mask(cls, path: str) -> pygame.mask.Mask:
+        """
+        Return the shared collision mask of an image, building it on first use.
+
+        Masks are built from the image's alpha channel and must be treated
+        as read-only, like the shared surfaces.
+
+        Args:
+            path (str): Path to the image file.
+
+        Returns:
+            pygame.mask.Mask: Mask of the image's opaque pixels.
+        """
+        mask = cls._masks.get(path)
+        if mask is None:
+            mask = cls._masks[path] = pygame.mask.from_surface(cls.image(path))
+        return mask
+
+    # ---------------- Dimensions ----------------
+    @classmethod
+    def size(cls, path: str) -> Tuple[int, int]:
+        """
+        Return the (width, height) of an image without re-reading it.
+
+        Args:
+            path (str): Path to the image file.
+
+        Returns:
+            tuple[int, int]: Image dimensions in pixels.
+        """
+        size = cls._sizes.get(path)
+        if size is None:
+            cls.image(path)
+            size = cls._sizes[path]
+        return size
+
+    @classmethod
+    def half_width(cls, path: str) -> int:
+        """
+        Return half of an image's width, e.g. for spawn margins.
+
+        Args:
+            path (str): Path to the image file.
+
+        Returns:
+            int: Half the image width, rounded down.
+        """
+        return cls.size(path)[0] // 2
+
+    # ---------------- Statistics ----------------
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """
+        Return cache counters.
+
+        Returns:
+            dict[str, int]: ``hits``, ``misses`` and number of ``cached`` images.
+        """
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "cached": len(cls._images) + len(cls._raw),
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached surfaces and reset the counters."""
+        cls._images.clear()
+        cls._raw.clear()
+        cls._sizes.clear()
+        cls._masks.clear()
+        cls.hits = 0
+        cls.misses = 0
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+atlas.py
+
+Sprite atlas build step and raw pixel cache for Jet Fighter.
+
+This module defines the :class:`SpriteAtlas` class. Its build command
+packs every image under ``assets/images`` into one sheet and writes three
+files to :attr:`src.settings.Atlas.DIRECTORY`::
+
+    python -m src.atlas
+
+- ``atlas.png``: the packed sheet, for inspection.
+- ``atlas.json``: the index of sub-rectangles by image path, plus the
+  size and modification time of every source file.
+- ``atlas.rgba``: the sheet's pre-decoded RGBA pixels.
+
+At startup :meth:`SpriteAtlas.load` memory-maps the raw pixels, wraps them
+with ``pygame.image.frombuffer`` and registers the region of every image
+with :class:`src.assets.Assets`, so game code keeps asking for images by
+their usual paths. If the cache is missing or any source image changed
+since the build, nothing is registered and the PNGs are decoded instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import logging
+import mmap
+import os
+import time
+from typing import Dict, List, Tuple
+
+import pygame
+
+from src.assets import Assets
+from src.settings import Atlas as AtlasConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SpriteAtlas:
+    """
+    Builder and loader of the packed sprite atlas.
+
+    Attributes:
+        VERSION (int): Index format version.
+        ROOT (str): Directory of the packed images.
+        PNG_NAME, INDEX_NAME, RAW_NAME (str): Output file names.
+        FORMAT (str): Pixel layout of the raw cache.
+        sheet (pygame.Surface | None): The loaded atlas, if any.
+        rects (dict[str, pygame.Rect]): Sub-rectangle of each loaded image.
+    """
+
+    VERSION: int = 1
+    ROOT: str = "assets/images"
+    PNG_NAME: str = "atlas.png"
+    INDEX_NAME: str = "atlas.json"
+    RAW_NAME: str = "atlas.rgba"
+    FORMAT: str = "RGBA"
+
+    sheet: pygame.Surface | None = None
+    rects: Dict[str, pygame.Rect] = {}
+    _buffer: mmap.mmap | None = None
+
+    # ---------------- Packing ----------------
+    @staticmethod
+    def pack(
+        sizes: Dict[str, Tuple[int, int]],
+        max_width: int = AtlasConfig.MAX_WIDTH,
+        padding: int = AtlasConfig.PADDING,
+    ) -> Tuple[Dict[str, pygame.Rect], Tuple[int, int]]:
+        """
+        Place images on horizontal shelves, tallest first.
+
+        Args:
+            sizes (dict[str, tuple[int, int]]): Image sizes by path.
+            max_width (int): Width at which a new shelf is started.
+            padding (int): Gap around every image.
+
+        Returns:
+            tuple: Rectangle of each image, and the (width, height) of the sheet.
+        """
+        rects: Dict[str, pygame.Rect] = {}
+        x = y = shelf = width = 0
+        for path in sorted(sizes, key=lambda p: (-sizes[p][1], p)):
+            w, h = sizes[path]
+            if x > 0 and x + w + padding > max_width:
+                x, y, shelf = 0, y + shelf + padding, 0
+            rects[path] = pygame.Rect(x + padding, y + padding, w, h)
+            x += w + padding
+            shelf = max(shelf, h)
+            width = max(width, x + padding)
+        return rects, (width, y + shelf + 2 * padding)
+
+    @staticmethod
+    def sources(paths: List[str]) -> Dict[str, List[int]]:
+        """Return the ``[size, mtime_ns]`` of every source file."""
+        stats = {path: os.stat(path) for path in paths}
+        return {path: [st.st_size, st.st_mtime_ns] for path, st in stats.items()}
+
+    # ---------------- Build ----------------
+    @classmethod
+    def build(
+        cls, root: str = ROOT, directory: str = AtlasConfig.DIRECTORY
+    ) -> Dict[str, object]:
+        """
+        Pack every PNG under ``root`` and write the atlas files.
+
+        Args:
+            root (str): Directory of the images to pack.
+            directory (str): Output directory.
+
+        Returns:
+            dict: The written index.
+        """
+        paths = [
+            path.replace(os.sep, "/")
+            for path in sorted(glob.glob(os.path.join(root, "*.png")))
+        ]
+        images = {path: pygame.image.load(path) for path in paths}
+        rects, size = cls.pack({path: image.get_size() for path, image in images.items()})
+
+        sheet = pygame.Surface(size, pygame.SRCALPHA, 32)
+        for path, image in images.items():
+            sheet.blit(image, rects[path])
+
+        os.makedirs(directory, exist_ok=True)
+        pygame.image.save(sheet, os.path.join(directory, cls.PNG_NAME))
+        with open(os.path.join(directory, cls.RAW_NAME), "wb") as f:
+            f.write(pygame.image.tobytes(sheet, cls.FORMAT))
+
+        index: Dict[str, object] = {
+            "version": cls.VERSION,
+            "size": list(size),
+            "format": cls.FORMAT,
+            "sprites": {path: list(rect) for path, rect in rects.items()},
+            "sources": cls.sources(paths),
+        }
+        with open(os.path.join(directory, cls.INDEX_NAME), "w") as f:
+            json.dump(index, f, indent=2)
+        return index
+
+    # ---------------- Load ----------------
+    @classmethod
+    def stale(cls, index: Dict[str, object], raw_path: str) -> str | None:
+        """
+        Return why a built atlas cannot be used, or None if it is fresh.
+
+        Args:
+            index (dict): The loaded index.
+            raw_path (str): Path of the raw pixel cache.
+
+        Returns:
+            str | None: A short reason, or None.
+        """
+        if index.get("version") != cls.VERSION or index.get("format") != cls.FORMAT:
+            return "built by another version"
+        width, height = index["size"]
+        if os.path.getsize(raw_path) != width * height * len(cls.FORMAT):
+            return "raw cache has the wrong size"
+        recorded = index["sources"]
+        try:
+            current = cls.sources(list(recorded))
+        except FileNotFoundError as error:
+            return f"{error.filename} was removed"
+        for path, stat in current.items():
+            if stat != recorded[path]:
+                return f"{path} changed"
+        return None
+
+    @classmethod
+    def load(cls, directory: str = AtlasConfig.DIRECTORY) -> Dict[str, pygame.Rect]:
+        """
+        Map the raw pixel cache and register its images with :class:`Assets`.
+
+        Must be called on the main thread. With a display the sheet is
+        converted once and each region is registered as a converted image;
+        without one the raw subsurfaces are registered and keep reading the
+        mapped file. Loading again returns the images already registered.
+
+        Args:
+            directory (str): Directory written by :meth:`build`.
+
+        Returns:
+            dict[str, pygame.Rect]: Sub-rectangle of each registered image,
+            empty if the cache is missing or stale.
+        """
+        if cls.sheet is not None:
+            return cls.rects
+
+        index_path = os.path.join(directory, cls.INDEX_NAME)
+        raw_path = os.path.join(directory, cls.RAW_NAME)
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+            reason = cls.stale(index, raw_path)
+        except (OSError, ValueError, KeyError) as error:
+            logger.info("no usable sprite atlas in %s (%s)", directory, error)
+            return {}
+        if reason is not None:
+            logger.info("sprite atlas is stale (%s), loading PNGs; "
+                        "rebuild with python -m src.atlas", reason)
+            return {}
+
+        with open(raw_path, "rb") as f:
+            cls._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        sheet = pygame.image.frombuffer(cls._buffer, tuple(index["size"]), cls.FORMAT)
+        converted = pygame.display.get_surface() is not None
+        if converted:
+            sheet = sheet.convert_alpha()
+
+        cls.sheet = sheet
+        cls.rects = {path: pygame.Rect(rect) for path, rect in index["sprites"].items()}
+        for path, rect in cls.rects.items():
+            image = sheet.subsurface(rect)
+            if converted:
+                # Blitting from a subsurface is much slower than from a
+                # surface of its own; copying converted pixels is cheap
+                image = image.copy()
+            Assets.add(path, image, converted=converted)
+        return cls.rects
+
+
+# ---------------- Command line ----------------
+def main() -> None:
+    """Build the sprite atlas and its raw pixel cache."""
+    parser = argparse.ArgumentParser(description="Build the Jet Fighter sprite atlas.")
+    parser.add_argument("--root", default=SpriteAtlas.ROOT, help="directory of images to pack")
+    parser.add_argument("--output", default=AtlasConfig.DIRECTORY, help="output directory")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = SpriteAtlas.build(args.root, args.output)
+    width, height = index["size"]
+    print(f"packed {len(index['sprites'])} images into a {width}x{height} atlas "
+          f"in {args.output} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
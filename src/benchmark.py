@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+benchmark.py
+
+Frame-time benchmark suite for Jet Fighter.
+
+This module drives a headless :class:`src.play.Play` state (SDL dummy video and
+audio drivers) through scripted scenarios and measures how long each phase
+of a gameplay tick takes: event handling, simulation update, collision
+handling, and drawing (including the display flip). Results are written as
+JSON so builds can be compared on the same machine::
+
+    python -m src.benchmark --output bench.json --label my-branch
+    python -m src.benchmark --scenario stress --ticks 2000
+"""
+
+from __future__ import annotations
+
+import os
+
+# Run without a window or sound device (must be set before pygame starts)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List
+
+import pygame
+
+from src.app import AppContext
+from src.play import Play
+from src.renderer import DirtyRenderer
+from src.settings import Screen, Game as GameConfig
+from src.simulation import Simulation
+
+# Large enough that no scenario can run out of hearts or missiles
+UNLIMITED: int = 10**9
+
+PHASES: tuple[str, ...] = ("events", "update", "collisions", "draw", "total")
+
+# ---------------- Scenarios ----------------
+def setup_unlimited(play: Play) -> None:
+    """Give the player unlimited hearts and missiles so the round never ends."""
+    play.sim.heart_remaining = UNLIMITED
+    play.sim.missiles_remaining = UNLIMITED
+
+
+def setup_max_enemies(play: Play) -> None:
+    """Spawn an enemy on every tick until the difficulty's limit is reached."""
+    setup_unlimited(play)
+    play.sim.enemy_spawn_rate = GameConfig.TICK_RATE
+
+
+def setup_stress(play: Play) -> None:
+    """Allow hundreds of simultaneous enemies."""
+    setup_unlimited(play)
+    play.sim.enemy_spawn_rate = GameConfig.TICK_RATE
+    play.sim.enemy_limit = 300
+
+
+def setup_array_stress(play: Play) -> None:
+    """Run the NumPy stress mode with thousands of array-backed entities."""
+    play.sim = Simulation("Hard", seed=0, stress=True)
+    setup_stress(play)
+
+
+def setup_mask(play: Play) -> None:
+    """Max enemies with pixel-perfect (mask) collisions."""
+    play.sim = Simulation(play.sim.difficulty, seed=0, collision="mask")
+    setup_max_enemies(play)
+
+
+def setup_mask_stress(play: Play) -> None:
+    """Hundreds of enemies with pixel-perfect (mask) collisions."""
+    play.sim = Simulation(play.sim.difficulty, seed=0, collision="mask")
+    setup_stress(play)
+
+
+def setup_dirty_rects(play: Play) -> None:
+    """Max enemies drawn with the dirty-rectangle renderer."""
+    setup_max_enemies(play)
+    play.renderer = DirtyRenderer(play.hud)
+
+
+def press_fire(play: Play, tick: int, shots: int = 1) -> None:
+    """Queue ``shots`` fire key presses for the events phase."""
+    for _ in range(shots):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+
+
+def explosion_storm(play: Play, tick: int) -> None:
+    """Spawn a burst of explosions across the screen every tick."""
+    for i in range(10):
+        play.sim.explosion_pool.acquire(
+            (tick * 37 + i * 80) % Screen.WIDTH,
+            (tick * 53 + i * 60) % Screen.HEIGHT,
+            play.sim.all_sprites,
+        )
+
+
+class Scenario:
+    """
+    A scripted benchmark scenario.
+
+    Attributes:
+        name (str): Scenario name used in the results.
+        difficulty (str): Difficulty the round is played at.
+        setup (Callable): Adjusts the fresh :class:`Play` before measuring.
+        script (Callable | None): Called with ``(play, tick)`` before each tick.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        difficulty: str = "Normal",
+        setup: Callable[[Play], None] = setup_unlimited,
+        script: Callable[[Play, int], None] | None = None,
+    ) -> None:
+        """Store the scenario definition."""
+        self.name: str = name
+        self.difficulty: str = difficulty
+        self.setup: Callable[[Play], None] = setup
+        self.script: Callable[[Play, int], None] | None = script
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario("idle"),
+        Scenario("max_enemies_easy", "Easy", setup_max_enemies),
+        Scenario("max_enemies_normal", "Normal", setup_max_enemies),
+        Scenario("max_enemies_hard", "Hard", setup_max_enemies),
+        Scenario("sustained_fire", "Hard", setup_max_enemies, press_fire),
+        Scenario("sustained_fire_mask", "Hard", setup_mask, press_fire),
+        Scenario("dirty_rects", "Hard", setup_dirty_rects, press_fire),
+        Scenario("explosion_storm", "Normal", setup_unlimited, explosion_storm),
+        Scenario("stress", "Hard", setup_stress,
+                 lambda play, tick: press_fire(play, tick, shots=3)),
+        Scenario("stress_mask", "Hard", setup_mask_stress,
+                 lambda play, tick: press_fire(play, tick, shots=3)),
+        Scenario("array_stress", "Hard", setup_array_stress,
+                 lambda play, tick: press_fire(play, tick, shots=3)),
+    ]
+}
+
+
+# ---------------- Measurement ----------------
+def percentile(samples: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of already sorted samples."""
+    index = min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))
+    return samples[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Return mean/p50/p95/p99/max of samples (seconds) in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "mean": sum(ordered) / len(ordered) * 1000,
+        "p50": percentile(ordered, 0.50) * 1000,
+        "p95": percentile(ordered, 0.95) * 1000,
+        "p99": percentile(ordered, 0.99) * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+
+def run_scenario(
+    play: Play, scenario: Scenario, ticks: int, warmup: int
+) -> Dict[str, object]:
+    """
+    Run one scenario and collect per-phase timings.
+
+    Args:
+        play (Play): Gameplay state, reset for the scenario.
+        scenario (Scenario): The scenario to run.
+        ticks (int): Number of measured ticks.
+        warmup (int): Number of unmeasured ticks run first.
+
+    Returns:
+        dict: Phase summaries and peak sprite counts.
+    """
+    play.start()
+    play.recorder = None
+    play.sim = Simulation(scenario.difficulty, seed=0)
+    scenario.setup(play)
+    sim = play.sim
+
+    # Time collision handling separately from the rest of the update
+    collisions: List[float] = [0.0]
+    handle_collisions = sim.handle_collisions
+
+    def timed_collisions() -> None:
+        start = time.perf_counter()
+        handle_collisions()
+        collisions[0] = time.perf_counter() - start
+
+    sim.handle_collisions = timed_collisions
+
+    samples: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    peak_sprites = 0
+    clock = time.perf_counter
+    for tick in range(warmup + ticks):
+        if scenario.script is not None:
+            scenario.script(play, tick)
+        collisions[0] = 0.0
+
+        t0 = clock()
+        play.handle_events(pygame.event.get())
+        t1 = clock()
+        play.step()  # exactly one simulation tick per measured frame
+        t2 = clock()
+        play.draw()
+        t3 = clock()
+
+        if tick < warmup:
+            continue
+        samples["events"].append(t1 - t0)
+        samples["update"].append(t2 - t1 - collisions[0])
+        samples["collisions"].append(collisions[0])
+        samples["draw"].append(t3 - t2)
+        samples["total"].append(t3 - t0)
+        entities = len(sim.all_sprites) + (len(sim.swarm) if sim.swarm is not None else 0)
+        peak_sprites = max(peak_sprites, entities)
+
+    return {
+        "difficulty": scenario.difficulty,
+        "ticks": ticks,
+        "peak_sprites": peak_sprites,
+        "broadphase": sim.broadphase.stats(),
+        "phases_ms": {phase: summarize(samples[phase]) for phase in PHASES},
+    }
+
+
+# ---------------- Command line ----------------
+def main() -> None:
+    """Run the selected scenarios and write the results as JSON."""
+    parser = argparse.ArgumentParser(description="Jet Fighter frame-time benchmark.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--ticks", type=int, default=1000, help="measured ticks per scenario")
+    parser.add_argument("--warmup", type=int, default=120, help="unmeasured ticks per scenario")
+    parser.add_argument("--label", default="", help="build label stored in the results")
+    parser.add_argument("--output", help="JSON output file (default: stdout)")
+    args = parser.parse_args()
+
+    results: Dict[str, object] = {
+        "label": args.label,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+    # One window and one Play state for every scenario
+    app = AppContext()
+    play = Play(app)
+    for name in args.scenario or list(SCENARIOS):
+        results["scenarios"][name] = run_scenario(
+            play, SCENARIOS[name], args.ticks, args.warmup
+        )
+        total = results["scenarios"][name]["phases_ms"]["total"]
+        print(f"{name:>20}: mean {total['mean']:.3f} ms, p99 {total['p99']:.3f} ms",
+              file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
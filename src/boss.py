@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import pygame
 
+from src.assets import Assets
 from src.enemy import Enemy
 
 
@@ -35,5 +36,8 @@ class Boss(Enemy):
             y (int): Initial y-coordinate (top).
         """
         super().__init__(x, y)
-        self.image: pygame.Surface = pygame.image.load(self.IMAGE_PATH).convert_alpha()
+        self.image: pygame.Surface = Assets.image(self.IMAGE_PATH)
         self.rect: pygame.Rect = self.image.get_rect(center=(x, y))
+        self.mask: pygame.mask.Mask = Assets.mask(self.IMAGE_PATH)
+        self.y: float = float(self.rect.y)
+        self.prev_y: float = self.y
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+broadphase.py
+
+Spatial-hash collision broadphase for Jet Fighter.
+
+This module defines the :class:`SpatialHash` class, a uniform grid that
+indexes one sprite group (the enemies) by the cells their rectangles
+overlap. The index is updated incrementally every tick: a sprite is only
+re-filed when it moves into different cells. Collision queries then test
+only sprites that share a cell with the query rectangle, while reproducing
+the results and kill order of ``pygame.sprite.groupcollide`` and
+``pygame.sprite.spritecollide``. An optional narrow-phase test (such as
+``pygame.sprite.collide_mask``) runs only on pairs whose rectangles overlap.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Set, Tuple
+
+import pygame
+
+Cell = Tuple[int, int]
+CellRange = Tuple[int, int, int, int]
+Collided = Callable[[pygame.sprite.Sprite, pygame.sprite.Sprite], object]
+
+
+class SpatialHash:
+    """
+    Uniform-grid index of a sprite group.
+
+    Attributes:
+        cell_size (int): Width and height of a grid cell in pixels.
+        cells (dict): Cell coordinate -> sprites overlapping that cell.
+        pairs_tested (int): Rectangle tests performed on candidate pairs.
+        hits (int): Candidate pairs that collided.
+        narrow_tests (int): Narrow-phase tests run on overlapping rectangles.
+        moves (int): Times a sprite was re-filed into different cells.
+    """
+
+    def __init__(self, cell_size: int = 64) -> None:
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size (int): Width and height of a grid cell in pixels.
+        """
+        self.cell_size: int = cell_size
+        self.cells: Dict[Cell, Set[pygame.sprite.Sprite]] = {}
+        self.ranges: Dict[pygame.sprite.Sprite, CellRange] = {}
+        self.order: Dict[pygame.sprite.Sprite, int] = {}
+
+        self.pairs_tested: int = 0
+        self.hits: int = 0
+        self.narrow_tests: int = 0
+        self.moves: int = 0
+
+    def clear(self) -> None:
+        """Drop every indexed sprite; the counters are kept."""
+        self.cells.clear()
+        self.ranges.clear()
+        self.order.clear()
+
+    # ---------------- Indexing ----------------
+    def cell_range(self, rect: pygame.Rect) -> CellRange:
+        """Return the (x0, y0, x1, y1) cell range covered by a rectangle."""
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def insert(self, sprite: pygame.sprite.Sprite, cells: CellRange) -> None:
+        """File a sprite into every cell of a cell range."""
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), set()).add(sprite)
+        self.ranges[sprite] = cells
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a sprite from the grid if it is indexed."""
+        cells = self.ranges.pop(sprite, None)
+        self.order.pop(sprite, None)
+        if cells is None:
+            return
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(sprite)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def sync(self, group: pygame.sprite.AbstractGroup) -> None:
+        """
+        Bring the grid in line with a group after sprites moved or changed.
+
+        Only sprites whose cell range changed are re-filed; sprites that
+        left the group are dropped.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The indexed group.
+        """
+        order: Dict[pygame.sprite.Sprite, int] = {}
+        for index, sprite in enumerate(group):
+            order[sprite] = index
+            cells = self.cell_range(sprite.rect)
+            old = self.ranges.get(sprite)
+            if old != cells:
+                if old is not None:
+                    self.remove(sprite)
+                    self.moves += 1
+                self.insert(sprite, cells)
+
+        for sprite in [s for s in self.ranges if s not in order]:
+            self.remove(sprite)
+        self.order = order
+
+    # ---------------- Queries ----------------
+    def candidates(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """
+        Return indexed sprites sharing a cell with a rectangle.
+
+        The result is sorted in group order so callers see sprites in the
+        same order as a full scan of the group would.
+        """
+        x0, y0, x1, y1 = self.cell_range(rect)
+        found: Set[pygame.sprite.Sprite] = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found, key=self.order.__getitem__)
+
+    def spritecollide(
+        self,
+        sprite: pygame.sprite.Sprite,
+        dokill: bool,
+        collided: Collided | None = None,
+    ) -> List[pygame.sprite.Sprite]:
+        """
+        Return indexed sprites colliding with ``sprite``.
+
+        Equivalent to ``pygame.sprite.spritecollide(sprite, group, dokill,
+        collided)`` for the synced group, except that ``collided`` is only
+        called for pairs whose rectangles overlap.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to test.
+            dokill (bool): Kill (and un-index) every sprite that was hit.
+            collided (Callable | None): Narrow-phase test, or None for
+                rectangles only.
+
+        Returns:
+            list[pygame.sprite.Sprite]: Colliding sprites in group order.
+        """
+        hit: List[pygame.sprite.Sprite] = []
+        for other in self.candidates(sprite.rect):
+            self.pairs_tested += 1
+            if sprite.rect.colliderect(other.rect):
+                if collided is not None:
+                    self.narrow_tests += 1
+                    if not collided(sprite, other):
+                        continue
+                hit.append(other)
+        self.hits += len(hit)
+
+        if dokill:
+            for other in hit:
+                other.kill()
+                self.remove(other)
+        return hit
+
+    def groupcollide(
+        self,
+        group: pygame.sprite.AbstractGroup,
+        dokill: bool,
+        dokill_indexed: bool,
+        collided: Collided | None = None,
+    ) -> Dict[pygame.sprite.Sprite, List[pygame.sprite.Sprite]]:
+        """
+        Collide a group against the indexed group.
+
+        Equivalent to ``pygame.sprite.groupcollide(group, indexed, dokill,
+        dokill_indexed, collided)`` for the synced group.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): Group tested against the grid.
+            dokill (bool): Kill sprites of ``group`` that hit something.
+            dokill_indexed (bool): Kill indexed sprites that were hit.
+            collided (Callable | None): Narrow-phase test, or None for
+                rectangles only.
+
+        Returns:
+            dict: Sprite of ``group`` -> list of indexed sprites it hit.
+        """
+        crashed: Dict[pygame.sprite.Sprite, List[pygame.sprite.Sprite]] = {}
+        for sprite in group.sprites():
+            hit = self.spritecollide(sprite, dokill_indexed, collided)
+            if hit:
+                crashed[sprite] = hit
+                if dokill:
+                    sprite.kill()
+        return crashed
+
+    # ---------------- Statistics ----------------
+    def stats(self) -> Dict[str, int]:
+        """
+        Return broadphase counters.
+
+        Returns:
+            dict[str, int]: ``pairs_tested``, ``hits``, ``narrow_tests``,
+            ``moves``, plus the number of indexed ``sprites`` and occupied
+            ``cells``.
+        """
+        return {
+            "pairs_tested": self.pairs_tested,
+            "hits": self.hits,
+            "narrow_tests": self.narrow_tests,
+            "moves": self.moves,
+            "sprites": len(self.ranges),
+            "cells": len(self.cells),
+        }
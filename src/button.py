@@ -14,6 +14,9 @@ from __future__ import annotations
 
 import pygame
 
+from src.fonts import FontManager
+from src.viewport import Viewport
+
 
 class Button:
     """
@@ -62,8 +65,8 @@ class Button:
         self.color_selected = color_selected
         self.text_color = text_color
 
-        # Font
-        self.font = pygame.font.SysFont(None, font_size)
+        # Font (text is rendered through the shared cache)
+        self.font_size = font_size
 
         # Selection state (used for keyboard navigation)
         self.selected = False
@@ -71,7 +74,7 @@ class Button:
     # ---------------- Drawing ----------------
     def draw(self, surface: pygame.Surface) -> None:
         """Render the button to the given surface."""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = Viewport.mouse_pos()
 
         # Determine background color
         if self.selected:
@@ -85,7 +88,7 @@ class Button:
         pygame.draw.rect(surface, color, self.rect, border_radius=10)
 
         # Draw centered text
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = FontManager.render(self.text, self.font_size, self.text_color)
         surface.blit(
             text_surf,
             (
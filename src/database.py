@@ -5,17 +5,138 @@ database.py
 SQLite-based database management for Jet Fighter.
 
 This module defines the :class:`Database` class, which is responsible for
-storing and retrieving game scores. It ensures the database and schema exist,
-and provides methods for saving new scores and fetching high scores.
+storing and retrieving game scores and per-session telemetry. It ensures the
+database and schema exist, and provides methods for saving new scores,
+fetching high scores, and aggregating session statistics. The
+:class:`SessionTelemetry` class buffers a session's measurements in memory,
+and the :class:`ScoreWriter` class saves scores and sessions on a background
+thread so the game loop never waits on the disk.
 
-The database is stored in ``db/game.db`` and is kept lightweight.
+The database is stored in ``db/game.db`` and is kept lightweight. All
+:class:`Database` instances in a process share one long-lived connection in
+WAL mode. The schema is versioned with ``PRAGMA user_version`` and existing
+database files are migrated in place when opened.
 """
 
 from __future__ import annotations
 
+import atexit
 import os
+import queue
 import sqlite3
-from typing import List, Tuple
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Tuple
+
+
+def _create_scores(conn: sqlite3.Connection) -> None:
+    """Schema version 1: the ``scores`` table."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            score INTEGER NOT NULL,
+            difficulty TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
+def _index_scores(conn: sqlite3.Connection) -> None:
+    """Schema version 2: score indexes and trigger-based retention."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC)"
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_scores_difficulty_score
+        ON scores (difficulty, score DESC)
+        """
+    )
+    # Keep only the latest MAX_SCORES rows, in the inserting transaction
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS scores_retention
+        AFTER INSERT ON scores
+        BEGIN
+            DELETE FROM scores
+            WHERE id <= (
+                SELECT id FROM scores
+                ORDER BY id DESC
+                LIMIT 1 OFFSET {Database.MAX_SCORES}
+            );
+        END
+        """
+    )
+    # Apply the retention limit to files written by older versions
+    conn.execute(
+        """
+        DELETE FROM scores
+        WHERE id <= (
+            SELECT id FROM scores ORDER BY id DESC LIMIT 1 OFFSET ?
+        )
+        """,
+        (Database.MAX_SCORES,),
+    )
+
+
+def _create_sessions(conn: sqlite3.Connection) -> None:
+    """Schema version 3: session telemetry and its sampled frame times."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            difficulty TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            duration REAL NOT NULL,
+            frames INTEGER NOT NULL,
+            dropped_frames INTEGER NOT NULL,
+            avg_frame_ms REAL NOT NULL,
+            worst_frame_ms REAL NOT NULL,
+            peak_entities INTEGER NOT NULL,
+            missiles_fired INTEGER NOT NULL,
+            missile_hits INTEGER NOT NULL,
+            accuracy REAL NOT NULL,
+            boss_kills INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS session_samples (
+            session_id INTEGER NOT NULL REFERENCES sessions (id),
+            frame INTEGER NOT NULL,
+            frame_ms REAL NOT NULL,
+            worst_ms REAL NOT NULL,
+            entities INTEGER NOT NULL,
+            PRIMARY KEY (session_id, frame)
+        ) WITHOUT ROWID
+        """
+    )
+    # Keep only the latest MAX_SESSIONS sessions and their samples
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS sessions_retention
+        AFTER INSERT ON sessions
+        BEGIN
+            DELETE FROM session_samples
+            WHERE session_id <= (
+                SELECT id FROM sessions
+                ORDER BY id DESC
+                LIMIT 1 OFFSET {Database.MAX_SESSIONS}
+            );
+            DELETE FROM sessions
+            WHERE id <= (
+                SELECT id FROM sessions
+                ORDER BY id DESC
+                LIMIT 1 OFFSET {Database.MAX_SESSIONS}
+            );
+        END
+        """
+    )
 
 
 class Database:
@@ -25,91 +146,537 @@ class Database:
     Attributes:
         DB_DIR (str): Directory path for the database file.
         DB_FILE (str): Full file path for the SQLite database.
+        MAX_SCORES (int): Number of most recent scores kept.
+        MAX_SESSIONS (int): Number of most recent telemetry sessions kept.
+        MIGRATIONS (list[Callable]): Schema upgrades; entry ``i`` upgrades
+            a database from version ``i`` to ``i + 1``.
+        version (int): Incremented on every score write; lets callers
+            know when a cached leaderboard is out of date.
     """
 
     DB_DIR: str = "db"
     DB_FILE: str = os.path.join(DB_DIR, "game.db")
+    MAX_SCORES: int = 100
+    MAX_SESSIONS: int = 50
 
-    def __init__(self) -> None:
-        """Initialize the database and create the scores table if needed."""
-        os.makedirs(self.DB_DIR, exist_ok=True)
-        self.create_table()
-
-    # ---------------- Table setup ----------------
-    def create_table(self) -> None:
-        """Create the ``scores`` table if it does not already exist."""
-        with sqlite3.connect(self.DB_FILE) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS scores (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    score INTEGER NOT NULL,
-                    difficulty TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
-            conn.commit()
+    MIGRATIONS: List[Callable[[sqlite3.Connection], None]] = [
+        _create_scores,
+        _index_scores,
+        _create_sessions,
+    ]
+
+    # Process-wide connection shared by all instances
+    _conn: sqlite3.Connection | None = None
+
+    # Leaderboard cache, (limit, difficulty) -> rows, cleared on writes
+    _high_scores: Dict[Tuple[int, str | None], List[Tuple[int, str, str]]] = {}
+    _cache_lock: threading.Lock = threading.Lock()
+    version: int = 0
+
+    def __init__(self, conn: sqlite3.Connection | None = None) -> None:
+        """
+        Open (or reuse) the shared connection and migrate the schema.
+
+        Args:
+            conn (sqlite3.Connection | None): Use this connection instead of
+                the shared one (e.g. a thread's own, from :meth:`open`).
+        """
+        self.conn: sqlite3.Connection = conn if conn is not None else self.connect()
+
+    # ---------------- Connection ----------------
+    @classmethod
+    def connect(cls) -> sqlite3.Connection:
+        """
+        Return the process-wide connection, opening it on first use.
+
+        Returns:
+            sqlite3.Connection: Connection in WAL mode with an up-to-date schema.
+        """
+        if cls._conn is None:
+            cls._conn = cls.open()
+            atexit.register(cls.close)
+        return cls._conn
+
+    @classmethod
+    def open(cls) -> sqlite3.Connection:
+        """
+        Open a new connection in WAL mode and migrate the schema.
+
+        SQLite connections belong to the thread that opened them, so
+        background threads open their own with this method.
+
+        Returns:
+            sqlite3.Connection: The new connection.
+        """
+        os.makedirs(cls.DB_DIR, exist_ok=True)
+        conn = sqlite3.connect(cls.DB_FILE, timeout=1.0, cached_statements=64)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        cls.migrate(conn)
+        return conn
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the shared connection (it is reopened on next use)."""
+        if cls._conn is not None:
+            cls._conn.close()
+            cls._conn = None
+            atexit.unregister(cls.close)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop cached leaderboards after the scores table changed."""
+        with cls._cache_lock:
+            cls._high_scores.clear()
+            cls.version += 1
+
+    # ---------------- Schema ----------------
+    @classmethod
+    def migrate(cls, conn: sqlite3.Connection) -> int:
+        """
+        Upgrade the schema to the latest version in place.
+
+        Each pending migration runs in its own transaction together with
+        the ``user_version`` bump, so an interrupted upgrade is retried
+        on the next start.
+
+        Args:
+            conn (sqlite3.Connection): Connection to migrate.
+
+        Returns:
+            int: The schema version after migrating.
+        """
+        version: int = conn.execute("PRAGMA user_version").fetchone()[0]
+        for target in range(version, len(cls.MIGRATIONS)):
+            with conn:
+                conn.execute("BEGIN")
+                cls.MIGRATIONS[target](conn)
+                conn.execute(f"PRAGMA user_version = {target + 1}")
+        return max(version, len(cls.MIGRATIONS))
 
     # ---------------- Save score ----------------
-    def save_score(self, score: int, difficulty: str) -> None:
+    def save_score(self, score: int, difficulty: str) -> int:
         """
         Insert a new score into the database.
 
+        Older scores beyond :attr:`MAX_SCORES` are removed by a trigger in
+        the same transaction.
+
         Args:
             score (int): The player's final score.
             difficulty (str): The difficulty setting at which the score was earned.
-        """
-        with sqlite3.connect(self.DB_FILE) as conn:
-            cursor = conn.cursor()
 
-            cursor.execute(
+        Returns:
+            int: Row id of the new score.
+        """
+        with self.conn:
+            cursor = self.conn.execute(
                 """
                 INSERT INTO scores (score, difficulty)
                 VALUES (?, ?)
                 """,
                 (score, difficulty),
             )
-            conn.commit()
-
-            # Keep only the latest 100 scores
-            cursor.execute("SELECT COUNT(*) FROM scores")
-            count = cursor.fetchone()[0]
-            if count > 100:
-                cursor.execute(
-                    """
-                    DELETE FROM scores
-                    WHERE id IN (
-                        SELECT id FROM scores
-                        ORDER BY created_at ASC
-                        LIMIT ?
-                    )
-                    """,
-                    (count - 100,),
-                )
-                conn.commit()
+        self.invalidate()
+        return cursor.lastrowid
 
     # ---------------- High scores ----------------
-    def get_high_scores(self, limit: int = 5) -> List[Tuple[int, str, str]]:
+    def get_high_scores(
+        self, limit: int = 5, difficulty: str | None = None
+    ) -> List[Tuple[int, str, str]]:
         """
         Retrieve the top high scores.
 
+        Results are cached in memory until the next score is saved.
+
         Args:
             limit (int): Maximum number of high scores to return.
+            difficulty (str | None): Only return scores of this difficulty.
 
         Returns:
             list[tuple[int, str, str]]: List of (score, difficulty, created_at).
         """
-        with sqlite3.connect(self.DB_FILE) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        key = (limit, difficulty)
+        with self._cache_lock:
+            cached = self._high_scores.get(key)
+            version = self.version
+        if cached is not None:
+            return list(cached)
+
+        if difficulty is None:
+            cursor = self.conn.execute(
+                """
+                SELECT score, difficulty, created_at
+                FROM scores
+                ORDER BY score DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+        else:
+            cursor = self.conn.execute(
                 """
                 SELECT score, difficulty, created_at
                 FROM scores
+                WHERE difficulty = ?
                 ORDER BY score DESC
                 LIMIT ?
                 """,
-                (limit,)
+                (difficulty, limit),
+            )
+        rows = cursor.fetchall()
+
+        # Only cache if no write landed while querying
+        with self._cache_lock:
+            if version == self.version:
+                self._high_scores[key] = rows
+        return list(rows)
+
+    def get_rank(self, score_id: int) -> int:
+        """
+        Return the leaderboard position of a saved score.
+
+        Args:
+            score_id (int): Row id returned by :meth:`save_score`.
+
+        Returns:
+            int: 1 for the best score; ties share the better rank.
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT COUNT(*) + 1 FROM scores
+            WHERE score > (SELECT score FROM scores WHERE id = ?)
+            """,
+            (score_id,),
+        )
+        return cursor.fetchone()[0]
+
+    # ---------------- Sessions ----------------
+    def save_session(self, telemetry: SessionTelemetry) -> int:
+        """
+        Insert a session and all of its buffered samples in one transaction.
+
+        Args:
+            telemetry (SessionTelemetry): A finished session.
+
+        Returns:
+            int: Row id of the new session.
+        """
+        row = telemetry.summary()
+        with self.conn:
+            cursor = self.conn.execute(
+                f"""
+                INSERT INTO sessions ({", ".join(row)})
+                VALUES ({", ".join("?" * len(row))})
+                """,
+                tuple(row.values()),
+            )
+            session_id = cursor.lastrowid
+            self.conn.executemany(
+                """
+                INSERT INTO session_samples
+                    (session_id, frame, frame_ms, worst_ms, entities)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(session_id, *sample) for sample in telemetry.samples],
             )
-            return cursor.fetchall()
+        return session_id
+
+    def get_session_stats(self, difficulty: str | None = None) -> Dict[str, float]:
+        """
+        Aggregate the stored sessions.
+
+        Args:
+            difficulty (str | None): Only include sessions of this difficulty.
+
+        Returns:
+            dict[str, float]: ``sessions``, ``play_time`` (seconds),
+            ``avg_duration``, ``avg_score``, ``avg_frame_ms``,
+            ``worst_frame_ms``, ``dropped_ratio`` (dropped frames over all
+            frames), ``peak_entities``, ``missiles_fired``, ``accuracy``
+            (hits over shots) and ``boss_kills``. Averages are 0 without
+            sessions.
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(duration), 0),
+                COALESCE(AVG(duration), 0),
+                COALESCE(AVG(score), 0),
+                COALESCE(SUM(avg_frame_ms * frames) / NULLIF(SUM(frames), 0), 0),
+                COALESCE(MAX(worst_frame_ms), 0),
+                COALESCE(1.0 * SUM(dropped_frames) / NULLIF(SUM(frames), 0), 0),
+                COALESCE(MAX(peak_entities), 0),
+                COALESCE(SUM(missiles_fired), 0),
+                COALESCE(1.0 * SUM(missile_hits) / NULLIF(SUM(missiles_fired), 0), 0),
+                COALESCE(SUM(boss_kills), 0)
+            FROM sessions
+            WHERE ?1 IS NULL OR difficulty = ?1
+            """,
+            (difficulty,),
+        )
+        keys = (
+            "sessions", "play_time", "avg_duration", "avg_score", "avg_frame_ms",
+            "worst_frame_ms", "dropped_ratio", "peak_entities", "missiles_fired",
+            "accuracy", "boss_kills",
+        )
+        return dict(zip(keys, cursor.fetchone()))
+
+
+class SessionTelemetry:
+    """
+    In-memory measurements of one gameplay session.
+
+    Frame statistics are updated incrementally every frame; a sample of
+    the mean and worst frame time and the entity count is buffered every
+    :attr:`SAMPLE_EVERY` frames. Nothing touches the database until the
+    session is saved with :meth:`Database.save_session`.
+
+    Attributes:
+        SAMPLE_EVERY (int): Frames aggregated into one stored sample.
+        DROP_FACTOR (float): A frame longer than this many frame budgets
+            counts as dropped.
+        samples (list[tuple[int, float, float, int]]): Buffered
+            (frame, mean ms, worst ms, entities) samples.
+    """
+
+    SAMPLE_EVERY: int = 30
+    DROP_FACTOR: float = 1.5
+
+    def __init__(self, difficulty: str, budget_ms: float) -> None:
+        """
+        Start a session.
+
+        Args:
+            difficulty (str): Difficulty of the session.
+            budget_ms (float): Target frame time in milliseconds.
+        """
+        self.difficulty: str = difficulty
+        self.budget_ms: float = budget_ms
+        self.started: float = time.perf_counter()
+        self.duration: float = 0.0
+
+        self.frames: int = 0
+        self.dropped_frames: int = 0
+        self.total_ms: float = 0.0
+        self.worst_ms: float = 0.0
+        self.peak_entities: int = 0
+
+        self.samples: List[Tuple[int, float, float, int]] = []
+        self.window_ms: float = 0.0
+        self.window_worst: float = 0.0
+
+        self.score: int = 0
+        self.missiles_fired: int = 0
+        self.missile_hits: int = 0
+        self.boss_kills: int = 0
+
+    def record_frame(self, frame_ms: float, entities: int) -> None:
+        """
+        Add one frame's measurements.
+
+        Args:
+            frame_ms (float): Length of the frame in milliseconds.
+            entities (int): Live entities during the frame.
+        """
+        self.frames += 1
+        self.total_ms += frame_ms
+        if frame_ms > self.worst_ms:
+            self.worst_ms = frame_ms
+        if frame_ms > self.budget_ms * self.DROP_FACTOR:
+            self.dropped_frames += 1
+        if entities > self.peak_entities:
+            self.peak_entities = entities
+
+        self.window_ms += frame_ms
+        if frame_ms > self.window_worst:
+            self.window_worst = frame_ms
+        if self.frames % self.SAMPLE_EVERY == 0:
+            self.samples.append((
+                self.frames, self.window_ms / self.SAMPLE_EVERY,
+                self.window_worst, entities,
+            ))
+            self.window_ms = 0.0
+            self.window_worst = 0.0
+
+    def finish(
+        self, score: int, missiles_fired: int, missile_hits: int, boss_kills: int
+    ) -> None:
+        """
+        Close the session with the round's final counters.
+
+        Args:
+            score (int): Final score.
+            missiles_fired (int): Missiles launched.
+            missile_hits (int): Missiles that hit an enemy.
+            boss_kills (int): Bosses destroyed.
+        """
+        self.duration = time.perf_counter() - self.started
+        self.score = score
+        self.missiles_fired = missiles_fired
+        self.missile_hits = missile_hits
+        self.boss_kills = boss_kills
+
+    def summary(self) -> Dict[str, object]:
+        """Return the session as a ``sessions`` table row (column -> value)."""
+        return {
+            "difficulty": self.difficulty,
+            "score": self.score,
+            "duration": self.duration,
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "avg_frame_ms": self.total_ms / self.frames if self.frames else 0.0,
+            "worst_frame_ms": self.worst_ms,
+            "peak_entities": self.peak_entities,
+            "missiles_fired": self.missiles_fired,
+            "missile_hits": self.missile_hits,
+            "accuracy": (
+                self.missile_hits / self.missiles_fired if self.missiles_fired else 0.0
+            ),
+            "boss_kills": self.boss_kills,
+        }
+
+
+class ScoreWriter:
+    """
+    Save scores and telemetry sessions on a background thread.
+
+    :meth:`submit` returns immediately with a future that resolves to the
+    score's leaderboard rank once the row is committed;
+    :meth:`submit_session` likewise resolves to the session's row id. Writes that hit a
+    busy or locked database are retried with a growing delay. Pending
+    writes are flushed by :meth:`close`, which also runs at exit.
+
+    Attributes:
+        RETRIES (int): Attempts per write before giving up.
+        RETRY_DELAY (float): Delay before the first retry, in seconds.
+    """
+
+    RETRIES: int = 5
+    RETRY_DELAY: float = 0.05
+
+    _shared: ScoreWriter | None = None
+
+    def __init__(self) -> None:
+        """Start the writer thread."""
+        self.queue: queue.Queue = queue.Queue()
+        self.thread: threading.Thread = threading.Thread(
+            target=self.work, name="score-writer", daemon=True
+        )
+        self.thread.start()
+
+    @classmethod
+    def shared(cls) -> ScoreWriter:
+        """Return the process-wide writer, starting it on first use."""
+        if cls._shared is None:
+            cls._shared = cls()
+            atexit.register(cls.shutdown)
+        return cls._shared
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush and stop the process-wide writer, if it was started."""
+        if cls._shared is not None:
+            cls._shared.close()
+            cls._shared = None
+            atexit.unregister(cls.shutdown)
+
+    # ---------------- Producer side ----------------
+    def submit(self, score: int, difficulty: str) -> Future:
+        """
+        Queue a score for saving without blocking.
+
+        Args:
+            score (int): The player's final score.
+            difficulty (str): The difficulty setting at which the score was earned.
+
+        Returns:
+            Future: Resolves to the score's rank (see :meth:`Database.get_rank`).
+        """
+        # The rank is a separate step so a busy read never repeats the insert
+        return self.enqueue(
+            lambda db: db.save_score(score, difficulty), then=Database.get_rank
+        )
+
+    def submit_session(self, telemetry: SessionTelemetry) -> Future:
+        """
+        Queue a finished session for saving without blocking.
+
+        Args:
+            telemetry (SessionTelemetry): The session; not modified afterwards.
+
+        Returns:
+            Future: Resolves to the session's row id.
+        """
+        return self.enqueue(lambda db: db.save_session(telemetry))
+
+    def enqueue(
+        self,
+        job: Callable[[Database], object],
+        then: Callable[[Database, object], object] | None = None,
+    ) -> Future:
+        """
+        Queue a database job and return the future of its result.
+
+        Args:
+            job (Callable[[Database], object]): The write to run.
+            then (Callable[[Database, object], object] | None): Runs after
+                ``job`` succeeded, with its result; its own result resolves
+                the future. Each step is retried on its own.
+
+        Returns:
+            Future: Resolves to the result of ``then``, or of ``job``.
+        """
+        future: Future = Future()
+        self.queue.put((job, then, future))
+        return future
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """
+        Write everything queued, then stop the thread.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait for the flush.
+        """
+        self.queue.put(None)
+        self.thread.join(timeout)
+
+    # ---------------- Writer thread ----------------
+    def work(self) -> None:
+        """Thread body: run queued jobs until :meth:`close` is called."""
+        db = Database(Database.open())
+        try:
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    break
+                job, then, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = self.write(db, job)
+                    if then is not None:
+                        result = self.write(db, lambda db: then(db, result))
+                    future.set_result(result)
+                except Exception as error:  # reported through the future
+                    future.set_exception(error)
+        finally:
+            db.conn.close()
+
+    def write(self, db: Database, job: Callable[[Database], object]) -> object:
+        """Run one job, retrying while the database is busy; return its result."""
+        delay = self.RETRY_DELAY
+        attempt = 1
+        while True:
+            try:
+                return job(db)
+            except sqlite3.OperationalError as error:
+                busy = getattr(error, "sqlite_errorcode", None) in (
+                    sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED,
+                ) or "locked" in str(error)
+                if not busy or attempt >= self.RETRIES:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+                attempt += 1
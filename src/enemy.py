@@ -12,23 +12,28 @@ from __future__ import annotations
 
 import pygame
 
+from src.assets import Assets
+from src.pool import PooledSprite
 from src.settings import Screen
 
 
-class Enemy(pygame.sprite.Sprite):
+class Enemy(PooledSprite):
     """
     Enemy sprite that falls from the top of the screen.
 
     Attributes:
         IMAGE_PATH (str): Path to the enemy image file.
-        SPEED (int): Vertical movement speed of the enemy.
+        SPEED (float): Falling speed of the enemy, in pixels per second.
         image (pygame.Surface): Current enemy image.
         rect (pygame.Rect): Rectangle defining position and size.
+        mask (pygame.mask.Mask): Shared pixel mask for pixel-perfect collisions.
+        y (float): Exact top position; ``rect.y`` is this rounded.
+        prev_y (float): Top position before the last update.
         reached (bool): Whether the enemy has reached the bottom of the screen.
     """
 
     IMAGE_PATH: str = "assets/images/enemy.png"
-    SPEED: int = 3
+    SPEED: float = 180.0
 
     def __init__(self, x: int, y: int) -> None:
         """
@@ -39,16 +44,47 @@ class Enemy(pygame.sprite.Sprite):
             y (int): Initial y-coordinate (top).
         """
         super().__init__()
-        self.image: pygame.Surface = pygame.image.load(self.IMAGE_PATH).convert_alpha()
+        self.image: pygame.Surface = Assets.image(self.IMAGE_PATH)
         self.rect: pygame.Rect = self.image.get_rect(center=(x, y))
+        self.mask: pygame.mask.Mask = Assets.mask(self.IMAGE_PATH)
+        self.y: float = float(self.rect.y)
+        self.prev_y: float = self.y
 
         # True if the enemy reaches the bottom
         self.reached: bool = False
 
+    # ---------------- Pool hooks ----------------
+    def reset(self, x: int, y: int) -> None:
+        """Move the enemy back to a spawn position and clear its state."""
+        self.rect.center = (x, y)
+        self.y = float(self.rect.y)
+        self.prev_y = self.y
+        self.reached = False
+
     # ---------------- Update ----------------
-    def update(self) -> None:
-        """Move enemy downward and check if it reaches the bottom of the screen."""
-        self.rect.y += self.SPEED
+    def update(self, dt: float) -> None:
+        """
+        Move enemy downward and check if it reaches the bottom of the screen.
+
+        Args:
+            dt (float): Elapsed time in seconds.
+        """
+        self.prev_y = self.y
+        self.y += self.SPEED * dt
+        self.rect.y = round(self.y)
         if self.rect.top > Screen.HEIGHT:
             self.reached = True
             # kill is handled in play.py
+
+    # ---------------- Drawing ----------------
+    def interpolate(self, alpha: float) -> tuple[int, int]:
+        """
+        Return the draw position ``alpha`` of the way through the last update.
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the update.
+
+        Returns:
+            tuple[int, int]: Top-left position to blit the image at.
+        """
+        return self.rect.x, round(self.prev_y + (self.y - self.prev_y) * alpha)
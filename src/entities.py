@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+entities.py
+
+Array-backed entity store for Jet Fighter stress modes.
+
+This module defines the :class:`EntityStore` class, which keeps the
+positions, velocities, flags and lifetimes of large numbers of enemies,
+bosses, missiles and explosions in NumPy arrays (structure of arrays).
+Movement, off-screen culling, lifetimes and missile/enemy collisions are
+batch operations over those arrays instead of per-sprite ``update()``
+calls, and drawing blits straight from the position arrays.
+
+NumPy is an optional dependency; :data:`AVAILABLE` is False when it is not
+installed and the sprite-based gameplay is unaffected.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.assets import Assets
+from src.boss import Boss
+from src.enemy import Enemy
+from src.explosion import Explosion
+from src.missile import Missile
+from src.settings import Screen
+
+AVAILABLE: bool = np is not None
+
+# Entity kinds
+ENEMY: int = 0
+BOSS: int = 1
+MISSILE: int = 2
+EXPLOSION: int = 3
+
+
+class EntityStore:
+    """
+    Structure-of-arrays storage for enemies, bosses, missiles and explosions.
+
+    Positions are the top-left corner of each entity. Slots of dead
+    entities are reused by later spawns.
+
+    Attributes:
+        capacity (int): Maximum number of live entities.
+        kind (numpy.ndarray): Entity kind per slot.
+        x, y (numpy.ndarray): Top-left position per slot.
+        prev_y (numpy.ndarray): Top position before the last step.
+        vy (numpy.ndarray): Vertical velocity per slot (pixels per second).
+        alive (numpy.ndarray): Whether the slot holds a live entity.
+        lifetime (numpy.ndarray): Remaining seconds, or -1 for no limit.
+        dropped (int): Spawns refused because the store was full.
+    """
+
+    IMAGES: Dict[int, str] = {
+        ENEMY: Enemy.IMAGE_PATH,
+        BOSS: Boss.IMAGE_PATH,
+        MISSILE: Missile.IMAGE_PATH,
+        EXPLOSION: Explosion.IMAGE_PATH,
+    }
+    VELOCITY: Dict[int, float] = {
+        ENEMY: Enemy.SPEED,
+        BOSS: Enemy.SPEED,
+        MISSILE: -Missile.SPEED,
+        EXPLOSION: 0,
+    }
+    LIFETIME: Dict[int, float] = {
+        ENEMY: -1.0,
+        BOSS: -1.0,
+        MISSILE: -1.0,
+        EXPLOSION: Explosion.DURATION,
+    }
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Allocate the arrays.
+
+        Args:
+            capacity (int): Maximum number of live entities.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if np is None:
+            raise RuntimeError("EntityStore requires NumPy (pip install numpy)")
+
+        self.capacity: int = capacity
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.lifetime = np.zeros(capacity, dtype=np.float32)
+
+        # Per-kind sprite sizes, indexed by kind
+        sizes = [Assets.size(self.IMAGES[k]) for k in sorted(self.IMAGES)]
+        self.widths = np.array([w for w, _ in sizes], dtype=np.float32)
+        self.heights = np.array([h for _, h in sizes], dtype=np.float32)
+
+        self.free: List[int] = list(range(capacity - 1, -1, -1))
+        self.dropped: int = 0
+
+    # ---------------- Spawning ----------------
+    def spawn(self, kind: int, x: float, y: float) -> int:
+        """
+        Add an entity centered at (x, y).
+
+        Args:
+            kind (int): One of ENEMY, BOSS, MISSILE, EXPLOSION.
+            x (float): X-coordinate (center).
+            y (float): Y-coordinate (center).
+
+        Returns:
+            int: The slot index, or -1 if the store is full.
+        """
+        if not self.free:
+            self.dropped += 1
+            return -1
+        i = self.free.pop()
+        self.kind[i] = kind
+        self.x[i] = x - self.widths[kind] / 2
+        self.y[i] = y - self.heights[kind] / 2
+        self.prev_y[i] = self.y[i]
+        self.vy[i] = self.VELOCITY[kind]
+        self.lifetime[i] = self.LIFETIME[kind]
+        self.alive[i] = True
+        return i
+
+    def clear(self) -> None:
+        """Remove every entity, keeping the arrays."""
+        self.alive[:] = False
+        self.free[:] = range(self.capacity - 1, -1, -1)
+        self.dropped = 0
+
+    def release(self, mask) -> None:
+        """Mark the entities selected by a boolean mask as dead."""
+        indices = np.flatnonzero(mask & self.alive)
+        self.alive[indices] = False
+        self.free.extend(indices.tolist())
+
+    def __len__(self) -> int:
+        """Return the number of live entities."""
+        return self.capacity - len(self.free)
+
+    def count(self, kind: int) -> int:
+        """Return the number of live entities of one kind."""
+        return int(np.count_nonzero(self.alive & (self.kind == kind)))
+
+    # ---------------- Update ----------------
+    def step(self, dt: float) -> int:
+        """
+        Move every entity, run lifetimes, and cull off-screen entities.
+
+        Enemies and bosses whose top passes the bottom of the screen and
+        missiles whose bottom passes the top are removed.
+
+        Args:
+            dt (float): Elapsed time in seconds.
+
+        Returns:
+            int: Number of enemies and bosses that reached the bottom.
+        """
+        alive = self.alive
+        np.copyto(self.prev_y, self.y)
+        self.y += self.vy * (alive * np.float32(dt))
+
+        # Lifetimes (explosions)
+        timed = alive & (self.lifetime > 0)
+        self.lifetime[timed] -= np.float32(dt)
+        expired = timed & (self.lifetime <= 0)
+
+        enemy = self.kind <= BOSS
+        reached = alive & enemy & (self.y > Screen.HEIGHT)
+        exited = alive & (self.kind == MISSILE) & (self.y + self.heights[self.kind] < 0)
+
+        self.release(expired | reached | exited)
+        return int(np.count_nonzero(reached))
+
+    def collide(self) -> Tuple[int, int]:
+        """
+        Resolve missile/enemy rectangle overlaps.
+
+        Each missile destroys at most one enemy and each enemy can only be
+        destroyed once; missiles are resolved in slot order. Destroyed
+        enemies leave an explosion behind.
+
+        Returns:
+            tuple[int, int]: (enemies destroyed, bosses among them).
+        """
+        missiles = np.flatnonzero(self.alive & (self.kind == MISSILE))
+        enemies = np.flatnonzero(self.alive & (self.kind <= BOSS))
+        if len(missiles) == 0 or len(enemies) == 0:
+            return 0, 0
+
+        mx, my = self.x[missiles, None], self.y[missiles, None]
+        mw, mh = self.widths[MISSILE], self.heights[MISSILE]
+        ex, ey = self.x[enemies], self.y[enemies]
+        ew, eh = self.widths[self.kind[enemies]], self.heights[self.kind[enemies]]
+        overlap = (mx < ex + ew) & (ex < mx + mw) & (my < ey + eh) & (ey < my + mh)
+
+        hit_missiles: List[int] = []
+        hit_enemies: List[int] = []
+        taken = np.zeros(len(enemies), dtype=bool)
+        for row in np.flatnonzero(overlap.any(axis=1)):
+            candidates = np.flatnonzero(overlap[row] & ~taken)
+            if len(candidates):
+                taken[candidates[0]] = True
+                hit_missiles.append(missiles[row])
+                hit_enemies.append(enemies[candidates[0]])
+
+        if not hit_enemies:
+            return 0, 0
+        hit_enemies_arr = np.array(hit_enemies)
+        bosses = int(np.count_nonzero(self.kind[hit_enemies_arr] == BOSS))
+        centers = [
+            (self.x[i] + self.widths[self.kind[i]] / 2, self.y[i] + self.heights[self.kind[i]] / 2)
+            for i in hit_enemies
+        ]
+
+        mask = np.zeros(self.capacity, dtype=bool)
+        mask[hit_missiles] = True
+        mask[hit_enemies_arr] = True
+        self.release(mask)
+        for cx, cy in centers:
+            self.spawn(EXPLOSION, cx, cy)
+        return len(hit_enemies), bosses
+
+    # ---------------- Drawing ----------------
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """
+        Blit every live entity from the position arrays.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            alpha (float): Fraction of a step elapsed since the last one;
+                positions are interpolated from the previous step.
+        """
+        alive = np.flatnonzero(self.alive)
+        if len(alive) == 0:
+            return
+        kinds = self.kind[alive]
+        xs = self.x[alive].astype(np.int32).tolist()
+        prev_y = self.prev_y[alive]
+        ys = (prev_y + (self.y[alive] - prev_y) * alpha).astype(np.int32).tolist()
+        images = {kind: Assets.image(path) for kind, path in self.IMAGES.items()}
+        surface.blits(
+            [(images[k], (x, y)) for k, x, y in zip(kinds.tolist(), xs, ys)],
+            doreturn=False,
+        )
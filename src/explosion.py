@@ -5,31 +5,34 @@ explosion.py
 Explosion sprite for Jet Fighter.
 
 This module defines the :class:`Explosion` class, which represents a
-temporary visual and audio effect when enemies or missiles are destroyed.
+temporary visual effect when enemies or missiles are destroyed. Its sound
+is played through :class:`src.sounds.SoundBank` by the code that spawns it.
 """
 
 from __future__ import annotations
 
 import pygame
-from src.settings import Screen
 
+from src.assets import Assets
+from src.pool import PooledSprite
 
-class Explosion(pygame.sprite.Sprite):
+
+class Explosion(PooledSprite):
     """
-    Explosion sprite with sound and limited lifetime.
+    Explosion sprite with limited lifetime.
 
     Attributes:
         IMAGE_PATH (str): Path to the explosion image file.
         SOUND_PATH (str): Path to the explosion sound effect.
-        DURATION (int): Lifetime of the explosion in frames.
+        DURATION (float): Lifetime of the explosion in seconds.
         image (pygame.Surface): Current explosion image.
         rect (pygame.Rect): Rectangle defining position and size.
-        timer (int): Remaining frames before the explosion disappears.
+        timer (float): Remaining seconds before the explosion disappears.
     """
 
     IMAGE_PATH: str = "assets/images/explosion.png"
     SOUND_PATH: str = "assets/sounds/explosion.wav"
-    DURATION: int = Screen.FPS // 5  # frames to stay visible (0.2s)
+    DURATION: float = 0.2  # seconds to stay visible
 
     def __init__(self, x: int, y: int) -> None:
         """
@@ -40,21 +43,29 @@ class Explosion(pygame.sprite.Sprite):
             y (int): Initial y-coordinate (top).
         """
         super().__init__()
-        self.image: pygame.Surface = pygame.image.load(self.IMAGE_PATH).convert_alpha()
+        self.image: pygame.Surface = Assets.image(self.IMAGE_PATH)
         self.rect: pygame.Rect = self.image.get_rect(center=(x, y))
-        self.timer: int = self.DURATION
+        self.timer: float = self.DURATION
 
-        # Play explosion sound effect
-        try:
-            explosion_sound = pygame.mixer.Sound(self.SOUND_PATH)
-            explosion_sound.play()
-        except pygame.error:
-            # If sound file missing or mixer not initialized, ignore gracefully
-            pass
+    # ---------------- Pool hooks ----------------
+    def reset(self, x: int, y: int) -> None:
+        """Move the explosion to a new position and restart its timer."""
+        self.rect.center = (x, y)
+        self.timer = self.DURATION
 
     # ---------------- Update ----------------
-    def update(self) -> None:
-        """Countdown timer and remove explosion after duration ends."""
-        self.timer -= 1
+    def update(self, dt: float) -> None:
+        """
+        Countdown timer and remove explosion after duration ends.
+
+        Args:
+            dt (float): Elapsed time in seconds.
+        """
+        self.timer -= dt
         if self.timer <= 0:
             self.kill()
+
+    # ---------------- Drawing ----------------
+    def interpolate(self, alpha: float) -> tuple[int, int]:
+        """Return the draw position; explosions do not move."""
+        return self.rect.topleft
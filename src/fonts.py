@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+fonts.py
+
+Font and rendered-text cache for Jet Fighter.
+
+This module defines the :class:`FontManager` registry, which loads the
+font bundled in ``assets/fonts`` instead of looking up system fonts, keeps
+one ``pygame.font.Font`` per (face, size), and caches rendered text in a
+bounded least-recently-used cache shared by the menus, buttons and HUD.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import pygame
+
+Color = Tuple[int, int, int]
+TextKey = Tuple[str, int, str, Color, bool]
+
+
+class FontManager:
+    """
+    Shared registry of fonts and rendered text.
+
+    Surfaces returned by :meth:`render` are shared between all callers and
+    must be treated as read-only.
+
+    Attributes:
+        DEFAULT_FACE (str): Path to the bundled font.
+        DEFAULT_SCALE (float): Point size factor of the bundled font, the
+            one pygame applies to its built-in default font so text keeps
+            the size of ``SysFont(None, size)``.
+        CACHE_SIZE (int): Maximum number of rendered strings kept.
+        hits (int): Number of renders served from the text cache.
+        misses (int): Number of renders that had to rasterize text.
+        evictions (int): Number of strings dropped from the text cache.
+    """
+
+    DEFAULT_FACE: str = "assets/fonts/freesansbold.ttf"
+    DEFAULT_SCALE: float = 0.6875
+    CACHE_SIZE: int = 256
+
+    _fonts: Dict[Tuple[str, int], pygame.font.Font] = {}
+    _texts: OrderedDict[TextKey, pygame.Surface] = OrderedDict()
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    # ---------------- Fonts ----------------
+    @classmethod
+    def get(cls, size: int, face: str | None = None) -> pygame.font.Font:
+        """
+        Return the shared font for a face and size, loading it on first use.
+
+        If the face file cannot be loaded, pygame's built-in default font
+        is used instead. The default face is drawn at the same scaled size
+        as pygame's built-in font; ``size`` stays the cache key.
+
+        Args:
+            size (int): Nominal font size.
+            face (str | None): Path to a font file, defaults to :attr:`DEFAULT_FACE`.
+
+        Returns:
+            pygame.font.Font: The cached font.
+        """
+        face = face or cls.DEFAULT_FACE
+        font = cls._fonts.get((face, size))
+        if font is None:
+            points = size
+            if face == cls.DEFAULT_FACE:
+                points = max(1, int(size * cls.DEFAULT_SCALE))
+            try:
+                font = pygame.font.Font(face, points)
+            except (pygame.error, FileNotFoundError, OSError):
+                font = pygame.font.Font(None, size)
+            cls._fonts[(face, size)] = font
+        return font
+
+    # ---------------- Text ----------------
+    @classmethod
+    def render(
+        cls,
+        text: str,
+        size: int,
+        color: Color,
+        face: str | None = None,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """
+        Return rendered text, rasterizing it only if it is not cached.
+
+        Args:
+            text (str): Text to render.
+            size (int): Nominal font size.
+            color (tuple[int, int, int]): Text color.
+            face (str | None): Path to a font file, defaults to :attr:`DEFAULT_FACE`.
+            antialias (bool): Whether to antialias the text.
+
+        Returns:
+            pygame.Surface: The cached text surface.
+        """
+        key = (text, size, face or cls.DEFAULT_FACE, tuple(color), antialias)
+        surface = cls._texts.get(key)
+        if surface is not None:
+            cls._texts.move_to_end(key)
+            cls.hits += 1
+            return surface
+
+        cls.misses += 1
+        surface = cls.get(size, face).render(text, antialias, color)
+        cls._texts[key] = surface
+        if len(cls._texts) > cls.CACHE_SIZE:
+            cls._texts.popitem(last=False)
+            cls.evictions += 1
+        return surface
+
+    # ---------------- Statistics ----------------
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """
+        Return cache counters.
+
+        Returns:
+            dict[str, int]: ``fonts`` and ``texts`` cached, plus ``hits``,
+            ``misses`` and ``evictions`` of the text cache.
+        """
+        return {
+            "fonts": len(cls._fonts),
+            "texts": len(cls._texts),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached font and rendered string."""
+        cls._fonts.clear()
+        cls._texts.clear()
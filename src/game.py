@@ -4,8 +4,9 @@ game.py
 
 Main menu and high-level game navigation for Jet Fighter.
 
-This module defines the :class:`Game` class, which manages the main menu,
-state transitions (menu, play, settings), and quitting the application.
+This module defines the :class:`Game` class, the main menu state. It builds
+the application context and the other screens (play, settings) once, and
+navigates between them by pushing them on the context's state stack.
 
 It uses reusable Button and ButtonGroup classes for menu navigation.
 """
@@ -14,50 +15,60 @@ from __future__ import annotations
 
 import pygame
 
+from src.app import AppContext
 from src.button import Button, ButtonGroup
+from src.fonts import FontManager
 from src.play import Play
 from src.settings import Screen, SettingsGUI
+from src.state import State
+from src.viewport import Viewport
 
 
-class Game:
+class Game(State):
     """
-    Main game class handling the menu, navigation, and high-level states.
+    Main menu state, and the owner of the other screens.
 
     Attributes:
-        running (bool): Whether the game loop should continue.
-        state (str): Current state of the game ("menu", "play", "settings").
-        screen (pygame.Surface): The main game screen.
-        clock (pygame.time.Clock): The frame rate controller.
-        title_font (pygame.font.Font): Font used for the main title.
         menu_buttons (ButtonGroup): Buttons displayed on the main menu.
+        play (Play): Gameplay state, reused for every round.
+        settings (SettingsGUI): Settings menu state.
     """
 
+    NAME: str = "menu"
+
     # Background music (disabled by default)
     MUSIC_SOUND: str = "assets/sounds/music.wav"
 
-    def __init__(self) -> None:
-        """Initialize pygame, screen, clock, fonts, and menu buttons."""
-        pygame.init()
-        self.running: bool = True
-        self.state: str = "menu"
+    def __init__(self, app: AppContext | None = None) -> None:
+        """
+        Initialize the menu and build every screen once.
 
-        # Setup display screen
-        self.screen: pygame.Surface = pygame.display.set_mode(
-            (Screen.WIDTH, Screen.HEIGHT)
-        )
-        pygame.display.set_caption("Jet Fighter")
-        self.clock: pygame.time.Clock = pygame.time.Clock()
+        Args:
+            app (AppContext | None): Application context; a new one (which
+                initializes pygame and opens the window) if omitted.
+        """
+        super().__init__(app if app is not None else AppContext())
 
         # Background music setup (commented out for now)
         # pygame.mixer.music.load(self.MUSIC_SOUND)
         # pygame.mixer.music.set_volume(0.2)
         # pygame.mixer.music.play(-1)  # Loop indefinitely
 
-        self.title_font: pygame.font.Font = pygame.font.SysFont(None, 72)
+        # Static menu text is rendered once
+        self.title: pygame.Surface = FontManager.render(
+            "Jet Fighter", 72, (255, 255, 0)
+        )
+        self.footer: pygame.Surface = FontManager.render(
+            "CS50x 2025: Final Project", 20, (200, 200, 200)
+        )
 
         # Create interactive buttons for the main menu
         self.create_buttons()
 
+        # Other screens, switched to without being rebuilt
+        self.play: Play = Play(self.app)
+        self.settings: SettingsGUI = SettingsGUI(self.app)
+
     def create_buttons(self) -> None:
         """Initialize the main menu buttons and group them together."""
         center_x: int = Screen.WIDTH // 2 - 100
@@ -72,79 +83,66 @@ class Game:
         """
         Main loop of the game.
 
-        Continuously checks the current state (menu, play, settings) and
-        executes the appropriate handlers until the game is stopped.
+        Starts at the main menu and runs until the menu is closed; pending
+        score writes are flushed before pygame shuts down.
         """
-        while self.running:
-            self.clock.tick(Screen.FPS)
-
-            if self.state == "menu":
-                self.menu_events()
-                self.menu_draw()
-            elif self.state == "play":
-                self.start_play()
-            elif self.state == "settings":
-                self.open_settings()
-
-        pygame.quit()
+        self.app.push(self)
+        self.app.run()
 
     # ---------------- MENU ----------------
-    def menu_events(self) -> None:
-        """Process events in the main menu (quit, button clicks, navigation)."""
-        for event in pygame.event.get():
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        """
+        Process events in the main menu (quit, button clicks, navigation).
+
+        Args:
+            events (list[pygame.event.Event]): Events from the scheduler.
+        """
+        for event in events:
             if event.type == pygame.QUIT:
-                self.running = False
+                self.quit_game()
+                return
             self.menu_buttons.handle_event(event)
+            if self.app.top is not self:
+                return
 
-    def menu_draw(self) -> None:
+    def draw(self) -> None:
         """Draw the main menu background, title, buttons, and footer."""
         # Background color
         self.screen.fill((0, 0, 30))
 
         # Title
-        title: pygame.Surface = self.title_font.render(
-            "Jet Fighter", True, (255, 255, 0)
-        )
         self.screen.blit(
-            title, (Screen.WIDTH // 2 - title.get_width() // 2, 100)
+            self.title, (Screen.WIDTH // 2 - self.title.get_width() // 2, 100)
         )
 
         # Buttons
         self.menu_buttons.draw(self.screen)
 
         # Footer text
-        footer_font: pygame.font.Font = pygame.font.SysFont(None, 20)
-        footer_text: pygame.Surface = footer_font.render(
-            "CS50x 2025: Final Project", True, (200, 200, 200)
-        )
-        self.screen.blit(footer_text, (10, Screen.HEIGHT - 25))
+        self.screen.blit(self.footer, (10, Screen.HEIGHT - 25))
 
-        pygame.display.flip()
+        Viewport.present()
 
     # ---------------- PLAY ----------------
     def start_play(self) -> None:
         """
-        Start the gameplay loop.
+        Start a new round.
 
-        When the Play loop ends, return to the main menu state.
+        When the round (and its Game Over screen) ends, the menu resumes.
         """
-        play = Play()
-        result: str = play.run()
-        if result == "gameover":
-            self.state = "menu"
+        self.play.start()
+        self.app.push(self.play)
 
     # ---------------- SETTINGS ----------------
     def open_settings(self) -> None:
         """
         Open the settings GUI.
 
-        When settings are closed, return to the main menu state.
+        When settings are closed, the menu resumes.
         """
-        settings = SettingsGUI(self.screen)
-        settings.run()
-        self.state = "menu"
+        self.app.push(self.settings)
 
     # ---------------- QUIT ----------------
     def quit_game(self) -> None:
-        """Exit the game loop and terminate the program."""
-        self.running = False
+        """Close the menu, which ends the application."""
+        self.app.pop()
@@ -4,56 +4,86 @@ gameover.py
 
 Game Over screen for Jet Fighter.
 
-This module defines the :class:`GameOver` class, which displays the final
+This module defines the :class:`GameOver` state, which displays the final
 score, top high scores, and a button to return to the main menu after a game
-session ends.
+session ends. It is built once and shown again for every round.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
 import pygame
 
 from src.button import Button, ButtonGroup
 from src.database import Database
+from src.fonts import FontManager
 from src.settings import Screen
+from src.state import State
+from src.viewport import Viewport
+
+if TYPE_CHECKING:
+    from src.app import AppContext
 
 
-class GameOver:
+class GameOver(State):
     """
     Display the Game Over screen and leaderboard.
 
     Attributes:
         score (int): The player's final score.
         background (pygame.Surface): A snapshot of the screen before game over.
-        screen (pygame.Surface): The active game surface.
-        font_large (pygame.font.Font): Font for large texts.
-        font_small (pygame.font.Font): Font for smaller texts.
         buttons (ButtonGroup): Group of interactive buttons.
-        running (bool): Whether the game over loop is active.
         db (Database): Database instance for retrieving high scores.
+        overlay (pygame.Surface): Dark translucent overlay, built once.
+        records (pygame.Surface | None): Pre-rendered high scores table.
+        backdrop (pygame.Surface): Snapshot, overlay, title, score, and
+            table composed into one surface.
+        rank (Future | None): Resolves to the score's leaderboard rank
+            once it has been saved.
     """
 
-    def __init__(self, score: int, background: pygame.Surface) -> None:
-        """Initialize Game Over screen with score, fonts, and UI elements."""
-        self.score: int = score
-        self.background: pygame.Surface = background
-        self.screen: pygame.Surface = pygame.display.set_mode(
-            (Screen.WIDTH, Screen.HEIGHT)
-        )
+    NAME: str = "gameover"
 
-        # Fonts
-        self.font_large: pygame.font.Font = pygame.font.SysFont(None, 72)
-        self.font_small: pygame.font.Font = pygame.font.SysFont(None, 36)
+    def __init__(self, app: AppContext) -> None:
+        """Initialize Game Over screen with UI elements and buffers."""
+        super().__init__(app)
+        self.score: int = 0
+        self.rank: Future | None = None
 
         # Database connection
-        self.db: Database = Database()
+        self.db: Database = app.db
 
         # Buttons
         self.create_buttons()
 
-        # Control flag
-        self.running: bool = True
-    
+        # Static layers, built once (see compose)
+        self.overlay: pygame.Surface = pygame.Surface(
+            (Screen.WIDTH, Screen.HEIGHT), pygame.SRCALPHA
+        )
+        self.overlay.fill((0, 0, 0, 180))  # Semi-transparent dark overlay
+        self.background: pygame.Surface = self.screen.copy()
+        self.backdrop: pygame.Surface = self.screen.copy()
+        self.records: pygame.Surface | None = None
+        self.records_pos: tuple[int, int] = (0, 0)
+        self.composed_state: tuple[int, bool] | None = None
+
+    def show(self, score: int, rank: Future | None = None) -> None:
+        """
+        Prepare the screen for a finished round before it is pushed.
+
+        The current display contents become the background.
+
+        Args:
+            score (int): The player's final score.
+            rank (Future | None): Resolves to the score's leaderboard rank.
+        """
+        self.score = score
+        self.rank = rank
+        self.background.blit(self.screen, (0, 0))
+        self.composed_state = None
+
     def create_buttons(self) -> None:
         """Initialize the game over screen buttons and group them together."""
         center_x: int = Screen.WIDTH // 2 - 100
@@ -62,99 +92,137 @@ class GameOver:
         ]
         self.buttons: ButtonGroup = ButtonGroup(buttons)
 
-    # ---------------- Main loop ----------------
-    def run(self) -> None:
-        """Run the Game Over loop until the player chooses to exit."""
-        while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                self.buttons.handle_event(event)
+    # ---------------- Frame hooks ----------------
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        """
+        Process events until the player chooses to exit.
 
-            self.draw()
-            pygame.display.flip()
+        Args:
+            events (list[pygame.event.Event]): Events from the scheduler.
+        """
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.close()
+                return
+            self.buttons.handle_event(event)
+            if self.app.top is not self:
+                return
+
+    def update(self) -> None:
+        """Redraw when the leaderboard or rank changed while idle."""
+        if self.composed_state != (Database.version, self.rank_ready()):
+            self.scheduler.request_redraw()
 
     # ---------------- Actions ----------------
     def close(self) -> None:
         """Close the Game Over screen and return control to the main menu."""
-        self.running = False
+        self.app.pop()
     
     # ---------------- Records ----------------
-    def draw_records(self) -> None:
+    def render_records(self) -> pygame.Surface:
         """
-        Draw the top high scores table centered on the screen.
-        Uses font_large for headers and font_small for table rows.
+        Render the top high scores table onto its own surface.
+        Headers and rows come from the shared text cache.
+
+        Returns:
+            pygame.Surface: The table, to be blitted at ``self.records_pos``.
         """
-        # Fetch top 5 scores
+        # Fetch top 5 scores (served from the leaderboard cache)
         high_scores = self.db.get_high_scores(5)
 
-        # Table layout
-        header_y = 220
+        # Table layout, relative to the table surface
         row_height = 40
         col_widths = [100, 150, 200]  # Score, Difficulty, Date
         table_width = sum(col_widths) + 40  # extra padding
-        start_x = (Screen.WIDTH - table_width) // 2
 
         # Column positions
-        col_score = start_x
+        col_score = 0
         col_difficulty = col_score + col_widths[0] + 20
         col_date = col_difficulty + col_widths[1] + 20
 
+        # Rendered rows; the surface grows to fit the widest date
+        rows = [
+            [FontManager.render(str(value), 36, (255, 255, 255)) for value in record]
+            for record in high_scores
+        ]
+        surface_width = max(
+            [table_width] + [col_date + date.get_width() for _, _, date in rows]
+        )
+        table = pygame.Surface((surface_width, 50 + 5 * row_height), pygame.SRCALPHA)
+
         # Draw headers
-        header_score = self.font_small.render("Score", True, (255, 255, 0))
-        header_difficulty = self.font_small.render("Difficulty", True, (255, 255, 0))
-        header_date = self.font_small.render("Date", True, (255, 255, 0))
+        header_score = FontManager.render("Score", 36, (255, 255, 0))
+        header_difficulty = FontManager.render("Difficulty", 36, (255, 255, 0))
+        header_date = FontManager.render("Date", 36, (255, 255, 0))
 
-        self.screen.blit(header_score, (col_score, header_y))
-        self.screen.blit(header_difficulty, (col_difficulty, header_y))
-        self.screen.blit(header_date, (col_date, header_y))
+        table.blit(header_score, (col_score, 0))
+        table.blit(header_difficulty, (col_difficulty, 0))
+        table.blit(header_date, (col_date, 0))
 
         # Draw line under headers
         pygame.draw.line(
-            self.screen, (255, 255, 255),
-            (start_x, header_y + 40),
-            (start_x + table_width, header_y + 40),
+            table, (255, 255, 255),
+            (0, 40),
+            (table_width, 40),
             2
         )
 
         # Draw rows
-        row_y = header_y + 50
-        for score, difficulty, created_at in high_scores:
-            score_text = self.font_small.render(str(score), True, (255, 255, 255))
-            difficulty_text = self.font_small.render(str(difficulty), True, (255, 255, 255))
-            date_text = self.font_small.render(str(created_at), True, (255, 255, 255))
-
-            self.screen.blit(score_text, (col_score, row_y))
-            self.screen.blit(difficulty_text, (col_difficulty, row_y))
-            self.screen.blit(date_text, (col_date, row_y))
+        row_y = 50
+        for score_text, difficulty_text, date_text in rows:
+            table.blit(score_text, (col_score, row_y))
+            table.blit(difficulty_text, (col_difficulty, row_y))
+            table.blit(date_text, (col_date, row_y))
 
             row_y += row_height
 
+        self.records_pos = ((Screen.WIDTH - table_width) // 2, 220)
+        return table
+
     # ---------------- Drawing ----------------
-    def draw(self) -> None:
-        """Render the Game Over screen with final score and high scores."""
-        # Background snapshot
-        self.screen.blit(self.background, (0, 0))
-        overlay = pygame.Surface((Screen.WIDTH, Screen.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Semi-transparent dark overlay
-        self.screen.blit(overlay, (0, 0))
+    def rank_ready(self) -> bool:
+        """Return True once the score's rank is known."""
+        return (
+            self.rank is not None and self.rank.done() and self.rank.exception() is None
+        )
+
+    def compose(self) -> None:
+        """
+        Pre-render everything except the buttons into one backdrop.
+
+        Re-run only when the leaderboard changed or the rank arrived.
+        """
+        self.backdrop.blit(self.background, (0, 0))
+        self.backdrop.blit(self.overlay, (0, 0))
 
         # "Game Over" title
-        title = self.font_large.render("Game Over", True, (255, 0, 0))
-        self.screen.blit(
+        title = FontManager.render("Game Over", 72, (255, 0, 0))
+        self.backdrop.blit(
             title, (Screen.WIDTH // 2 - title.get_width() // 2, 100)
         )
 
-        # Final score
-        score_text = self.font_small.render(
-            f"Your Score: {self.score}", True, (255, 255, 255)
-        )
-        self.screen.blit(
+        # Final score (with its rank once the score has been saved)
+        label = f"Your Score: {self.score}"
+        if self.rank_ready():
+            label += f"  (Rank #{self.rank.result()})"
+        score_text = FontManager.render(label, 36, (255, 255, 255))
+        self.backdrop.blit(
             score_text, (Screen.WIDTH // 2 - score_text.get_width() // 2, 150)
         )
 
-        # Draw top scores
-        self.draw_records()
+        # Top scores table
+        self.records = self.render_records()
+        self.backdrop.blit(self.records, self.records_pos)
+
+        self.composed_state = (Database.version, self.rank_ready())
+
+    def draw(self) -> None:
+        """Render the Game Over screen with final score and high scores."""
+        if self.composed_state != (Database.version, self.rank_ready()):
+            self.compose()
+        self.screen.blit(self.backdrop, (0, 0))
 
         # Buttons
         self.buttons.draw(self.screen)
+
+        Viewport.present()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+hud.py
+
+Background and HUD compositor for Jet Fighter.
+
+This module defines the :class:`Hud` class, which prepares the scaled
+background and HUD icons once, re-renders counter text only when a value
+changes, and otherwise blits a single cached HUD layer every frame.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import pygame
+
+from src.assets import Assets
+from src.fonts import FontManager
+from src.settings import Screen
+
+
+class Hud:
+    """
+    Cached background and HUD layer for the gameplay screen.
+
+    Attributes:
+        ICON_SIZE (tuple[int, int]): Size the HUD icons are scaled to.
+        TEXT_COLOR (tuple[int, int, int]): Color of the counter text.
+        HEIGHT (int): Height of the cached HUD layer (top of the screen).
+        background (pygame.Surface): Scaled background in display format.
+        layer (pygame.Surface): Composited HUD layer.
+        renders (int): Number of counter text changes (served by the
+            shared text cache).
+    """
+
+    ICON_SIZE: Tuple[int, int] = (40, 40)
+    TEXT_COLOR: Tuple[int, int, int] = (255, 255, 255)
+    HEIGHT: int = 130
+
+    def __init__(
+        self,
+        font_size: int,
+        score_image: str,
+        heart_image: str,
+        missile_image: str,
+    ) -> None:
+        """
+        Prepare the background, icons, and an empty HUD layer.
+
+        Args:
+            font_size (int): Font size of the counters.
+            score_image (str): Path to the score icon.
+            heart_image (str): Path to the heart icon.
+            missile_image (str): Path to the missile icon.
+        """
+        self.font_size: int = font_size
+
+        # Background scaled and converted once (no per-pixel alpha needed)
+        self.background: pygame.Surface = pygame.transform.scale(
+            Assets.image(Screen.BACKGROUND_IMAGE), (Screen.WIDTH, Screen.HEIGHT)
+        )
+        if pygame.display.get_surface() is not None:
+            self.background = self.background.convert()
+
+        # Icons scaled once, with their positions on the HUD layer
+        self.icons: list[tuple[pygame.Surface, tuple[int, int]]] = [
+            (pygame.transform.scale(Assets.image(score_image), self.ICON_SIZE), (20, 20)),
+            (pygame.transform.scale(Assets.image(heart_image), self.ICON_SIZE),
+             (Screen.WIDTH - 150, 20)),
+            (pygame.transform.scale(Assets.image(missile_image), self.ICON_SIZE),
+             (Screen.WIDTH - 150, 80)),
+        ]
+
+        # Counter name -> (value, rendered text, position)
+        self.counters: Dict[str, tuple[int | None, pygame.Surface | None, tuple[int, int]]] = {
+            "score": (None, None, (70, 25)),
+            "hearts": (None, None, (Screen.WIDTH - 100, 25)),
+            "missiles": (None, None, (Screen.WIDTH - 100, 85)),
+        }
+
+        self.layer: pygame.Surface = pygame.Surface(
+            (Screen.WIDTH, self.HEIGHT), pygame.SRCALPHA
+        )
+        self.renders: int = 0
+
+    # ---------------- Counters ----------------
+    def set_counter(self, name: str, value: int, text: str) -> bool:
+        """
+        Update a counter, re-rendering its text only if the value changed.
+
+        Args:
+            name (str): Counter name ("score", "hearts" or "missiles").
+            value (int): New counter value.
+            text (str): Text to render for the value.
+
+        Returns:
+            bool: True if the counter changed.
+        """
+        old_value, _, pos = self.counters[name]
+        if old_value == value:
+            return False
+        rendered = FontManager.render(text, self.font_size, self.TEXT_COLOR)
+        self.counters[name] = (value, rendered, pos)
+        self.renders += 1
+        return True
+
+    def compose(self) -> None:
+        """Rebuild the cached HUD layer from icons and counter text."""
+        self.layer.fill((0, 0, 0, 0))
+        for icon, pos in self.icons:
+            self.layer.blit(icon, pos)
+        for _, rendered, pos in self.counters.values():
+            if rendered is not None:
+                self.layer.blit(rendered, pos)
+
+    # ---------------- Drawing ----------------
+    def draw_background(self, surface: pygame.Surface) -> None:
+        """Blit the prepared background."""
+        surface.blit(self.background, (0, 0))
+
+    def update(self, score: int, hearts: int, missiles: int) -> bool:
+        """
+        Update the counters, recomposing the HUD layer only if one changed.
+
+        Args:
+            score (int): Current score.
+            hearts (int): Hearts remaining.
+            missiles (int): Missiles remaining.
+
+        Returns:
+            bool: True if the HUD layer was recomposed.
+        """
+        changed = self.set_counter("score", score, str(score))
+        changed |= self.set_counter("hearts", hearts, f"x{hearts}")
+        changed |= self.set_counter("missiles", missiles, f"x{missiles}")
+        if changed:
+            self.compose()
+        return changed
+
+    def draw(self, surface: pygame.Surface, score: int, hearts: int, missiles: int) -> None:
+        """
+        Blit the HUD layer, recomposing it only when a counter changed.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            score (int): Current score.
+            hearts (int): Hearts remaining.
+            missiles (int): Missiles remaining.
+        """
+        self.update(score, hearts, missiles)
+        surface.blit(self.layer, (0, 0))
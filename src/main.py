@@ -14,6 +14,8 @@ This file's purpose is intentionally minimal: start the program.
 
 from __future__ import annotations
 
+import logging
+
 from src.game import Game
 
 
@@ -24,6 +26,7 @@ def main() -> None:
     This function intentionally performs no additional logic so that
     initialization and teardown are handled by the Game class.
     """
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
     game = Game()
     game.run()
 
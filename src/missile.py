@@ -12,20 +12,26 @@ from __future__ import annotations
 
 import pygame
 
+from src.assets import Assets
+from src.pool import PooledSprite
 
-class Missile(pygame.sprite.Sprite):
+
+class Missile(PooledSprite):
     """
     Player missile sprite.
 
     Attributes:
         IMAGE_PATH (str): Path to the missile image file.
-        SPEED (int): Vertical speed of the missile (moves upward).
+        SPEED (float): Upward speed of the missile, in pixels per second.
         image (pygame.Surface): Current missile image.
         rect (pygame.Rect): Rectangle defining position and size.
+        mask (pygame.mask.Mask): Shared pixel mask for pixel-perfect collisions.
+        y (float): Exact top position; ``rect.y`` is this rounded.
+        prev_y (float): Top position before the last update.
     """
 
     IMAGE_PATH: str = "assets/images/missile.png"
-    SPEED: int = 7
+    SPEED: float = 420.0
 
     def __init__(self, x: int, y: int) -> None:
         """
@@ -36,12 +42,42 @@ class Missile(pygame.sprite.Sprite):
             y (int): Initial y-coordinate (top).
         """
         super().__init__()
-        self.image: pygame.Surface = pygame.image.load(self.IMAGE_PATH).convert_alpha()
+        self.image: pygame.Surface = Assets.image(self.IMAGE_PATH)
         self.rect: pygame.Rect = self.image.get_rect(center=(x, y))
+        self.mask: pygame.mask.Mask = Assets.mask(self.IMAGE_PATH)
+        self.y: float = float(self.rect.y)
+        self.prev_y: float = self.y
+
+    # ---------------- Pool hooks ----------------
+    def reset(self, x: int, y: int) -> None:
+        """Move the missile back to its launch position."""
+        self.rect.center = (x, y)
+        self.y = float(self.rect.y)
+        self.prev_y = self.y
 
     # ---------------- Update ----------------
-    def update(self) -> None:
-        """Move the missile upward and remove it if it leaves the screen."""
-        self.rect.y -= self.SPEED
+    def update(self, dt: float) -> None:
+        """
+        Move the missile upward and remove it if it leaves the screen.
+
+        Args:
+            dt (float): Elapsed time in seconds.
+        """
+        self.prev_y = self.y
+        self.y -= self.SPEED * dt
+        self.rect.y = round(self.y)
         if self.rect.bottom < 0:
             self.kill()
+
+    # ---------------- Drawing ----------------
+    def interpolate(self, alpha: float) -> tuple[int, int]:
+        """
+        Return the draw position ``alpha`` of the way through the last update.
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the update.
+
+        Returns:
+            tuple[int, int]: Top-left position to blit the image at.
+        """
+        return self.rect.x, round(self.prev_y + (self.y - self.prev_y) * alpha)
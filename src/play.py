@@ -2,52 +2,69 @@
 """
 play.py
 
-Gameplay loop and logic for Jet Fighter.
-
-This module defines the :class:`Play` class, which manages the player,
-enemies, bosses, projectiles, explosions, collisions, HUD, and end-game
-sequence. It represents the "play" state of the game.
+Gameplay loop for Jet Fighter.
+
+This module defines the :class:`Play` state, which owns the input polling,
+audio, HUD, and end-game sequence of a round. It is built once and reused
+for every round; the world state and per-tick game logic live in a
+:class:`src.simulation.Simulation` that is likewise built once and reset
+at the start of each round. The simulation runs at the
+fixed :attr:`src.settings.Game.TICK_RATE` whatever the rendered frame
+rate, and sprites are drawn interpolated between the last two ticks.
 """
 
 from __future__ import annotations
 
-import random
-from typing import Tuple
+import math
+from typing import TYPE_CHECKING
 
 import pygame
 
+from src.assets import Assets
 from src.boss import Boss
-from src.database import Database
+from src.database import ScoreWriter, SessionTelemetry
 from src.enemy import Enemy
 from src.explosion import Explosion
+from src.hud import Hud
 from src.missile import Missile
 from src.player import Player
-from src.settings import Screen, Game as GameConfig
+from src.profiler import FrameProfiler
+from src.renderer import DirtyRenderer
+from src.replay import Replay, ReplayRecorder
+from src.scheduler import FixedStep
+from src.settings import Screen, Game as GameConfig, Profiling, Recording
+from src.simulation import InputFrame, Simulation
+from src.sounds import SoundBank
+from src.state import State
+from src.viewport import Viewport
 from src.gameover import GameOver
 
+if TYPE_CHECKING:
+    from src.app import AppContext
+
 
-class Play:
+class Play(State):
     """
-    Handle the main game loop and gameplay logic.
+    Handle the main game loop: input, simulation, audio, and drawing.
 
     Attributes:
-        running (bool): Whether the gameplay loop is running.
-        db (Database): Database instance for saving scores.
-        screen (pygame.Surface): The active game display surface.
-        clock (pygame.time.Clock): Controls frame rate.
-        all_sprites (pygame.sprite.Group): All active sprites.
-        enemies (pygame.sprite.Group): All enemy sprites.
-        missiles (pygame.sprite.Group): All missile sprites.
-        player (Player): The player-controlled jet fighter.
-        score (int): Current score of the player.
-        heart_remaining (int): Number of lives left.
-        missiles_remaining (int): Number of missiles available.
-        font (pygame.font.Font): Font for HUD elements.
-        score_image, heart_image, missile_image (pygame.Surface):
-            HUD icons for score, heart, and missiles.
+        sim (Simulation): World state and gameplay logic, reset every round.
+        fire_presses (int): Fire key presses collected for the next tick.
+        replay (Replay | None): Replay supplying input instead of the keyboard.
+        speed (float): Playback speed multiplier for replays.
+        timestep (FixedStep): Runs the simulation ticks due each frame.
+        recorder (ReplayRecorder | None): Records this session's input.
+        telemetry (SessionTelemetry | None): Measures this live session.
+        hud (Hud): Cached background and HUD layer.
+        renderer (DirtyRenderer | None): Dirty-rectangle renderer, if enabled.
+        game_over (GameOver): Screen shown when a live round ends.
+        profiler (FrameProfiler): Per-phase frame timings and overlay.
     """
 
-    # HUD image paths
+    NAME: str = "play"
+
+    # HUD font size and image paths
+    FONT_SIZE: int = 36
     SCORE_IMAGE: str = "assets/images/score.png"
     HEART_IMAGE: str = "assets/images/heart.png"
     MISSILE_IMAGE: str = "assets/images/missile.png"
@@ -57,253 +74,269 @@ class Play:
     GAMEOVER_SOUND: str = "assets/sounds/gameover.wav"
     GAMESTART_SOUND: str = "assets/sounds/gamestart.wav"
 
-    def __init__(self) -> None:
-        """Initialize pygame, screen, player, sprite groups, and HUD."""
-        pygame.init()
-
-        # Database connection
-        self.db: Database = Database()
+    def __init__(self, app: AppContext) -> None:
+        """
+        Prepare sounds, images, and HUD once; see :meth:`start` for a round.
 
-        # Game loop control
-        self.running: bool = True
+        Args:
+            app (AppContext): The application context.
+        """
+        super().__init__(app, fps=Screen.FPS)
 
         # Screen setup
-        self.screen: pygame.Surface = pygame.display.set_mode(
-            (Screen.WIDTH, Screen.HEIGHT)
+        pygame.display.set_icon(Assets.image(Player.IMAGE_PATH))
+
+        # Decode every gameplay image up front so no disk I/O happens in-frame
+        Assets.preload(
+            Player.IMAGE_PATH,
+            Enemy.IMAGE_PATH,
+            Boss.IMAGE_PATH,
+            Missile.IMAGE_PATH,
+            Explosion.IMAGE_PATH,
+            Screen.BACKGROUND_IMAGE,
+            self.SCORE_IMAGE,
+            self.HEART_IMAGE,
+            self.MISSILE_IMAGE,
         )
-        pygame.display.set_caption("Jet Fighter")
-        pygame.display.set_icon(pygame.image.load(Player.IMAGE_PATH))
-        self.clock: pygame.time.Clock = pygame.time.Clock()
-
-        # Sprite groups
-        self.all_sprites: pygame.sprite.Group = pygame.sprite.Group()
-        self.enemies: pygame.sprite.Group = pygame.sprite.Group()
-        self.missiles: pygame.sprite.Group = pygame.sprite.Group()
-
-        # Player setup
-        player_height: int = pygame.image.load(Player.IMAGE_PATH).get_height()
-        self.player: Player = Player(
-            Screen.WIDTH // 2, Screen.HEIGHT - player_height
-        )
-        self.all_sprites.add(self.player)
 
-        # Difficulty configuration (enemy spawn rate and max enemies)
-        self.enemy_spawn_rate, self.enemy_limit = self.get_difficulty(
-            GameConfig.DIFFICULTY
+        # Sound effects (decoded once per process, bounded voices each)
+        SoundBank.register("explosion", Explosion.SOUND_PATH, voices=4)
+        SoundBank.register("milestone", self.MILESTONE_SOUND)
+        SoundBank.register("gamestart", self.GAMESTART_SOUND, steal=False)
+        SoundBank.register("gameover", self.GAMEOVER_SOUND, steal=False)
+        SoundBank.load()
+
+        # Background and HUD layer (icons scaled once)
+        self.hud: Hud = Hud(
+            self.FONT_SIZE, self.SCORE_IMAGE, self.HEART_IMAGE, self.MISSILE_IMAGE
         )
+        self.dirty_renderer: DirtyRenderer = DirtyRenderer(self.hud)
 
-        # Player stats
-        self.score: int = 0
-        self.heart_remaining: int = GameConfig.HEART
-        self.missiles_remaining: int = GameConfig.MISSILES
-
-        # Fonts
-        self.font: pygame.font.Font = pygame.font.SysFont(None, 36)
-
-        # HUD images
-        self.score_image: pygame.Surface = pygame.image.load(
-            self.SCORE_IMAGE
-        ).convert_alpha()
-        self.heart_image: pygame.Surface = pygame.image.load(
-            self.HEART_IMAGE
-        ).convert_alpha()
-        self.missile_image: pygame.Surface = pygame.image.load(
-            self.MISSILE_IMAGE
-        ).convert_alpha()
-
-    # ---------------- Difficulty ----------------
-    def get_difficulty(self, difficulty: str) -> Tuple[int, int]:
-        """
-        Return spawn rate (in frames) and enemy limit based on difficulty.
+        self.game_over: GameOver = GameOver(app)
+        self.profiler: FrameProfiler = FrameProfiler()
 
-        Args:
-            difficulty (str): The current difficulty level.
+        # World state, built once and reset by every round
+        self.sim: Simulation = Simulation()
+        self.profiler.attach(self.sim)
 
-        Returns:
-            tuple[int, int]: (enemy_spawn_rate, enemy_limit).
-        """
-        match difficulty:
-            case "Easy":
-                return int(Screen.FPS), 2
-            case "Hard":
-                return int(Screen.FPS), 5
-            case _:
-                return int(Screen.FPS), 3
-
-    # ---------------- Run ----------------
-    def run(self) -> str:
+    # ---------------- Round ----------------
+    def start(self, replay: Replay | None = None, speed: float = 1.0) -> None:
         """
-        Run the gameplay loop until game over.
+        Set up a new round; push the state afterwards to play it.
 
-        Returns:
-            str: "gameover" when the game ends.
+        Args:
+            replay (Replay | None): Play back this replay instead of
+                reading the keyboard.
+            speed (float): Playback speed multiplier for replays.
         """
-        # Start sound
-        pygame.mixer.Sound(self.GAMESTART_SOUND).play()
-
-        while self.running:
-            self.clock.tick(Screen.FPS)
-            self.handle_events()
-            self.update()
-            self.draw()
-
-        return "gameover"
+        # World state and game logic
+        self.replay: Replay | None = replay
+        self.speed: float = speed
+        if replay is not None:
+            self.sim.reset(
+                replay.difficulty, seed=replay.seed, collision=replay.collision,
+                stress=replay.stress,
+            )
+            tick_rate = replay.tick_rate
+        else:
+            self.sim.reset(GameConfig.DIFFICULTY)
+            tick_rate = GameConfig.TICK_RATE
+        # Faster playback runs more ticks per frame, so the cap scales too
+        self.timestep: FixedStep = FixedStep(
+            tick_rate, max(1, math.ceil(GameConfig.MAX_CATCHUP * speed))
+        )
+        self.profiler.start_round()
+        self.fire_presses: int = 0
+
+        # Input recording (live sessions only)
+        self.recorder: ReplayRecorder | None = None
+        if Recording.ENABLED and replay is None:
+            self.recorder = ReplayRecorder(self.sim, tick_rate)
+
+        # Session telemetry (live sessions only, saved when the round ends)
+        self.telemetry: SessionTelemetry | None = None
+        if replay is None:
+            self.telemetry = SessionTelemetry(self.sim.difficulty, 1000 / Screen.FPS)
+
+        # Optional dirty-rectangle rendering (stress mode needs full redraws)
+        self.renderer: DirtyRenderer | None = None
+        if Screen.DIRTY_RECTS and self.sim.swarm is None:
+            self.renderer = self.dirty_renderer
+            self.renderer.invalidate()
+
+    def enter(self) -> None:
+        """Play the start sound when the round begins."""
+        super().enter()
+        SoundBank.play("gamestart")
+
+    def exit(self) -> None:
+        """Save the round's input and telemetry when leaving gameplay."""
+        super().exit()
+        self.timestep.log_report(self.NAME)
+        self.sim.log_pool_report()
+        self.save_replay()
+        self.save_telemetry()
+        self.profiler.flush()
 
     # ---------------- Events ----------------
-    def handle_events(self) -> None:
-        """Process player input events (quit, fire missile, etc.)."""
-        for event in pygame.event.get():
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        """
+        Process player input events (quit, fire missile, etc.).
+
+        Args:
+            events (list[pygame.event.Event]): Events of this frame.
+        """
+        self.profiler.begin()
+        SoundBank.begin_frame()
+        for event in events:
             if event.type == pygame.QUIT:
-                self.running = False
+                self.app.pop()
+                return
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and self.missiles_remaining > 0:
-                    self.fire_missile()
+                if event.key == pygame.K_SPACE:
+                    self.fire_presses += 1
+                elif event.key == Profiling.TOGGLE_KEY:
+                    self.toggle_profiler()
+        self.profiler.lap("events")
+
+    def toggle_profiler(self) -> None:
+        """Show or hide the profiler overlay."""
+        self.profiler.toggle()
+        if self.renderer is not None:
+            # The overlay is drawn on full frames only
+            self.renderer.invalidate()
+
+    def read_input(self) -> InputFrame:
+        """
+        Build the input frame for the next tick.
 
-    def fire_missile(self) -> None:
-        """Fire a missile from the player jet."""
-        missile = Missile(self.player.rect.centerx, self.player.rect.top)
-        self.all_sprites.add(missile)
-        self.missiles.add(missile)
-        self.missiles_remaining -= 1
+        Input comes from the replay if one is playing, otherwise from the
+        keyboard state and the fire presses collected this frame (which
+        all go to the first tick of the frame).
+
+        Returns:
+            InputFrame: Held movement keys, fire presses and tick length.
+        """
+        if self.replay is not None:
+            return self.replay.frames[self.sim.ticks]
 
-    # ---------------- Update ----------------
-    def update(self) -> None:
-        """Update player, enemies, collisions, and check game conditions."""
         keys = pygame.key.get_pressed()
-        self.player.update(keys)
+        frame = InputFrame(
+            left=bool(keys[pygame.K_LEFT]),
+            right=bool(keys[pygame.K_RIGHT]),
+            fire=self.fire_presses,
+            dt=self.timestep.step,
+        )
+        self.fire_presses = 0
+        return frame
 
-        # Game over check
-        if self.heart_remaining <= 0 or (
-            self.missiles_remaining <= 0 and len(self.missiles) == 0
-        ):
+    # ---------------- Update ----------------
+    def update(self) -> None:
+        """Run the simulation ticks due since the last frame."""
+        elapsed = self.scheduler.frame_ms / 1000 * self.speed
+        for _ in range(self.timestep.advance(elapsed)):
+            if self.replay is not None and self.sim.ticks >= len(self.replay.frames):
+                self.app.pop()
+                return
+            self.step()
+            if self.sim.over:
+                break
+
+        if self.telemetry is not None:
+            swarm = len(self.sim.swarm) if self.sim.swarm is not None else 0
+            self.telemetry.record_frame(
+                self.scheduler.frame_ms, len(self.sim.all_sprites) + swarm
+            )
+        self.profiler.lap("update")
+
+        if self.sim.over:
             self.end_game()
-            return
-
-        # Update non-player sprites
-        for sprite in self.all_sprites:
-            if sprite != self.player:
-                sprite.update()
 
-        # Enemy spawning logic
-        if len(self.enemies) < self.enemy_limit:
-            if random.randint(1, self.enemy_spawn_rate) == 1:
-                self.spawn_enemy()
+    def step(self) -> None:
+        """Advance the simulation one tick and play its sound events."""
+        frame = self.read_input()
+        if self.recorder is not None:
+            self.recorder.record(frame)
+        self.sim.step(frame)
 
-        # Rare boss spawn
-        if random.randint(1, self.enemy_spawn_rate * 10) == 1:
-            self.spawn_enemy(is_boss=True)
-
-        # Collision detection
-        self.handle_collisions()
-
-    def spawn_enemy(self, is_boss: bool = False) -> None:
-        """
-        Spawn a new enemy or boss at a random x position.
-
-        Args:
-            is_boss (bool): Whether to spawn a boss instead of a normal enemy.
-        """
-        sprite_cls = Boss if is_boss else Enemy
-        enemy_half_width: int = pygame.image.load(
-            Enemy.IMAGE_PATH
-        ).get_width() // 2
-
-        enemy = sprite_cls(
-            random.randint(enemy_half_width, Screen.WIDTH - enemy_half_width),
-            -enemy_half_width,
-        )
-        self.all_sprites.add(enemy)
-        self.enemies.add(enemy)
-
-    def handle_collisions(self) -> None:
-        """Handle missile-enemy, enemy-player, and enemy-bottom collisions."""
-        # Missile-enemy collisions
-        hits = pygame.sprite.groupcollide(
-            self.missiles, self.enemies, True, True
-        )
-        for _, enemies_hit in hits.items():
-            for enemy in enemies_hit:
-                # Missile reward
-                self.missiles_remaining += 3 if isinstance(enemy, Boss) else 1
-                self.score += 1
-
-                # Explosion
-                explosion = Explosion(enemy.rect.centerx, enemy.rect.centery)
-                self.all_sprites.add(explosion)
-
-                # Milestone sound every 10 points
-                if self.score % 10 == 0:
-                    pygame.mixer.Sound(self.MILESTONE_SOUND).play()
-
-        # Enemy-player collisions
-        hits = pygame.sprite.spritecollide(self.player, self.enemies, True)
-        for hit in hits:
-            self.heart_remaining -= 1
-            explosion = Explosion(hit.rect.centerx, hit.rect.centery)
-            self.player.blink()
-            self.all_sprites.add(explosion)
-
-        # Enemies reaching the bottom
-        for enemy in list(self.enemies):
-            if enemy.reached:
-                self.heart_remaining -= 1
-                enemy.kill()
+        for name in self.sim.events:
+            SoundBank.play(name)
 
     # ---------------- Draw ----------------
     def draw(self) -> None:
         """Render background, sprites, HUD, and flip the display."""
-        background = pygame.transform.scale(
-            pygame.image.load(Screen.BACKGROUND_IMAGE),
-            (Screen.WIDTH, Screen.HEIGHT),
-        )
-        self.screen.blit(background, (0, 0))
+        if self.renderer is not None and not self.profiler.visible:
+            # Presents its own dirty rectangles (timed as "draw")
+            self.renderer.draw(
+                self.screen,
+                self.sim.all_sprites,
+                self.sim.score,
+                self.sim.heart_remaining,
+                self.sim.missiles_remaining,
+            )
+            self.profiler.lap("draw")
+            self.profiler.end(self.sim)
+            return
+
+        self.hud.draw_background(self.screen)
 
-        # Draw sprites
-        self.all_sprites.draw(self.screen)
+        # Draw sprites between their last two tick positions
+        alpha = self.timestep.alpha
+        self.screen.blits(
+            [(sprite.image, sprite.interpolate(alpha)) for sprite in self.sim.all_sprites],
+            doreturn=False,
+        )
+        if self.sim.swarm is not None:
+            self.sim.swarm.draw(self.screen, alpha)
 
         # Draw HUD
         self.draw_hud()
+        self.profiler.draw(self.screen)
+        self.profiler.lap("draw")
 
-        pygame.display.flip()
+        Viewport.present()
+        self.profiler.lap("flip")
+        self.profiler.end(self.sim)
 
     def draw_hud(self) -> None:
         """Draw score, hearts, and missiles counters on the HUD."""
-        font_count = pygame.font.SysFont(None, 36)
-
-        # Score (top-left)
-        score_icon = pygame.transform.scale(self.score_image, (40, 40))
-        self.screen.blit(score_icon, (20, 20))
-        score_text = font_count.render(str(self.score), True, (255, 255, 255))
-        self.screen.blit(score_text, (70, 25))
-
-        # Hearts (top-right)
-        heart_icon = pygame.transform.scale(self.heart_image, (40, 40))
-        self.screen.blit(heart_icon, (Screen.WIDTH - 150, 20))
-        heart_text = font_count.render(
-            f"x{self.heart_remaining}", True, (255, 255, 255)
+        self.hud.draw(
+            self.screen,
+            self.sim.score,
+            self.sim.heart_remaining,
+            self.sim.missiles_remaining,
         )
-        self.screen.blit(heart_text, (Screen.WIDTH - 100, 25))
 
-        # Missiles (below hearts)
-        missile_icon = pygame.transform.scale(self.missile_image, (40, 40))
-        self.screen.blit(missile_icon, (Screen.WIDTH - 150, 80))
-        missile_text = font_count.render(
-            f"x{self.missiles_remaining}", True, (255, 255, 255)
+    # ---------------- End game ----------------
+    def save_replay(self) -> None:
+        """Write the recorded session to :attr:`Recording.PATH` once."""
+        if self.recorder is not None:
+            self.recorder.save(Recording.PATH)
+            self.recorder = None
+
+    def save_telemetry(self) -> None:
+        """Queue the session's telemetry for one batched write, once."""
+        if self.telemetry is None:
+            return
+        sim = self.sim
+        self.telemetry.finish(
+            sim.score, sim.missiles_fired, sim.missile_hits, sim.boss_kills
         )
-        self.screen.blit(missile_text, (Screen.WIDTH - 100, 85))
+        ScoreWriter.shared().submit_session(self.telemetry)
+        self.telemetry = None
 
-    # ---------------- End game ----------------
     def end_game(self) -> None:
         """Stop gameplay, save score, play sound, and show Game Over screen."""
-        self.running = False
-        self.db.save_score(self.score, GameConfig.DIFFICULTY)
+        if self.replay is not None:
+            self.app.pop()
+            return
 
-        # Game over sound
-        pygame.mixer.Sound(self.GAMEOVER_SOUND).play()
+        # Saved on the writer thread; the rank arrives through the future
+        rank = ScoreWriter.shared().submit(self.sim.score, GameConfig.DIFFICULTY)
 
-        # Capture screen
-        background_snapshot: pygame.Surface = self.screen.copy()
+        # Game over sound
+        SoundBank.play("gameover")
 
-        # Show Game Over overlay
-        game_over = GameOver(self.score, background_snapshot)
-        game_over.run()
+        # Show Game Over overlay over the last gameplay frame
+        self.game_over.show(self.sim.score, rank)
+        self.app.replace(self.game_over)
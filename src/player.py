@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import pygame
 
+from src.assets import Assets
 from src.settings import Screen
 
 
@@ -21,17 +22,20 @@ class Player(pygame.sprite.Sprite):
 
     Attributes:
         IMAGE_PATH (str): Path to the player image file.
-        SPEED (int): Horizontal movement speed of the player.
-        BLINK_DURATION (int): Duration of blinking invincibility in frames.
+        SPEED (float): Horizontal movement speed, in pixels per second.
+        BLINK_DURATION (float): Duration of blinking invincibility in seconds.
         image (pygame.Surface): The current player image.
         rect (pygame.Rect): Rectangle defining position and size.
-        blink_timer (int): Remaining frames of invincibility blinking.
+        mask (pygame.mask.Mask): Shared pixel mask for pixel-perfect collisions.
+        x (float): Exact left position; ``rect.x`` is this rounded.
+        prev_x (float): Left position before the last update.
+        blink_timer (float): Remaining seconds of invincibility blinking.
         visible (bool): Whether the sprite is currently drawn (for blinking).
     """
 
     IMAGE_PATH: str = "assets/images/player.png"
-    SPEED: int = 6
-    BLINK_DURATION: int = Screen.FPS // 6 # 1/6 of a second
+    SPEED: float = 360.0
+    BLINK_DURATION: float = 1 / 6
 
     def __init__(self, x: int, y: int) -> None:
         """
@@ -42,32 +46,54 @@ class Player(pygame.sprite.Sprite):
             y (int): Initial y-coordinate (top).
         """
         super().__init__()
-        self.image: pygame.Surface = pygame.image.load(self.IMAGE_PATH).convert_alpha()
-        self.rect: pygame.Rect = self.image.get_rect(center=(x, y))
+        self.image: pygame.Surface = Assets.image(self.IMAGE_PATH).copy()
+        self.rect: pygame.Rect = self.image.get_rect()
+        self.mask: pygame.mask.Mask = Assets.mask(self.IMAGE_PATH)
+        self.x: float = 0.0
+        self.prev_x: float = 0.0
+        self.blink_timer: float = 0.0
+        self.reset(x, y)
+
+    def reset(self, x: int, y: int) -> None:
+        """
+        Place the player for a new round, not blinking.
+
+        Args:
+            x (int): X-coordinate (center).
+            y (int): Y-coordinate (center).
+        """
+        self.rect.center = (x, y)
+        self.x = float(self.rect.x)
+        self.prev_x = self.x
 
         # Blinking (invincibility) state
-        self.blink_timer: int = 0
+        self.blink_timer = 0.0
+        self.image.set_alpha(255)
 
     # ---------------- Update ----------------
-    def update(self, keys: pygame.key.ScancodeWrapper) -> None:
+    def update(self, left: bool, right: bool, dt: float) -> None:
         """
         Update player movement and blinking.
 
         Args:
-            keys (pygame.key.ScancodeWrapper): Current key press states.
+            left (bool): Whether the left key is held.
+            right (bool): Whether the right key is held.
+            dt (float): Elapsed time in seconds.
         """
         # Movement
-        if keys[pygame.K_LEFT]:
-            self.rect.x -= self.SPEED
-        if keys[pygame.K_RIGHT]:
-            self.rect.x += self.SPEED
+        self.prev_x = self.x
+        if left:
+            self.x -= self.SPEED * dt
+        if right:
+            self.x += self.SPEED * dt
 
         # Keep inside screen bounds
-        self.rect.clamp_ip(pygame.Rect(0, 0, Screen.WIDTH, Screen.HEIGHT))
+        self.x = min(max(self.x, 0.0), float(Screen.WIDTH - self.rect.width))
+        self.rect.x = round(self.x)
 
         # Handle blinking
         if self.blink_timer > 0:
-            self.blink_timer -= 1
+            self.blink_timer -= dt
             self.image.set_alpha(64)
         else:
             self.image.set_alpha(255)
@@ -78,6 +104,18 @@ class Player(pygame.sprite.Sprite):
         self.blink_timer = self.BLINK_DURATION
 
     # ---------------- Drawing ----------------
+    def interpolate(self, alpha: float) -> tuple[int, int]:
+        """
+        Return the draw position ``alpha`` of the way through the last update.
+
+        Args:
+            alpha (float): Fraction of a tick elapsed since the update.
+
+        Returns:
+            tuple[int, int]: Top-left position to blit the image at.
+        """
+        return round(self.prev_x + (self.x - self.prev_x) * alpha), self.rect.y
+
     def draw(self, surface: pygame.Surface) -> None:
         """
         Draw the player if visible (used in manual rendering scenarios).
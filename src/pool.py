@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+pool.py
+
+Sprite object pooling for Jet Fighter.
+
+This module defines:
+    - :class:`PooledSprite`: a sprite base class with reset/activate/
+      deactivate hooks that returns itself to its pool when killed.
+    - :class:`SpritePool`: a pre-allocated pool of one sprite type that
+      hands out reset instances and tracks its high-water mark.
+"""
+
+from __future__ import annotations
+
+from abc import ABCMeta, abstractmethod
+from typing import Dict, Generic, List, Type, TypeVar
+
+import pygame
+
+
+class PooledSprite(pygame.sprite.Sprite, metaclass=ABCMeta):
+    """
+    Sprite that can be recycled by a :class:`SpritePool`.
+
+    Subclasses must implement :meth:`reset` to restore their initial
+    state; a subclass without it cannot be instantiated.
+    Calling :meth:`kill` removes the sprite from all groups exactly as a
+    plain sprite would, then hands it back to its pool.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the sprite without an owning pool."""
+        super().__init__()
+        self.pool: SpritePool | None = None
+        self.pooled_active: bool = False
+
+    # ---------------- Pool hooks ----------------
+    @abstractmethod
+    def reset(self, x: int, y: int) -> None:
+        """
+        Restore the sprite to its freshly spawned state.
+
+        Args:
+            x (int): X-coordinate (center).
+            y (int): Y-coordinate (center).
+        """
+
+    def activate(self, *groups: pygame.sprite.AbstractGroup) -> None:
+        """Add the sprite to its gameplay groups."""
+        self.pooled_active = True
+        self.add(*groups)
+
+    def deactivate(self) -> None:
+        """Hook run when the sprite goes back to its pool."""
+        self.pooled_active = False
+
+    def kill(self) -> None:
+        """Remove the sprite from all groups and return it to its pool."""
+        super().kill()
+        if self.pool is not None and self.pooled_active:
+            self.pool.release(self)
+
+
+SpriteT = TypeVar("SpriteT", bound=PooledSprite)
+
+
+class SpritePool(Generic[SpriteT]):
+    """
+    Pre-allocated pool of one :class:`PooledSprite` type.
+
+    The pool grows on demand if more sprites are needed than were
+    pre-allocated, so gameplay is never limited by the pool size.
+
+    Attributes:
+        sprite_cls (type): The sprite class managed by this pool.
+        size (int): Number of sprites pre-allocated.
+        active (int): Number of sprites currently in use.
+        high_water (int): Highest number of sprites in use at once since
+            the pool was created (pools are kept across rounds).
+        created (int): Total number of sprites constructed.
+    """
+
+    def __init__(self, sprite_cls: Type[SpriteT], size: int) -> None:
+        """
+        Pre-allocate the pool.
+
+        Args:
+            sprite_cls (type): Sprite class, constructible as ``cls(x, y)``.
+            size (int): Number of sprites to create up front.
+        """
+        self.sprite_cls: Type[SpriteT] = sprite_cls
+        self.size: int = size
+        self.active: int = 0
+        self.high_water: int = 0
+        self.created: int = 0
+        self.free: List[SpriteT] = [self.create() for _ in range(size)]
+
+    def create(self) -> SpriteT:
+        """Construct a new inactive sprite owned by this pool."""
+        sprite = self.sprite_cls(0, 0)
+        sprite.pool = self
+        self.created += 1
+        return sprite
+
+    # ---------------- Acquire / release ----------------
+    def acquire(self, x: int, y: int, *groups: pygame.sprite.AbstractGroup) -> SpriteT:
+        """
+        Take a sprite from the pool, reset it, and add it to groups.
+
+        Args:
+            x (int): X-coordinate (center).
+            y (int): Y-coordinate (center).
+            *groups: Sprite groups the sprite should join.
+
+        Returns:
+            PooledSprite: The activated sprite.
+        """
+        sprite = self.free.pop() if self.free else self.create()
+        sprite.reset(x, y)
+        sprite.activate(*groups)
+
+        self.active += 1
+        self.high_water = max(self.high_water, self.active)
+        return sprite
+
+    def release(self, sprite: SpriteT) -> None:
+        """
+        Return a killed sprite to the pool.
+
+        Args:
+            sprite (PooledSprite): Sprite that has left all its groups.
+        """
+        sprite.deactivate()
+        self.active -= 1
+        self.free.append(sprite)
+
+    # ---------------- Statistics ----------------
+    def stats(self) -> Dict[str, int]:
+        """
+        Return pool counters.
+
+        Returns:
+            dict[str, int]: ``size``, ``active``, ``high_water`` and ``created``.
+        """
+        return {
+            "size": self.size,
+            "active": self.active,
+            "high_water": self.high_water,
+            "created": self.created,
+        }
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+preloader.py
+
+Startup asset preloader for Jet Fighter.
+
+This module defines the :class:`Preloader` class, which decodes every PNG
+and WAV file under ``assets/`` on a thread pool while the main thread draws
+a progress bar. Images found in a fresh sprite atlas cache
+(:class:`src.atlas.SpriteAtlas`) are mapped from it instead of decoded.
+Decoded images are handed to :class:`src.assets.Assets`, converted to the
+display format and given their collision masks on the main thread;
+decoded sounds are handed to :class:`src.sounds.SoundBank`. Load times are
+logged per asset and in total.
+"""
+
+from __future__ import annotations
+
+import glob
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Tuple
+
+import pygame
+
+from src.assets import Assets
+from src.atlas import SpriteAtlas
+from src.fonts import FontManager
+from src.settings import Atlas, Screen
+from src.sounds import SoundBank
+from src.viewport import Viewport
+
+logger = logging.getLogger(__name__)
+
+
+def _decode(path: str) -> Tuple[object, float]:
+    """Worker: decode one image or sound file and time it."""
+    start = time.perf_counter()
+    if path.endswith(".png"):
+        asset: object = pygame.image.load(path)
+    else:
+        asset = pygame.mixer.Sound(path)
+    return asset, time.perf_counter() - start
+
+
+class Preloader:
+    """
+    Decode all game assets in parallel behind a loading screen.
+
+    Attributes:
+        ROOT (str): Directory searched for assets.
+        WORKERS (int): Decoder threads.
+        BAR_SIZE (tuple[int, int]): Size of the progress bar.
+        paths (list[str]): Files to load.
+        timings (dict[str, float]): Seconds spent on each file: decoding
+            on a worker plus converting on the main thread.
+        total (float): Wall-clock seconds of the whole preload.
+    """
+
+    ROOT: str = "assets"
+    WORKERS: int = min(4, os.cpu_count() or 1)
+    BAR_SIZE: Tuple[int, int] = (400, 24)
+
+    def __init__(self, screen: pygame.Surface | None = None) -> None:
+        """
+        Collect the files to load.
+
+        Args:
+            screen (pygame.Surface | None): Surface for the loading screen,
+                or None to load without drawing.
+        """
+        self.screen: pygame.Surface | None = screen
+        paths = sorted(glob.glob(os.path.join(self.ROOT, "images", "*.png")))
+        if pygame.mixer.get_init():
+            paths += sorted(glob.glob(os.path.join(self.ROOT, "sounds", "*.wav")))
+        # Cache keys use forward slashes, as game code spells its paths
+        self.paths: List[str] = [path.replace(os.sep, "/") for path in paths]
+        self.timings: Dict[str, float] = {}
+        self.total: float = 0.0
+
+    # ---------------- Loading ----------------
+    def run(self) -> Dict[str, float]:
+        """
+        Load every asset, drawing progress as files finish.
+
+        Returns:
+            dict[str, float]: Per-file load times in seconds.
+        """
+        start = time.perf_counter()
+        if Atlas.ENABLED:
+            self.load_atlas()
+        done = 0
+        self.draw(done)
+        with ThreadPoolExecutor(self.WORKERS, thread_name_prefix="preload") as pool:
+            pending: Dict[Future, str] = {
+                pool.submit(_decode, path): path for path in self.paths
+            }
+            while pending:
+                finished, _ = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    self.finish(pending.pop(future), future)
+                    done += 1
+                pygame.event.pump()
+                self.draw(done)
+
+        self.total = time.perf_counter() - start
+        self.report()
+        return self.timings
+
+    def load_atlas(self) -> None:
+        """Take the images of a fresh atlas cache off the list of files to decode."""
+        start = time.perf_counter()
+        packed = SpriteAtlas.load()
+        if not packed:
+            return
+        for path in packed:
+            Assets.mask(path)
+        self.paths = [path for path in self.paths if path not in packed]
+        self.timings[os.path.join(Atlas.DIRECTORY, SpriteAtlas.RAW_NAME)] = (
+            time.perf_counter() - start
+        )
+
+    def finish(self, path: str, future: Future) -> None:
+        """Hand one decoded file to its cache (images are converted here)."""
+        try:
+            asset, seconds = future.result()
+        except (pygame.error, FileNotFoundError) as error:
+            logger.warning("could not load %s: %s", path, error)
+            return
+
+        start = time.perf_counter()
+        if isinstance(asset, pygame.Surface):
+            Assets.add(path, asset)
+            Assets.image(path)
+            Assets.mask(path)
+        else:
+            SoundBank.add(path, asset)
+        self.timings[path] = seconds + time.perf_counter() - start
+
+    # ---------------- Drawing ----------------
+    def draw(self, done: int) -> None:
+        """Draw the loading screen with ``done`` files finished."""
+        if self.screen is None:
+            return
+        self.screen.fill((0, 0, 30))
+
+        text = FontManager.render("Loading...", 36, (255, 255, 255))
+        self.screen.blit(
+            text, (Screen.WIDTH // 2 - text.get_width() // 2, Screen.HEIGHT // 2 - 50)
+        )
+
+        width, height = self.BAR_SIZE
+        bar = pygame.Rect(0, 0, width, height)
+        bar.center = (Screen.WIDTH // 2, Screen.HEIGHT // 2)
+        pygame.draw.rect(self.screen, (200, 200, 200), bar, 2)
+        fill = bar.inflate(-6, -6)
+        fill.width = fill.width * done // max(1, len(self.paths))
+        if fill.width:
+            pygame.draw.rect(self.screen, (255, 255, 0), fill)
+
+        Viewport.present()
+
+    # ---------------- Report ----------------
+    def report(self) -> None:
+        """Log the total and per-file load times, slowest first."""
+        logger.info(
+            "preloaded %d assets in %.1f ms on %d threads",
+            len(self.timings), self.total * 1000, self.WORKERS,
+        )
+        for path, seconds in sorted(self.timings.items(), key=lambda item: -item[1]):
+            logger.info("  %6.1f ms  %s", seconds * 1000, path)
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+profiler.py
+
+Per-phase frame profiler for the Jet Fighter gameplay loop.
+
+This module defines the :class:`FrameProfiler` class. The gameplay state
+marks the end of each phase of a frame (events, update, collisions, draw,
+display flip); the profiler stores the phase times and sprite counts of
+the most recent frames in a fixed-size ring buffer, can stream every
+sample of the session to one CSV file (numbered by round and by frame
+within the round), and draws an overlay with a frame-time graph. While
+disabled, every hook returns after a single attribute check.
+"""
+
+from __future__ import annotations
+
+import atexit
+import csv
+import os
+import time
+from array import array
+from typing import IO, TYPE_CHECKING, Callable, Dict, List, Tuple
+
+import pygame
+
+from src.fonts import FontManager
+from src.settings import Profiling, Screen
+
+if TYPE_CHECKING:
+    from src.simulation import Simulation
+
+
+class FrameProfiler:
+    """
+    Ring buffer of per-frame phase timings and sprite counts.
+
+    Attributes:
+        PHASES (tuple[str, ...]): Timed phases, in frame order.
+        COUNTS (tuple[str, ...]): Sprite counts sampled each frame.
+        COLUMNS (tuple[str, ...]): Every sample column (phases in ms,
+            ``total`` in ms, then counts).
+        GRAPH_SIZE (tuple[int, int]): Size of the overlay graph.
+        enabled (bool): Whether samples are being collected.
+        visible (bool): Whether the overlay is drawn.
+        capacity (int): Frames kept in the ring buffer.
+        frames (int): Frames recorded so far.
+        rounds (int): Rounds started so far.
+        round_start (int): Value of ``frames`` when the current round started.
+    """
+
+    PHASES: Tuple[str, ...] = ("events", "update", "collisions", "draw", "flip")
+    COUNTS: Tuple[str, ...] = ("sprites", "enemies", "missiles", "swarm")
+    COLUMNS: Tuple[str, ...] = PHASES + ("total",) + COUNTS
+    GRAPH_SIZE: Tuple[int, int] = (240, 60)
+
+    def __init__(
+        self,
+        enabled: bool = Profiling.ENABLED,
+        capacity: int = Profiling.CAPACITY,
+        csv_path: str = Profiling.CSV_PATH,
+    ) -> None:
+        """
+        Initialize an empty ring buffer.
+
+        Args:
+            enabled (bool): Collect samples from the start.
+            capacity (int): Frames kept in the ring buffer.
+            csv_path (str): Stream every sample to this CSV file ("" for none).
+        """
+        self.enabled: bool = enabled
+        self.visible: bool = False
+        self.capacity: int = capacity
+        self.csv_path: str = csv_path
+
+        self.samples: Dict[str, array] = {
+            column: array("d", [0.0]) * capacity for column in self.COLUMNS
+        }
+        self.frames: int = 0
+        self.rounds: int = 0
+        self.round_start: int = 0
+        self.current: Dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+        self.last: float = 0.0
+
+        self.csv_file: IO[str] | None = None
+        self.writer = None
+        self.label: pygame.Surface | None = None
+
+    # ---------------- Control ----------------
+    def toggle(self) -> None:
+        """Show or hide the overlay; showing it also starts collecting."""
+        self.visible = not self.visible
+        if self.visible and not self.enabled:
+            # Time the rest of this frame from now
+            self.enabled = True
+            self.begin()
+
+    def attach(self, sim: Simulation) -> None:
+        """
+        Time a simulation's collision handling as its own phase.
+
+        The wrapper costs one flag check per tick while disabled.
+
+        Args:
+            sim (Simulation): Simulation of the current round.
+        """
+        handle_collisions: Callable[[], None] = sim.handle_collisions
+
+        def timed_collisions() -> None:
+            if not self.enabled:
+                handle_collisions()
+                return
+            start = time.perf_counter()
+            handle_collisions()
+            self.current["collisions"] += time.perf_counter() - start
+
+        sim.handle_collisions = timed_collisions
+
+    def start_round(self) -> None:
+        """Number the next frames as a new round, starting from frame 0."""
+        self.rounds += 1
+        self.round_start = self.frames
+
+    def flush(self) -> None:
+        """Write buffered CSV rows to disk, keeping the stream open."""
+        if self.csv_file is not None:
+            self.csv_file.flush()
+
+    def close(self) -> None:
+        """Close the CSV stream, if open (also runs at exit)."""
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.writer = None
+            atexit.unregister(self.close)
+
+    # ---------------- Hooks ----------------
+    def begin(self) -> None:
+        """Start timing a frame."""
+        if not self.enabled:
+            return
+        for phase in self.PHASES:
+            self.current[phase] = 0.0
+        self.last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Attribute the time since the previous mark to ``phase``."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[phase] += now - self.last
+        self.last = now
+
+    def end(self, sim: Simulation) -> None:
+        """
+        Store the finished frame in the ring buffer (and the CSV stream).
+
+        Args:
+            sim (Simulation): Source of the sprite counts.
+        """
+        if not self.enabled:
+            return
+        current = self.current
+        # Collisions run inside update; count them only once
+        current["update"] -= current["collisions"]
+
+        index = self.frames % self.capacity
+        samples = self.samples
+        total = 0.0
+        for phase in self.PHASES:
+            ms = current[phase] * 1000
+            samples[phase][index] = ms
+            total += ms
+        samples["total"][index] = total
+        samples["sprites"][index] = len(sim.all_sprites)
+        samples["enemies"][index] = len(sim.enemies)
+        samples["missiles"][index] = len(sim.missiles)
+        samples["swarm"][index] = len(sim.swarm) if sim.swarm is not None else 0
+        self.frames += 1
+
+        if self.csv_path:
+            self.write_row(index)
+
+    def write_row(self, index: int) -> None:
+        """
+        Append the sample at ``index`` to the CSV stream.
+
+        The stream is opened on the first sample and stays open for the
+        rest of the session, so every round lands in the same file.
+        """
+        if self.writer is None:
+            directory = os.path.dirname(self.csv_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.csv_file = open(self.csv_path, "w", newline="")
+            self.writer = csv.writer(self.csv_file)
+            self.writer.writerow(("round", "frame") + self.COLUMNS)
+            atexit.register(self.close)
+        self.writer.writerow(
+            [self.rounds, self.frames - 1 - self.round_start]
+            + [round(self.samples[column][index], 4) for column in self.COLUMNS]
+        )
+
+    # ---------------- Queries ----------------
+    def recent(self, column: str) -> List[float]:
+        """Return the buffered values of a column, oldest first."""
+        count = min(self.frames, self.capacity)
+        start = self.frames - count
+        values = self.samples[column]
+        return [values[i % self.capacity] for i in range(start, self.frames)]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the mean of every column over the buffered frames.
+
+        Returns:
+            dict[str, float]: Column -> mean (ms for phases and ``total``).
+        """
+        count = min(self.frames, self.capacity)
+        if count == 0:
+            return dict.fromkeys(self.COLUMNS, 0.0)
+        return {column: sum(self.recent(column)) / count for column in self.COLUMNS}
+
+    # ---------------- Overlay ----------------
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the frame-time graph and phase means in the bottom-left corner.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+        """
+        if not self.visible:
+            return
+        width, height = self.GRAPH_SIZE
+        graph = pygame.Rect(10, Screen.HEIGHT - height - 40, width, height)
+        panel = graph.inflate(10, 50).move(0, 10)
+        pygame.draw.rect(surface, (0, 0, 0), panel)
+
+        # One pixel column per frame; full height is two frame budgets
+        budget = 1000 / Screen.FPS
+        scale = height / (2 * budget)
+        totals = self.recent("total")[-width:]
+        if len(totals) > 1:
+            points = [
+                (graph.left + i, graph.bottom - min(height, int(ms * scale)))
+                for i, ms in enumerate(totals)
+            ]
+            pygame.draw.lines(surface, (0, 255, 0), False, points)
+        budget_y = graph.bottom - int(budget * scale)
+        pygame.draw.line(surface, (255, 0, 0), (graph.left, budget_y), (graph.right, budget_y))
+
+        # Phase means, refreshed a few times per second
+        if self.label is None or self.frames % 15 == 0:
+            means = self.summary()
+            text = " ".join(f"{phase[:4]} {means[phase]:.1f}" for phase in self.PHASES)
+            self.label = FontManager.get(16).render(
+                f"{means['total']:.1f} ms | {text}", True, (255, 255, 255), (0, 0, 0)
+            )
+        surface.blit(self.label, (graph.left, graph.bottom + 6))
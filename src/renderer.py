@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+renderer.py
+
+Dirty-rectangle renderer for the Jet Fighter gameplay screen.
+
+This module defines the :class:`DirtyRenderer` class, an alternative to
+repainting the whole background and calling ``pygame.display.flip()`` every
+frame. It restores the background only where sprites were drawn on the
+previous frame, redraws the sprites, refreshes the parts of the HUD that
+were touched or changed, and pushes just those rectangles to the display
+with :meth:`src.viewport.Viewport.present`. When the dirty area grows past a
+threshold it falls back to a full redraw.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+import pygame
+
+from src.hud import Hud
+from src.settings import Screen
+from src.viewport import Viewport
+
+
+class DirtyRenderer:
+    """
+    Draw gameplay frames by updating only the regions that changed.
+
+    Every sprite is redrawn each frame (there are few of them), so sprites
+    overlapping a restored region are never lost; the saving is in the
+    background restore and the display update, which cover only the
+    sprites' old and new rectangles instead of the whole window.
+
+    Attributes:
+        hud (Hud): Provides the background and the HUD layer.
+        threshold (float): Fraction of the screen above which a full
+            redraw is cheaper than dirty rectangles.
+        previous (list[pygame.Rect]): Sprite rectangles drawn last frame.
+        full_redraws (int): Number of frames drawn in full.
+        partial_redraws (int): Number of frames drawn with dirty rectangles.
+        dirty_fraction (float): Dirty area of the last frame, as a
+            fraction of the screen.
+    """
+
+    def __init__(self, hud: Hud, threshold: float = Screen.DIRTY_THRESHOLD) -> None:
+        """
+        Initialize the renderer. The first frame is always drawn in full.
+
+        Args:
+            hud (Hud): Provides the background and the HUD layer.
+            threshold (float): Dirty area fraction that triggers a full redraw.
+        """
+        self.hud: Hud = hud
+        self.threshold: float = threshold
+        self.screen_rect: pygame.Rect = pygame.Rect(0, 0, Screen.WIDTH, Screen.HEIGHT)
+        self.hud_rect: pygame.Rect = pygame.Rect(0, 0, Screen.WIDTH, Hud.HEIGHT)
+        self.previous: List[pygame.Rect] = []
+        self.needs_full: bool = True
+
+        self.full_redraws: int = 0
+        self.partial_redraws: int = 0
+        self.dirty_fraction: float = 1.0
+
+    def invalidate(self) -> None:
+        """Force the next frame to be drawn in full."""
+        self.needs_full = True
+
+    # ---------------- Drawing ----------------
+    def draw(
+        self,
+        surface: pygame.Surface,
+        sprites: pygame.sprite.AbstractGroup,
+        score: int,
+        hearts: int,
+        missiles: int,
+    ) -> None:
+        """
+        Draw one frame and update the display.
+
+        Args:
+            surface (pygame.Surface): The display surface.
+            sprites (pygame.sprite.AbstractGroup): Sprites to draw.
+            score (int): Current score.
+            hearts (int): Hearts remaining.
+            missiles (int): Missiles remaining.
+        """
+        hud_changed = self.hud.update(score, hearts, missiles)
+        current = [sprite.rect.copy() for sprite in sprites]
+
+        dirty = self.previous + current
+        if hud_changed:
+            dirty.append(self.hud_rect)
+        dirty = self.on_screen(dirty)
+
+        # One HUD region covering every dirty part of it, so the
+        # translucent HUD pixels are blended exactly once
+        hud_parts = [rect.clip(self.hud_rect) for rect in dirty
+                     if rect.colliderect(self.hud_rect)]
+        hud_dirty = hud_parts[0].unionall(hud_parts[1:]) if hud_parts else None
+        if hud_dirty is not None:
+            dirty.append(hud_dirty)
+
+        area = sum(rect.width * rect.height for rect in dirty)
+        self.dirty_fraction = area / (Screen.WIDTH * Screen.HEIGHT)
+        self.previous = current
+
+        if self.needs_full or self.dirty_fraction > self.threshold:
+            self.draw_full(surface, sprites)
+            return
+
+        # Restore the background under last and current sprite positions
+        background = self.hud.background
+        for rect in dirty:
+            surface.blit(background, rect, area=rect)
+
+        sprites.draw(surface)
+
+        # Re-apply the HUD wherever the restore or the sprites touched it
+        if hud_dirty is not None:
+            surface.blit(self.hud.layer, hud_dirty, area=hud_dirty)
+
+        Viewport.present(dirty)
+        self.partial_redraws += 1
+
+    def on_screen(self, rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Return the non-empty on-screen parts of rectangles."""
+        clipped = [rect.clip(self.screen_rect) for rect in rects]
+        return [rect for rect in clipped if rect.width and rect.height]
+
+    def draw_full(self, surface: pygame.Surface, sprites: pygame.sprite.AbstractGroup) -> None:
+        """Repaint everything and flip the display."""
+        self.hud.draw_background(surface)
+        sprites.draw(surface)
+        surface.blit(self.hud.layer, (0, 0))
+        Viewport.present()
+        self.needs_full = False
+        self.full_redraws += 1
+
+    # ---------------- Statistics ----------------
+    def stats(self) -> Dict[str, float]:
+        """
+        Return renderer counters.
+
+        Returns:
+            dict[str, float]: ``full_redraws``, ``partial_redraws`` and the
+            last frame's ``dirty_fraction``.
+        """
+        return {
+            "full_redraws": self.full_redraws,
+            "partial_redraws": self.partial_redraws,
+            "dirty_fraction": self.dirty_fraction,
+        }
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+replay.py
+
+Input recording and deterministic replay for Jet Fighter.
+
+This module defines:
+    - :class:`Replay`: a recorded session (seed, difficulty, tick rate,
+      per-tick input, and a checksum of the final world state) with a
+      compact binary file format.
+    - :class:`ReplayRecorder`: collects input frames while a session runs.
+
+A replay can be re-run headless as fast as possible, or shown in the game
+window at an accelerated speed::
+
+    python -m src.replay replays/last.jfr
+    python -m src.replay replays/last.jfr --watch --speed 4
+
+File layout (little-endian): a header with magic ``JFRP``, format
+version, seed, tick count, final state checksum, collision mode (0 rect,
+1 mask), stress mode (0 off, 1 on), tick rate, and the difficulty name, followed by one byte per
+tick (bit 0 left, bit 1 right, bits 2-7 the number of fire presses,
+capped at 63). Every tick has the same length, ``1 / tick rate``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+from typing import List
+
+from src.settings import Game as GameConfig
+from src.simulation import InputFrame, Simulation
+
+
+class Replay:
+    """
+    A recorded gameplay session.
+
+    Attributes:
+        MAGIC (bytes): File signature.
+        VERSION (int): File format version.
+        seed (int): Seed of the recorded simulation.
+        difficulty (str): Difficulty of the recorded simulation.
+        collision (str): Collision mode of the recorded simulation.
+        stress (bool): Whether the recorded simulation ran the stress mode.
+        tick_rate (int): Fixed ticks per second of the recorded simulation.
+        frames (list[InputFrame]): Input for every recorded tick.
+        checksum (int): :meth:`Simulation.state_hash` after the last tick.
+    """
+
+    MAGIC: bytes = b"JFRP"
+    VERSION: int = 5
+    HEADER: struct.Struct = struct.Struct("<4sBIIIBBHB")
+    COLLISIONS: tuple[str, ...] = ("rect", "mask")
+    MAX_FIRE: int = 63
+
+    def __init__(
+        self,
+        seed: int,
+        difficulty: str,
+        frames: List[InputFrame] | None = None,
+        checksum: int = 0,
+        collision: str = "rect",
+        tick_rate: int = GameConfig.TICK_RATE,
+        stress: bool = False,
+    ) -> None:
+        """
+        Initialize a replay.
+
+        Args:
+            seed (int): Simulation seed.
+            difficulty (str): Simulation difficulty.
+            frames (list[InputFrame] | None): Recorded input frames.
+            checksum (int): Final world state checksum.
+            collision (str): Simulation collision mode.
+            tick_rate (int): Fixed simulation ticks per second.
+            stress (bool): Whether the simulation ran the stress mode.
+        """
+        self.seed: int = seed
+        self.difficulty: str = difficulty
+        self.frames: List[InputFrame] = frames if frames is not None else []
+        self.checksum: int = checksum
+        self.collision: str = collision
+        self.tick_rate: int = tick_rate
+        self.stress: bool = stress
+
+    # ---------------- Encoding ----------------
+    @classmethod
+    def encode_frame(cls, frame: InputFrame) -> int:
+        """Pack an input frame into one byte."""
+        fire = min(frame.fire, cls.MAX_FIRE)
+        return int(frame.left) | int(frame.right) << 1 | fire << 2
+
+    @staticmethod
+    def decode_frame(value: int, dt: float) -> InputFrame:
+        """Unpack one byte into an input frame of ``dt`` seconds."""
+        return InputFrame(
+            left=bool(value & 1), right=bool(value & 2), fire=value >> 2, dt=dt
+        )
+
+    # ---------------- File I/O ----------------
+    def save(self, path: str) -> None:
+        """
+        Write the replay to a binary file.
+
+        Args:
+            path (str): Destination file path.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        name = self.difficulty.encode("ascii")
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(
+                self.MAGIC, self.VERSION, self.seed, len(self.frames),
+                self.checksum, self.COLLISIONS.index(self.collision),
+                int(self.stress), self.tick_rate, len(name),
+            ))
+            f.write(name)
+            f.write(bytes(self.encode_frame(frame) for frame in self.frames))
+
+    @classmethod
+    def load(cls, path: str) -> Replay:
+        """
+        Read a replay from a binary file.
+
+        Args:
+            path (str): Path to the replay file.
+
+        Returns:
+            Replay: The loaded replay.
+
+        Raises:
+            ValueError: If the file is not a supported replay.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        (magic, version, seed, count, checksum, collision, stress, tick_rate,
+         name_len) = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"{path} is not a version {cls.VERSION} replay file")
+
+        offset = cls.HEADER.size
+        difficulty = data[offset:offset + name_len].decode("ascii")
+        offset += name_len
+        dt = 1 / tick_rate
+        frames = [cls.decode_frame(value, dt) for value in data[offset:offset + count]]
+        return cls(
+            seed, difficulty, frames, checksum, cls.COLLISIONS[collision], tick_rate,
+            bool(stress),
+        )
+
+    # ---------------- Playback ----------------
+    def simulate(self) -> Simulation:
+        """
+        Re-run the replay headless, as fast as possible.
+
+        Returns:
+            Simulation: The simulation after the last recorded tick.
+        """
+        sim = Simulation(
+            self.difficulty, seed=self.seed, collision=self.collision, stress=self.stress
+        )
+        for frame in self.frames:
+            sim.step(frame)
+        return sim
+
+    def verify(self, sim: Simulation) -> bool:
+        """Return True if ``sim`` ended in exactly the recorded state."""
+        return sim.state_hash() == self.checksum
+
+
+class ReplayRecorder:
+    """
+    Record the input of a running session.
+
+    Attributes:
+        replay (Replay): The replay being recorded.
+    """
+
+    def __init__(self, sim: Simulation, tick_rate: int = GameConfig.TICK_RATE) -> None:
+        """
+        Start recording a session.
+
+        Args:
+            sim (Simulation): The simulation whose input is recorded.
+            tick_rate (int): Fixed ticks per second the session runs at.
+        """
+        self.sim: Simulation = sim
+        self.replay: Replay = Replay(
+            sim.seed, sim.difficulty, collision=sim.collision, tick_rate=tick_rate,
+            stress=sim.swarm is not None,
+        )
+
+    def record(self, frame: InputFrame) -> None:
+        """Append the input frame passed to the simulation this tick."""
+        self.replay.frames.append(frame)
+
+    def save(self, path: str) -> None:
+        """
+        Store the final state checksum and write the replay file.
+
+        Args:
+            path (str): Destination file path.
+        """
+        self.replay.checksum = self.sim.state_hash()
+        self.replay.save(path)
+
+
+# ---------------- Command line ----------------
+def main() -> None:
+    """Re-run a replay file headless or in the game window."""
+    parser = argparse.ArgumentParser(description="Re-run a Jet Fighter replay.")
+    parser.add_argument("path", help="replay file")
+    parser.add_argument("--watch", action="store_true", help="show it in the game window")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed when watching")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+    if args.watch:
+        from src.app import AppContext
+        from src.play import Play
+
+        app = AppContext()
+        play = Play(app)
+        play.start(replay=replay, speed=args.speed)
+        app.push(play)
+        app.run()
+        sim = play.sim
+    else:
+        sim = replay.simulate()
+
+    status = "match" if replay.verify(sim) else "MISMATCH"
+    print(f"{len(replay.frames)} ticks, seed {replay.seed}, {replay.difficulty}: "
+          f"score {sim.score}, final state {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+scheduler.py
+
+Frame pacing and idle waiting for Jet Fighter's screen loops.
+
+This module defines the :class:`LoopScheduler` class, shared by every
+screen loop. Paced loops (gameplay) are capped at a frame rate with
+:meth:`LoopScheduler.tick`. Static loops (menus, settings, game over)
+block in :meth:`LoopScheduler.wait` until an event arrives or an idle
+timeout passes, and redraw only when something changed. Each loop logs
+how much CPU time it used when it ends.
+
+It also defines :class:`FixedStep`, the accumulator that decouples a
+paced loop's simulation ticks from its rendered frames.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Dict, List
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class LoopScheduler:
+    """
+    Pace one screen loop and measure its cost.
+
+    Attributes:
+        name (str): Loop name used in reports.
+        fps (float | None): Frame rate cap of a paced loop, or None for a
+            static loop that waits for events.
+        idle_timeout (int): Longest a static loop blocks, in milliseconds.
+        frames (int): Loop iterations so far.
+        redraws (int): Frames actually drawn.
+        frame_ms (int): Length of the last paced frame, in milliseconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fps: float | None = None,
+        idle_timeout: int = 250,
+    ) -> None:
+        """
+        Initialize the scheduler and start measuring.
+
+        Args:
+            name (str): Loop name used in reports.
+            fps (float | None): Frame rate cap, or None for a static loop.
+            idle_timeout (int): Longest a static loop blocks, in milliseconds.
+        """
+        self.name: str = name
+        self.fps: float | None = fps
+        self.idle_timeout: int = idle_timeout
+        self.clock: pygame.time.Clock = pygame.time.Clock()
+
+        self.frames: int = 0
+        self.redraws: int = 0
+        self.frame_ms: int = 0
+        self.redraw_pending: bool = True
+        self.start()
+
+    def start(self) -> None:
+        """(Re)start measuring; the first frame is always drawn."""
+        self.cpu_start: float = time.thread_time()
+        self.wall_start: float = time.perf_counter()
+        self.frames = 0
+        self.redraws = 0
+        self.redraw_pending = True
+        self.clock.tick()  # the first frame is measured from here
+
+    # ---------------- Pacing ----------------
+    def tick(self) -> int:
+        """
+        Wait out the rest of the frame of a paced loop.
+
+        Returns:
+            int: Milliseconds since the previous tick.
+        """
+        self.frames += 1
+        self.frame_ms = self.clock.tick(self.fps or 0)
+        return self.frame_ms
+
+    def wait(self) -> List[pygame.event.Event]:
+        """
+        Return the pending events of a static loop.
+
+        Blocks until an event arrives or the idle timeout passes, unless a
+        redraw is already pending. Any event marks the screen for redraw.
+
+        Returns:
+            list[pygame.event.Event]: Events to process (may be empty).
+        """
+        self.frames += 1
+        if self.redraw_pending:
+            return pygame.event.get()
+
+        first = pygame.event.wait(self.idle_timeout)
+        if first.type == pygame.NOEVENT:
+            return []
+        self.redraw_pending = True
+        return [first, *pygame.event.get()]
+
+    def next_frame(self) -> List[pygame.event.Event]:
+        """
+        Pace the loop (tick or wait, depending on its kind) and return events.
+
+        Returns:
+            list[pygame.event.Event]: Events to process this frame.
+        """
+        if self.fps is None:
+            return self.wait()
+        self.tick()
+        return pygame.event.get()
+
+    # ---------------- Redraw tracking ----------------
+    def request_redraw(self) -> None:
+        """Mark the screen as changed so the next frame is drawn."""
+        self.redraw_pending = True
+
+    def should_draw(self) -> bool:
+        """Return True (and clear the flag) if the frame must be drawn."""
+        if self.fps is None and not self.redraw_pending:
+            return False
+        self.redraw_pending = False
+        self.redraws += 1
+        return True
+
+    # ---------------- Reporting ----------------
+    def report(self) -> Dict[str, float]:
+        """
+        Return loop statistics since :meth:`start`.
+
+        Returns:
+            dict[str, float]: ``frames``, ``redraws``, ``cpu_seconds``,
+            ``wall_seconds`` and ``cpu_percent`` of the loop's thread.
+        """
+        cpu = time.thread_time() - self.cpu_start
+        wall = time.perf_counter() - self.wall_start
+        return {
+            "frames": self.frames,
+            "redraws": self.redraws,
+            "cpu_seconds": cpu,
+            "wall_seconds": wall,
+            "cpu_percent": 100 * cpu / wall if wall > 0 else 0.0,
+        }
+
+    def log_report(self) -> None:
+        """Log the loop statistics."""
+        stats = self.report()
+        logger.info(
+            "%s loop: %d frames, %d redraws, %.2fs CPU in %.2fs (%.1f%%)",
+            self.name, stats["frames"], stats["redraws"],
+            stats["cpu_seconds"], stats["wall_seconds"], stats["cpu_percent"],
+        )
+
+
+class FixedStep:
+    """
+    Accumulator running a simulation at a fixed tick rate.
+
+    Each rendered frame adds its elapsed time and runs the ticks that are
+    due. When rendering is slow, at most ``max_ticks`` ticks catch up per
+    frame and the rest of the backlog is dropped; when rendering is fast,
+    some frames run no tick and :attr:`alpha` tells how far the frame is
+    between the last two ticks.
+
+    Attributes:
+        step (float): Length of one tick, in seconds.
+        max_ticks (int): Most ticks run in one frame.
+        accumulator (float): Elapsed time not yet simulated, in seconds.
+        frames (int): Frames advanced so far.
+        ticks (int): Ticks run so far.
+        catchup (int): Ticks run beyond one per frame.
+        skipped (int): Ticks dropped because the backlog exceeded the cap.
+        idle_frames (int): Frames that ran no tick (interpolated only).
+    """
+
+    def __init__(self, rate: float, max_ticks: int) -> None:
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            rate (float): Ticks per second.
+            max_ticks (int): Most ticks run in one frame.
+        """
+        self.step: float = 1 / rate
+        self.max_ticks: int = max_ticks
+        self.reset()
+
+    def reset(self) -> None:
+        """Empty the accumulator and clear the statistics."""
+        self.accumulator: float = 0.0
+        self.frames: int = 0
+        self.ticks: int = 0
+        self.catchup: int = 0
+        self.skipped: int = 0
+        self.idle_frames: int = 0
+
+    # ---------------- Stepping ----------------
+    def advance(self, seconds: float) -> int:
+        """
+        Add a frame's elapsed time and return the number of ticks to run.
+
+        Args:
+            seconds (float): Time since the previous frame.
+
+        Returns:
+            int: Ticks due this frame, at most :attr:`max_ticks`.
+        """
+        self.frames += 1
+        self.accumulator += seconds
+        due = int(self.accumulator / self.step)
+        if due > self.max_ticks:
+            self.skipped += due - self.max_ticks
+            due = self.max_ticks
+        # Dropped backlog leaves at most one tick pending
+        self.accumulator = min(max(self.accumulator - due * self.step, 0.0), self.step)
+
+        self.ticks += due
+        if due == 0:
+            self.idle_frames += 1
+        else:
+            self.catchup += due - 1
+        return due
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick elapsed since the last one, in [0, 1]."""
+        return min(self.accumulator / self.step, 1.0)
+
+    # ---------------- Reporting ----------------
+    def report(self) -> Dict[str, int]:
+        """
+        Return tick statistics since :meth:`reset`.
+
+        Returns:
+            dict[str, int]: ``frames``, ``ticks``, ``catchup``, ``skipped``
+            and ``idle_frames``.
+        """
+        return {
+            "frames": self.frames,
+            "ticks": self.ticks,
+            "catchup": self.catchup,
+            "skipped": self.skipped,
+            "idle_frames": self.idle_frames,
+        }
+
+    def log_report(self, name: str) -> None:
+        """Log the tick statistics under the loop name ``name``."""
+        stats = self.report()
+        logger.info(
+            "%s ticks: %d in %d frames, %d catch-up, %d skipped, %d frames without a tick",
+            name, stats["ticks"], stats["frames"], stats["catchup"],
+            stats["skipped"], stats["idle_frames"],
+        )
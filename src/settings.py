@@ -5,16 +5,24 @@ settings.py
 Game configuration and settings menu for Jet Fighter.
 
 This module contains:
-- Global screen and gameplay constants (sizes, FPS, assets).
+- Global screen, audio and gameplay constants (sizes, FPS, assets).
 - The SettingsGUI class, which allows the player to configure difficulty
-  interactively via a button menu.
+  and the window's render scale interactively via a button menu.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pygame
 
 from src.button import Button, ButtonGroup
+from src.fonts import FontManager
+from src.state import State
+from src.viewport import Viewport
+
+if TYPE_CHECKING:
+    from src.app import AppContext
 
 
 class Screen:
@@ -22,8 +30,23 @@ class Screen:
 
     WIDTH: int = 800
     HEIGHT: int = 600
-    FPS: int = 60
+    FPS: int = 60                   # Gameplay frame rate cap (rendering)
+    IDLE_TIMEOUT: int = 250         # Longest menus block waiting for input (ms)
     BACKGROUND_IMAGE: str = "assets/images/background.png"
+    DIRTY_RECTS: bool = False       # Update only changed regions during play
+    DIRTY_THRESHOLD: float = 0.5    # Dirty screen fraction forcing a full redraw
+    RENDER_SCALE: float = 1.0       # Window size as a multiple of WIDTH x HEIGHT
+    RENDER_SCALES: tuple[float, ...] = (1.0, 1.5, 2.0)  # Offered in the settings menu
+    SCALE_FILTER: str = "nearest"   # "nearest" (sharp pixels) or "smooth" upscaling
+
+
+class Audio:
+    """Mixer configuration, applied with ``pygame.mixer.pre_init`` at startup."""
+
+    FREQUENCY: int = 44100          # Sample rate (Hz)
+    SIZE: int = -16                 # Signed 16-bit samples
+    CHANNELS: int = 2               # Stereo
+    BUFFER: int = 512               # Samples per chunk; smaller means less latency
 
 
 class Game:
@@ -32,25 +55,73 @@ class Game:
     DIFFICULTY: str = "Normal"  # Default difficulty
     HEART: int = 3              # Initial number of lives
     MISSILES: int = 10          # Initial missile count
+    COLLISION: str = "rect"     # "rect", or "mask" for pixel-perfect hits
+    TICK_RATE: int = 60         # Fixed simulation ticks per second
+    MAX_CATCHUP: int = 5        # Most ticks run per rendered frame
+
+
+class Recording:
+    """Input recording of gameplay sessions (see src/replay.py)."""
+
+    ENABLED: bool = True              # Record every session
+    PATH: str = "replays/last.jfr"    # Overwritten by each new session
 
 
-class SettingsGUI:
+class Stress:
     """
-    In-game settings menu for configuring difficulty.
+    Array-backed stress mode (requires NumPy, see src/entities.py).
+
+    The extra entities are load only and never cost hearts, score or missiles.
+    """
+
+    ENABLED: bool = False
+    CAPACITY: int = 8192            # Maximum live array entities
+    ENEMIES_PER_SECOND: int = 240   # Extra enemies spawned
+    MISSILES_PER_SECOND: int = 480  # Missiles auto-fired
+
+
+class Profiling:
+    """Gameplay frame profiler (see src/profiler.py)."""
+
+    ENABLED: bool = False           # Collect samples from the first frame
+    TOGGLE_KEY: int = pygame.K_F3   # Shows the overlay (and starts collecting)
+    CAPACITY: int = 600             # Frames kept in the ring buffer
+    CSV_PATH: str = ""              # Stream every sample to this file if set
+
+
+class Atlas:
+    """Packed sprite atlas and raw pixel cache (see src/atlas.py)."""
+
+    ENABLED: bool = True            # Load images from the cache when it is fresh
+    DIRECTORY: str = "build/atlas"  # Output of ``python -m src.atlas``
+    MAX_WIDTH: int = 512            # Atlas width before a new shelf is started
+    PADDING: int = 1                # Transparent pixels between packed images
+
+
+class Pools:
+    """Number of sprites pre-allocated per type (pools grow if exceeded)."""
+
+    MISSILE: int = 32
+    ENEMY: int = 8
+    BOSS: int = 2
+    EXPLOSION: int = 16
+
+
+class SettingsGUI(State):
+    """
+    In-game settings menu for configuring difficulty and render scaling.
 
     Attributes:
-        screen (pygame.Surface): The active game surface.
-        font (pygame.font.Font): Font for rendering text.
         buttons (ButtonGroup): Group of interactive buttons.
-        running (bool): Whether the settings menu loop is active.
+        scale_button (Button): Cycles through :attr:`Screen.RENDER_SCALES`.
+        filter_button (Button): Toggles nearest and smooth upscaling.
     """
 
-    def __init__(self, screen: pygame.Surface) -> None:
+    NAME: str = "settings"
+
+    def __init__(self, app: AppContext) -> None:
         """Initialize the settings menu with difficulty buttons."""
-        self.screen: pygame.Surface = screen
-        self.font: pygame.font.Font = pygame.font.SysFont(None, 48)
-        self.small_font: pygame.font.Font = pygame.font.SysFont(None, 32)
-        self.running: bool = True
+        super().__init__(app)
 
         # Create interactive buttons for the settings menu
         self.create_buttons()
@@ -62,21 +133,37 @@ class SettingsGUI:
             Button("Easy", center_x, 180, 200, 60, lambda: self.set_difficulty("Easy")),
             Button("Normal", center_x, 250, 200, 60, lambda: self.set_difficulty("Normal")),
             Button("Hard", center_x, 320, 200, 60, lambda: self.set_difficulty("Hard")),
-            Button("Back", center_x, 400, 200, 60, self.close),
+        ]
+        self.scale_button: Button = Button(
+            self.scale_label(), Screen.WIDTH // 2 - 205, 400, 200, 60,
+            self.cycle_scale, font_size=28,
+        )
+        self.filter_button: Button = Button(
+            self.filter_label(), Screen.WIDTH // 2 + 5, 400, 200, 60,
+            self.toggle_filter, font_size=28,
+        )
+        buttons += [
+            self.scale_button,
+            self.filter_button,
+            Button("Back", center_x, 480, 200, 60, self.close),
         ]
         self.buttons: ButtonGroup = ButtonGroup(buttons)
 
-    # ---------------- Menu loop ----------------
-    def run(self) -> None:
-        """Run the settings menu loop until closed."""
-        while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                self.buttons.handle_event(event)
+    # ---------------- Events ----------------
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        """
+        Process events in the settings menu until it is closed.
 
-            self.draw()
-            pygame.display.flip()
+        Args:
+            events (list[pygame.event.Event]): Events from the scheduler.
+        """
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.close()
+                return
+            self.buttons.handle_event(event)
+            if self.app.top is not self:
+                return
 
     # ---------------- Button actions ----------------
     def set_difficulty(self, difficulty: str) -> None:
@@ -87,11 +174,40 @@ class SettingsGUI:
             difficulty (str): The difficulty level to set.
         """
         Game.DIFFICULTY = difficulty
-        self.running = False
+        self.close()
+
+    def cycle_scale(self) -> None:
+        """Switch the window to the next render scale."""
+        scales = Screen.RENDER_SCALES
+        index = scales.index(Screen.RENDER_SCALE) if Screen.RENDER_SCALE in scales else -1
+        Screen.RENDER_SCALE = scales[(index + 1) % len(scales)]
+        self.apply_scaling()
+
+    def toggle_filter(self) -> None:
+        """Switch between nearest-neighbour and smooth upscaling."""
+        Screen.SCALE_FILTER = "smooth" if Screen.SCALE_FILTER == "nearest" else "nearest"
+        self.apply_scaling()
+
+    def apply_scaling(self) -> None:
+        """Resize the window and refresh the scaling button labels."""
+        Viewport.configure(Screen.RENDER_SCALE, Screen.SCALE_FILTER == "smooth")
+        self.scale_button.text = self.scale_label()
+        self.filter_button.text = self.filter_label()
+        self.scheduler.request_redraw()
+
+    @staticmethod
+    def scale_label() -> str:
+        """Return the scale button's label."""
+        return f"Scale: {Screen.RENDER_SCALE:g}x"
+
+    @staticmethod
+    def filter_label() -> str:
+        """Return the filter button's label."""
+        return f"Filter: {Screen.SCALE_FILTER.capitalize()}"
 
     def close(self) -> None:
         """Close the settings menu without changes."""
-        self.running = False
+        self.app.pop()
 
     # ---------------- Drawing ----------------
     def draw(self) -> None:
@@ -99,15 +215,17 @@ class SettingsGUI:
         self.screen.fill((0, 0, 30))
 
         # Title
-        title: pygame.Surface = self.font.render("Settings", True, (255, 255, 0))
+        title: pygame.Surface = FontManager.render("Settings", 48, (255, 255, 0))
         self.screen.blit(title, (Screen.WIDTH // 2 - title.get_width() // 2, 100))
 
         # Current difficulty info
-        difficulty_text: pygame.Surface = self.small_font.render(
-            f"Current Difficulty: {Game.DIFFICULTY}", True, (200, 200, 200)
+        difficulty_text: pygame.Surface = FontManager.render(
+            f"Current Difficulty: {Game.DIFFICULTY}", 32, (200, 200, 200)
         )
         self.screen.blit(difficulty_text,
                          (Screen.WIDTH // 2 - difficulty_text.get_width() // 2, 150))
 
         # Buttons
         self.buttons.draw(self.screen)
+
+        Viewport.present()
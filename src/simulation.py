@@ -0,0 +1,499 @@
+# -*- coding: utf-8 -*-
+"""
+simulation.py
+
+Headless gameplay simulation for Jet Fighter.
+
+This module defines:
+    - :class:`InputFrame`: the player input for a single simulation tick.
+    - :class:`Simulation`: the world state (player, enemies, missiles,
+      explosions, score, hearts, missiles) and the per-tick update and
+      collision logic, with no window, event polling, audio, or drawing.
+
+Every tick advances the world by the elapsed time carried in its input
+frame, so speeds, timers and spawn rates are in real seconds and a round
+plays the same at any frame rate.
+
+Because nothing here touches the display, a :class:`Simulation` can be
+stepped under SDL's dummy drivers or without a pygame display at all, as
+fast as the CPU allows. Running this module performs such a soak run::
+
+    python -m src.simulation --ticks 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import time
+import zlib
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import pygame
+
+from src.assets import Assets
+from src.boss import Boss
+from src.broadphase import SpatialHash
+from src import entities
+from src.enemy import Enemy
+from src.explosion import Explosion
+from src.missile import Missile
+from src.player import Player
+from src.pool import SpritePool
+from src.settings import Screen, Game as GameConfig, Pools, Stress
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InputFrame:
+    """
+    Player input for one simulation tick.
+
+    Attributes:
+        left (bool): Whether the left key is held.
+        right (bool): Whether the right key is held.
+        fire (int): Number of fire presses during the tick.
+        dt (float): Time the tick covers, in seconds.
+    """
+
+    left: bool = False
+    right: bool = False
+    fire: int = 0
+    dt: float = 1 / GameConfig.TICK_RATE
+
+
+class Simulation:
+    """
+    Pure gameplay state and logic, advanced one tick at a time.
+
+    Sprites, pools, the broadphase and the stress-mode arrays are built
+    once; :meth:`reset` starts a new round on the same objects.
+
+    Attributes:
+        BOSS_RARITY (int): Enemy spawns per boss spawn, on average.
+        SWARM_LANES (int): Columns of the stress-mode missile fan.
+        all_sprites (pygame.sprite.Group): All active sprites.
+        enemies (pygame.sprite.Group): All enemy sprites.
+        missiles (pygame.sprite.Group): All missile sprites.
+        missile_pool, enemy_pools, explosion_pool (SpritePool):
+            Pre-allocated sprites reused on spawn and returned on kill.
+        player (Player): The player-controlled jet fighter.
+        seed (int): Seed of the per-session random number generator.
+        rng (random.Random): Random number generator used for spawning.
+        enemy_spawn_rate (float): Average enemy spawns per second.
+        enemy_limit (int): Maximum simultaneous enemies.
+        score (int): Current score of the player.
+        heart_remaining (int): Number of lives left.
+        missiles_remaining (int): Number of missiles available.
+        missiles_fired, missile_hits, boss_kills (int): Session statistics.
+        collision (str): "rect" or "mask" (pixel-perfect) hit testing.
+        over (bool): Whether a game-over condition has been reached.
+        ticks (int): Number of ticks simulated.
+        elapsed (float): Simulated seconds.
+        events (list[str]): Sound events emitted during the last tick
+            ("explosion", "milestone").
+        swarm (EntityStore | None): Array-backed entities of stress mode,
+            or None when it is off this round. They are extra load only: their hits and escapes are counted in
+            ``swarm_kills`` and ``swarm_escapes`` and never change the
+            score, hearts or missiles.
+        swarm_store (EntityStore | None): The stress-mode arrays, kept for
+            later rounds once allocated.
+        swarm_kills, swarm_escapes (int): Stress-mode enemies destroyed and
+            enemies that reached the bottom.
+        swarm_rng (random.Random): Separate generator for stress-mode spawns,
+            so the regular game plays out as it would without the swarm.
+        broadphase (SpatialHash): Grid index of the enemies for collisions.
+    """
+
+    BOSS_RARITY: int = 10
+    SWARM_LANES: int = 8
+
+    def __init__(
+        self,
+        difficulty: str | None = None,
+        seed: int | None = None,
+        stress: bool | None = None,
+        collision: str | None = None,
+    ) -> None:
+        """
+        Build the world and set up the first round.
+
+        Args:
+            difficulty (str | None): Difficulty level, defaults to the
+                configured :attr:`src.settings.Game.DIFFICULTY`.
+            seed (int | None): Seed for spawning randomness. A random seed
+                is chosen if omitted; pass the same seed and inputs to
+                reproduce a session exactly.
+            stress (bool | None): Enable the array-backed stress mode,
+                defaults to :attr:`src.settings.Stress.ENABLED`.
+            collision (str | None): "rect" or "mask", defaults to
+                :attr:`src.settings.Game.COLLISION`.
+        """
+        # Sprite groups
+        self.all_sprites: pygame.sprite.Group = pygame.sprite.Group()
+        self.enemies: pygame.sprite.Group = pygame.sprite.Group()
+        self.missiles: pygame.sprite.Group = pygame.sprite.Group()
+
+        # Sprite pools (instances are recycled instead of re-created)
+        self.missile_pool: SpritePool[Missile] = SpritePool(Missile, Pools.MISSILE)
+        self.enemy_pools: dict[type, SpritePool] = {
+            Enemy: SpritePool(Enemy, Pools.ENEMY),
+            Boss: SpritePool(Boss, Pools.BOSS),
+        }
+        self.explosion_pool: SpritePool[Explosion] = SpritePool(
+            Explosion, Pools.EXPLOSION
+        )
+
+        # Player setup
+        self.player: Player = Player(*self.player_start())
+        self.all_sprites.add(self.player)
+
+        # Collision broadphase over the enemies group
+        self.broadphase: SpatialHash = SpatialHash()
+
+        # Stress-mode arrays, allocated the first time stress mode is on
+        self.swarm: entities.EntityStore | None = None
+        self.swarm_store: entities.EntityStore | None = None
+
+        self.reset(difficulty, seed, stress, collision)
+
+    def reset(
+        self,
+        difficulty: str | None = None,
+        seed: int | None = None,
+        stress: bool | None = None,
+        collision: str | None = None,
+    ) -> None:
+        """
+        Start a new round, reusing the sprites, pools and arrays.
+
+        Every live sprite goes back to its pool and every counter is
+        cleared, so a reset simulation plays exactly like a new one.
+
+        Args:
+            difficulty (str | None): Difficulty level (see :meth:`__init__`).
+            seed (int | None): Seed for spawning randomness, random if omitted.
+            stress (bool | None): Enable the array-backed stress mode.
+            collision (str | None): "rect" or "mask".
+        """
+        # Per-session randomness (never the global random module)
+        self.seed: int = seed if seed is not None else random.getrandbits(32)
+        self.rng: random.Random = random.Random(self.seed)
+
+        # Return the previous round's sprites to their pools
+        for sprite in self.all_sprites.sprites():
+            if sprite is not self.player:
+                sprite.kill()
+        self.player.reset(*self.player_start())
+        self.broadphase.clear()
+
+        # Difficulty configuration (enemy spawn rate and max enemies)
+        self.difficulty: str = difficulty or GameConfig.DIFFICULTY
+        self.enemy_spawn_rate, self.enemy_limit = self.get_difficulty(
+            self.difficulty
+        )
+
+        # Player stats
+        self.score: int = 0
+        self.heart_remaining: int = GameConfig.HEART
+        self.missiles_remaining: int = GameConfig.MISSILES
+
+        # Session statistics (telemetry only, not part of the state hash)
+        self.missiles_fired: int = 0
+        self.missile_hits: int = 0
+        self.boss_kills: int = 0
+
+        # Tick state
+        self.over: bool = False
+        self.ticks: int = 0
+        self.elapsed: float = 0.0
+        self.events: List[str] = []
+
+        # Optional pixel-perfect test on pairs whose rectangles overlap
+        self.collision: str = collision or GameConfig.COLLISION
+        self.collided = (
+            pygame.sprite.collide_mask if self.collision == "mask" else None
+        )
+
+        # Stress mode: thousands of extra entities in NumPy arrays
+        self.swarm = None
+        if (Stress.ENABLED if stress is None else stress) and entities.AVAILABLE:
+            if self.swarm_store is None:
+                self.swarm_store = entities.EntityStore(Stress.CAPACITY)
+            self.swarm = self.swarm_store
+            self.swarm.clear()
+        # Fractional stress-mode spawns carried over to the next tick
+        self.enemies_due: float = 0.0
+        self.missiles_due: float = 0.0
+        self.swarm_lane: int = 0
+        self.swarm_kills: int = 0
+        self.swarm_escapes: int = 0
+        self.swarm_rng: random.Random = random.Random(self.seed)
+
+    @staticmethod
+    def player_start() -> Tuple[int, int]:
+        """Return the player's starting position (center x, y)."""
+        return Screen.WIDTH // 2, Screen.HEIGHT - Assets.size(Player.IMAGE_PATH)[1]
+
+    # ---------------- Difficulty ----------------
+    @staticmethod
+    def get_difficulty(difficulty: str) -> Tuple[float, int]:
+        """
+        Return spawn rate (per second) and enemy limit based on difficulty.
+
+        Args:
+            difficulty (str): The current difficulty level.
+
+        Returns:
+            tuple[float, int]: (enemy_spawn_rate, enemy_limit).
+        """
+        match difficulty:
+            case "Easy":
+                return 1.0, 2
+            case "Hard":
+                return 1.0, 5
+            case _:
+                return 1.0, 3
+
+    # ---------------- Step ----------------
+    def step(self, frame: InputFrame) -> None:
+        """
+        Advance the world by one tick of ``frame.dt`` seconds.
+
+        Args:
+            frame (InputFrame): Player input and elapsed time for this tick.
+        """
+        self.events.clear()
+        if self.over:
+            return
+        self.ticks += 1
+        self.elapsed += frame.dt
+
+        for _ in range(frame.fire):
+            if self.missiles_remaining > 0:
+                self.fire_missile()
+
+        self.update(frame)
+
+    def fire_missile(self) -> None:
+        """Fire a missile from the player jet."""
+        self.missile_pool.acquire(
+            self.player.rect.centerx, self.player.rect.top,
+            self.all_sprites, self.missiles,
+        )
+        self.missiles_remaining -= 1
+        self.missiles_fired += 1
+
+    # ---------------- Update ----------------
+    def update(self, frame: InputFrame) -> None:
+        """Update player, enemies, collisions, and check game conditions."""
+        dt = frame.dt
+        self.player.update(frame.left, frame.right, dt)
+
+        # Game over check
+        if self.heart_remaining <= 0 or (
+            self.missiles_remaining <= 0 and len(self.missiles) == 0
+        ):
+            self.over = True
+            return
+
+        # Update non-player sprites
+        for sprite in self.all_sprites:
+            if sprite != self.player:
+                sprite.update(dt)
+
+        if self.swarm is not None:
+            self.update_swarm(dt)
+
+        # Enemy spawning logic (probabilities scale with the tick length)
+        spawn_chance = self.enemy_spawn_rate * dt
+        if len(self.enemies) < self.enemy_limit:
+            if self.rng.random() < spawn_chance:
+                self.spawn_enemy()
+
+        # Rare boss spawn
+        if self.rng.random() < spawn_chance / self.BOSS_RARITY:
+            self.spawn_enemy(is_boss=True)
+
+        # Collision detection
+        self.handle_collisions()
+
+    def update_swarm(self, dt: float) -> None:
+        """
+        Move the stress-mode entities and spawn the next wave.
+
+        Args:
+            dt (float): Elapsed time in seconds.
+        """
+        self.swarm_escapes += self.swarm.step(dt)
+
+        self.enemies_due += Stress.ENEMIES_PER_SECOND * dt
+        self.missiles_due += Stress.MISSILES_PER_SECOND * dt
+        enemies, missiles = int(self.enemies_due), int(self.missiles_due)
+        self.enemies_due -= enemies
+        self.missiles_due -= missiles
+
+        half_width = Assets.half_width(Enemy.IMAGE_PATH)
+        for _ in range(enemies):
+            self.swarm.spawn(
+                entities.ENEMY,
+                self.swarm_rng.randint(half_width, Screen.WIDTH - half_width),
+                -half_width,
+            )
+        for _ in range(missiles):
+            lane = self.swarm_lane % self.SWARM_LANES
+            self.swarm_lane += 1
+            offset = (lane - self.SWARM_LANES // 2) * 12
+            self.swarm.spawn(
+                entities.MISSILE,
+                self.player.rect.centerx + offset,
+                self.player.rect.top,
+            )
+
+    def spawn_enemy(self, is_boss: bool = False) -> None:
+        """
+        Spawn a new enemy or boss at a random x position.
+
+        Args:
+            is_boss (bool): Whether to spawn a boss instead of a normal enemy.
+        """
+        sprite_cls = Boss if is_boss else Enemy
+        enemy_half_width: int = Assets.half_width(Enemy.IMAGE_PATH)
+
+        self.enemy_pools[sprite_cls].acquire(
+            self.rng.randint(enemy_half_width, Screen.WIDTH - enemy_half_width),
+            -enemy_half_width,
+            self.all_sprites, self.enemies,
+        )
+
+    def handle_collisions(self) -> None:
+        """Handle missile-enemy, enemy-player, and enemy-bottom collisions."""
+        # Only test pairs that share a broadphase cell
+        self.broadphase.sync(self.enemies)
+
+        # Missile-enemy collisions
+        hits = self.broadphase.groupcollide(self.missiles, True, True, self.collided)
+        self.missile_hits += len(hits)
+        for _, enemies_hit in hits.items():
+            for enemy in enemies_hit:
+                # Missile reward
+                if isinstance(enemy, Boss):
+                    self.missiles_remaining += 3
+                    self.boss_kills += 1
+                else:
+                    self.missiles_remaining += 1
+                self.score += 1
+
+                # Explosion
+                self.explosion_pool.acquire(
+                    enemy.rect.centerx, enemy.rect.centery, self.all_sprites
+                )
+                self.events.append("explosion")
+
+                # Milestone sound every 10 points
+                if self.score % 10 == 0:
+                    self.events.append("milestone")
+
+        # Enemy-player collisions
+        hits = self.broadphase.spritecollide(self.player, True, self.collided)
+        for hit in hits:
+            self.heart_remaining -= 1
+            self.explosion_pool.acquire(
+                hit.rect.centerx, hit.rect.centery, self.all_sprites
+            )
+            self.player.blink()
+            self.events.append("explosion")
+
+        # Enemies reaching the bottom
+        for enemy in list(self.enemies):
+            if enemy.reached:
+                self.heart_remaining -= 1
+                enemy.kill()
+
+        # Stress-mode missiles hitting stress-mode enemies
+        if self.swarm is not None:
+            destroyed, _ = self.swarm.collide()
+            if destroyed:
+                self.swarm_kills += destroyed
+                self.events.append("explosion")
+
+    # ---------------- Statistics ----------------
+    def state_hash(self) -> int:
+        """
+        Return a checksum of the world state, used to verify replays.
+
+        Returns:
+            int: CRC32 of counters, every sprite position and, in stress
+            mode, every live array-backed entity.
+        """
+        state = [self.ticks, self.score, self.heart_remaining, self.missiles_remaining]
+        for sprite in self.all_sprites:
+            state.extend(sprite.rect)
+        if self.swarm is not None:
+            alive = self.swarm.alive
+            state.extend((self.swarm_kills, self.swarm_escapes, zlib.crc32(
+                self.swarm.kind[alive].tobytes()
+                + self.swarm.x[alive].tobytes()
+                + self.swarm.y[alive].tobytes()
+            )))
+        return zlib.crc32(repr(state).encode())
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Return usage counters (including high-water marks) for each pool.
+
+        The pools outlive :meth:`reset`, so the counters cover every round
+        played on this simulation.
+
+        Returns:
+            dict[str, dict[str, int]]: Pool statistics keyed by sprite type.
+        """
+        pools = [self.missile_pool, self.explosion_pool, *self.enemy_pools.values()]
+        return {pool.sprite_cls.__name__: pool.stats() for pool in pools}
+
+    def log_pool_report(self) -> None:
+        """Log each pool's high-water mark, size and sprites created so far."""
+        logger.info("sprite pools: %s", ", ".join(
+            f"{name} {stats['high_water']}/{stats['size']} ({stats['created']} created)"
+            for name, stats in self.pool_stats().items()
+        ))
+
+
+# ---------------- Soak run ----------------
+def main() -> None:
+    """Step simulations with random input as fast as possible and report speed."""
+    parser = argparse.ArgumentParser(description="Headless Jet Fighter soak run.")
+    parser.add_argument("--ticks", type=int, default=100_000, help="ticks to simulate")
+    parser.add_argument("--difficulty", default=GameConfig.DIFFICULTY)
+    parser.add_argument("--collision", choices=("rect", "mask"), default=GameConfig.COLLISION)
+    parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible run")
+    parser.add_argument("--tick-rate", type=float, default=GameConfig.TICK_RATE,
+                        help="simulated ticks per second")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    dt = 1 / args.tick_rate
+    sim = Simulation(args.difficulty, seed=rng.getrandbits(32), collision=args.collision)
+    rounds = 1
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        if sim.over:
+            sim.reset(args.difficulty, seed=rng.getrandbits(32), collision=args.collision)
+            rounds += 1
+        sim.step(InputFrame(
+            left=rng.random() < 0.3,
+            right=rng.random() < 0.3,
+            fire=int(rng.random() < 0.05),
+            dt=dt,
+        ))
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.ticks} ticks in {elapsed:.2f}s "
+          f"({args.ticks / elapsed:.0f} ticks/s, {rounds} rounds)")
+
+
+if __name__ == "__main__":
+    main()
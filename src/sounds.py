@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+sounds.py
+
+Preloaded sound bank for Jet Fighter.
+
+This module defines the :class:`SoundBank` registry, which decodes every
+sound effect once, gives each named sound its own bounded pool of reserved
+mixer channels, coalesces repeated triggers within a frame, and counts
+dropped and stolen voices.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Set
+
+import pygame
+
+
+class SoundBank:
+    """
+    Shared registry of named sound effects and their mixer channels.
+
+    Each registered sound owns ``voices`` reserved channels. When all of
+    them are busy, a new trigger either steals the oldest voice or is
+    dropped, depending on the sound's ``steal`` flag. A sound triggered
+    more than once between two :meth:`begin_frame` calls plays only once.
+
+    If the mixer is not initialized or a file cannot be loaded, playing
+    that sound is a silent no-op.
+    """
+
+    # name -> (path, voices, steal)
+    _entries: Dict[str, tuple[str, int, bool]] = {}
+    _decoded: Dict[str, pygame.mixer.Sound] = {}
+    _sounds: Dict[str, pygame.mixer.Sound] = {}
+    _channels: Dict[str, List[pygame.mixer.Channel]] = {}
+    _started: Dict[pygame.mixer.Channel, int] = {}
+    _triggered: Set[str] = set()
+    _next_channel: int = 0
+
+    _stats: Dict[str, Dict[str, int]] = {}
+
+    # ---------------- Registration ----------------
+    @classmethod
+    def register(cls, name: str, path: str, voices: int = 1, steal: bool = True) -> None:
+        """
+        Register a named sound. Registering the same name again is a no-op.
+
+        Args:
+            name (str): Name used to trigger the sound.
+            path (str): Path to the sound file.
+            voices (int): Maximum number of simultaneous voices.
+            steal (bool): Whether a new trigger may cut the oldest voice.
+        """
+        if name in cls._entries:
+            return
+        cls._entries[name] = (path, max(1, voices), steal)
+        cls._stats[name] = {"played": 0, "coalesced": 0, "stolen": 0, "dropped": 0}
+
+    @classmethod
+    def add(cls, path: str, sound: pygame.mixer.Sound) -> None:
+        """
+        Provide a sound decoded elsewhere (e.g. by the preloader) so that
+        :meth:`load` does not decode the file again.
+
+        Args:
+            path (str): Path the sound was decoded from.
+            sound (pygame.mixer.Sound): The decoded sound.
+        """
+        cls._decoded[path] = sound
+
+    @classmethod
+    def load(cls) -> None:
+        """Decode every registered sound and reserve its channels."""
+        if not pygame.mixer.get_init():
+            return
+
+        for name, (path, voices, _) in cls._entries.items():
+            if name in cls._sounds:
+                continue
+            try:
+                sound = cls._decoded.get(path)
+                cls._sounds[name] = sound if sound is not None else pygame.mixer.Sound(path)
+            except (pygame.error, FileNotFoundError):
+                # Missing sound files are ignored gracefully
+                continue
+
+            first = cls._next_channel
+            cls._next_channel += voices
+            if pygame.mixer.get_num_channels() < cls._next_channel:
+                pygame.mixer.set_num_channels(cls._next_channel)
+            pygame.mixer.set_reserved(cls._next_channel)
+            cls._channels[name] = [
+                pygame.mixer.Channel(i) for i in range(first, cls._next_channel)
+            ]
+
+    # ---------------- Playback ----------------
+    @classmethod
+    def begin_frame(cls) -> None:
+        """Start a new frame for trigger coalescing."""
+        cls._triggered.clear()
+
+    @classmethod
+    def play(cls, name: str) -> bool:
+        """
+        Trigger a named sound.
+
+        Args:
+            name (str): Name of a registered sound.
+
+        Returns:
+            bool: True if a voice started playing.
+        """
+        sound = cls._sounds.get(name)
+        if sound is None:
+            return False
+
+        stats = cls._stats[name]
+        if name in cls._triggered:
+            stats["coalesced"] += 1
+            return False
+        cls._triggered.add(name)
+
+        channels = cls._channels[name]
+        channel = next((c for c in channels if not c.get_busy()), None)
+        if channel is None:
+            if not cls._entries[name][2]:
+                stats["dropped"] += 1
+                return False
+            channel = min(channels, key=lambda c: cls._started.get(c, 0))
+            channel.stop()
+            stats["stolen"] += 1
+
+        channel.play(sound)
+        cls._started[channel] = pygame.time.get_ticks()
+        stats["played"] += 1
+        return True
+
+    # ---------------- Statistics ----------------
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, int]]:
+        """
+        Return per-sound playback counters.
+
+        Returns:
+            dict[str, dict[str, int]]: ``played``, ``coalesced``, ``stolen``
+            and ``dropped`` counts for each registered sound.
+        """
+        return {name: dict(counts) for name, counts in cls._stats.items()}
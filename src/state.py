@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+state.py
+
+Base class for the screens of Jet Fighter.
+
+This module defines the :class:`State` class. Every screen (main menu,
+settings, gameplay, game over) is a state that is built once and then
+pushed on and popped off the stack of :class:`src.app.AppContext`, which
+runs the loop of whichever state is on top.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+import pygame
+
+from src.scheduler import LoopScheduler
+
+if TYPE_CHECKING:
+    from src.app import AppContext
+
+
+class State:
+    """
+    A screen driven by the application loop.
+
+    Subclasses override the event, update and draw hooks. ``draw`` draws
+    on the logical canvas and must also present the frame
+    (:meth:`src.viewport.Viewport.present`).
+
+    Attributes:
+        NAME (str): State name used in logs and loop reports.
+        app (AppContext): Shared display, database and state stack.
+        screen (pygame.Surface): The logical canvas to draw on.
+        scheduler (LoopScheduler): Paces this state's frames.
+    """
+
+    NAME: str = "state"
+
+    def __init__(self, app: AppContext, fps: float | None = None) -> None:
+        """
+        Initialize the state.
+
+        Args:
+            app (AppContext): The application context.
+            fps (float | None): Frame rate cap, or None for a static screen
+                that only redraws after input or a change.
+        """
+        self.app: AppContext = app
+        self.scheduler: LoopScheduler = LoopScheduler(
+            self.NAME, fps=fps, idle_timeout=app.idle_timeout
+        )
+
+    @property
+    def screen(self) -> pygame.Surface:
+        """The logical canvas, looked up on every use since rescaling may replace it."""
+        return self.app.screen
+
+    # ---------------- Stack hooks ----------------
+    def enter(self) -> None:
+        """Called when the state becomes the top of the stack."""
+        self.scheduler.start()
+
+    def exit(self) -> None:
+        """Called when the state is covered or removed from the stack."""
+        self.scheduler.log_report()
+
+    # ---------------- Frame hooks ----------------
+    def handle_events(self, events: List[pygame.event.Event]) -> None:
+        """
+        Process the events of one frame.
+
+        Args:
+            events (list[pygame.event.Event]): Events from the scheduler.
+        """
+
+    def update(self) -> None:
+        """Advance the state by one frame."""
+
+    def draw(self) -> None:
+        """Render and present one frame."""
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+viewport.py
+
+Offscreen canvas and window scaling for Jet Fighter.
+
+This module defines the :class:`Viewport` registry. Every screen draws on
+one canvas at the logical resolution (``Screen.WIDTH`` x ``Screen.HEIGHT``);
+:meth:`Viewport.present` scales it once per frame to a window that is a
+multiple of that size, with nearest-neighbour or smooth filtering. At
+scale 1 the canvas is the window itself and presenting costs no copy.
+Mouse positions are mapped back to logical coordinates, so game code never
+sees the window size.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import List, Sequence, Tuple
+
+import pygame
+
+# Events whose ``pos`` is in window coordinates
+MOUSE_EVENTS: Tuple[int, ...] = (
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+)
+
+
+class Viewport:
+    """
+    Shared logical canvas presented to a scaled window.
+
+    Attributes:
+        size (tuple[int, int]): Logical resolution of the canvas.
+        scale (float): Window size as a multiple of the logical size.
+        smooth (bool): Scale with smooth (bilinear) filtering instead of
+            nearest neighbour.
+        window (pygame.Surface | None): The display surface.
+        canvas (pygame.Surface | None): The surface every screen draws on:
+            the window at scale 1, an offscreen surface otherwise. It is
+            replaced when the scale changes, so it should not be kept.
+    """
+
+    size: Tuple[int, int] = (0, 0)
+    scale: float = 1.0
+    smooth: bool = False
+    window: pygame.Surface | None = None
+    canvas: pygame.Surface | None = None
+
+    # ---------------- Setup ----------------
+    @classmethod
+    def open(
+        cls, size: Tuple[int, int], scale: float = 1.0, smooth: bool = False
+    ) -> pygame.Surface:
+        """
+        Open the window and set up the canvas.
+
+        Args:
+            size (tuple[int, int]): Logical resolution.
+            scale (float): Window size as a multiple of ``size``.
+            smooth (bool): Use smooth filtering when scaling.
+
+        Returns:
+            pygame.Surface: The canvas to draw on.
+        """
+        cls.size = size
+        cls.configure(scale, smooth)
+        return cls.canvas
+
+    @classmethod
+    def configure(cls, scale: float, smooth: bool) -> None:
+        """
+        Resize the window for a new scale, carrying the canvas contents over.
+
+        Args:
+            scale (float): Window size as a multiple of the logical size.
+            smooth (bool): Use smooth filtering when scaling.
+        """
+        width, height = cls.size
+        cls.scale = scale
+        cls.smooth = smooth
+        window_size = (round(width * scale), round(height * scale))
+        if cls.window is not None and cls.window.get_size() == window_size:
+            return
+
+        # The window surface is resized in place, so keep its pixels first
+        previous = cls.canvas.copy() if cls.canvas is not None else None
+        cls.window = pygame.display.set_mode(window_size)
+        if window_size == cls.size:
+            cls.canvas = cls.window
+        else:
+            cls.canvas = pygame.Surface(cls.size).convert()
+        if previous is not None:
+            cls.canvas.blit(previous, (0, 0))
+
+    # ---------------- Presenting ----------------
+    @classmethod
+    def present(cls, rects: Sequence[pygame.Rect] | None = None) -> None:
+        """
+        Copy the canvas to the window and show it.
+
+        Args:
+            rects (Sequence[pygame.Rect] | None): Changed canvas regions,
+                or None to show the whole frame.
+        """
+        window, canvas = cls.window, cls.canvas
+        if canvas is window:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            return
+
+        # Smooth scaling needs 24 or 32-bit surfaces
+        if cls.smooth and window.get_bitsize() >= 24:
+            pygame.transform.smoothscale(canvas, window.get_size(), window)
+        else:
+            pygame.transform.scale(canvas, window.get_size(), window)
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update([cls.to_window(rect) for rect in rects])
+
+    # ---------------- Coordinates ----------------
+    @classmethod
+    def to_window(cls, rect: pygame.Rect) -> pygame.Rect:
+        """Return the window region covering a canvas rectangle (with a filter margin)."""
+        sx = cls.window.get_width() / cls.size[0]
+        sy = cls.window.get_height() / cls.size[1]
+        left, top = math.floor(rect.left * sx) - 1, math.floor(rect.top * sy) - 1
+        right, bottom = math.ceil(rect.right * sx) + 1, math.ceil(rect.bottom * sy) + 1
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    @classmethod
+    def to_logical(cls, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """Map a window position to canvas coordinates."""
+        if cls.window is None or cls.window.get_size() == cls.size:
+            return pos
+        return (
+            int(pos[0] * cls.size[0] / cls.window.get_width()),
+            int(pos[1] * cls.size[1] / cls.window.get_height()),
+        )
+
+    @classmethod
+    def mouse_pos(cls) -> Tuple[int, int]:
+        """Return the mouse position in canvas coordinates."""
+        return cls.to_logical(pygame.mouse.get_pos())
+
+    @classmethod
+    def map_events(cls, events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+        """
+        Convert the positions of mouse events to canvas coordinates, in place.
+
+        Args:
+            events (list[pygame.event.Event]): Events of one frame.
+
+        Returns:
+            list[pygame.event.Event]: The same events.
+        """
+        if cls.window is not None and cls.window.get_size() != cls.size:
+            for event in events:
+                if event.type in MOUSE_EVENTS:
+                    event.pos = cls.to_logical(event.pos)
+        return events